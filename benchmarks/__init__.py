@@ -0,0 +1,7 @@
+"""The benchmark suite of JSON Classes. It measures the speed and memory
+allocation of the jsonclass lifecycle without any external service.
+
+Run from the repository root with `python -m benchmarks`. See
+`python -m benchmarks --help` for saving and comparing against the stored
+baseline.
+"""
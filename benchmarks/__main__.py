@@ -0,0 +1,68 @@
+"""The command line interface of the benchmark suite."""
+from __future__ import annotations
+from argparse import ArgumentParser
+from sys import exit
+from fnmatch import fnmatch
+from .cases import CASES
+from .runner import (Result, measure, save_baseline, load_baseline, compare,
+                     BASELINE_PATH)
+
+
+def main() -> int:
+    parser = ArgumentParser(prog='python -m benchmarks',
+                            description='Benchmark the jsonclass lifecycle.')
+    parser.add_argument('patterns', nargs='*',
+                        help='only run cases matching these glob patterns')
+    parser.add_argument('--save', action='store_true',
+                        help=f'store results as the baseline {BASELINE_PATH}')
+    parser.add_argument('--compare', action='store_true',
+                        help='compare results with the stored baseline and '
+                             'fail on significant regressions')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='the tolerated slowdown ratio on comparing, '
+                             'default is 0.25')
+    parser.add_argument('--rounds', type=int, default=5,
+                        help='the number of timed rounds of each case')
+    parser.add_argument('--min-time', type=float, default=0.1,
+                        help='the minimal duration of a round in seconds')
+    parser.add_argument('--list', action='store_true',
+                        help='list cases and exit')
+    args = parser.parse_args()
+    names = [name for name in CASES
+             if not args.patterns
+             or any(fnmatch(name, p) for p in args.patterns)]
+    if args.list:
+        print('\n'.join(names))
+        return 0
+    baseline = load_baseline() if args.compare else {}
+    if args.compare and not baseline:
+        print('no stored baseline, run with --save first')
+        return 2
+    header = f'{"case":<20} {"ops/sec":>12} {"KiB/op":>10} {"blocks/op":>10}'
+    print(header + (f' {"baseline":>12} {"change":>8}' if args.compare else ''))
+    results: list[Result] = []
+    regressed = False
+    for name in names:
+        result = measure(name, CASES[name], args.rounds, args.min_time)
+        results.append(result)
+        line = (f'{name:<20} {result.ops:>12.1f} {result.kib:>10.1f} '
+                f'{result.blocks:>10}')
+        if args.compare:
+            c = compare([result], baseline, args.threshold)[0]
+            if c.baseline is None:
+                line += f' {"-":>12} {"new":>8}'
+            else:
+                line += (f' {c.baseline.ops:>12.1f} '
+                         f'{(c.ratio - 1) * 100:>+7.1f}%')
+                if c.regressed:
+                    line += '  REGRESSED'
+                    regressed = True
+        print(line, flush=True)
+    if args.save:
+        save_baseline(results)
+        print(f'baseline saved to {BASELINE_PATH}')
+    return 1 if regressed else 0
+
+
+if __name__ == '__main__':
+    exit(main())
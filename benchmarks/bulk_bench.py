@@ -0,0 +1,41 @@
+"""Benchmark of initializing objects from JSON arrays of 1k, 10k and 100k
+items, one by one and in a batch with `from_many`.
+
+Run from the repository root with `python -m benchmarks.bulk_bench`.
+"""
+from __future__ import annotations
+from typing import Any, Callable
+from gc import collect
+from time import perf_counter
+from .cases import flat_input, post_inputs
+from .models import BenchFlat, BenchPost
+
+
+SIZES = (1000, 10000, 100000)
+
+
+def timed(fn: Callable[[], Any]) -> float:
+    """Measure the duration of a single call of `fn` in seconds."""
+    collect()
+    start = perf_counter()
+    fn()
+    return perf_counter() - start
+
+
+def main() -> None:
+    print(f'{"case":<12} {"items":>8} {"loop us/item":>14} '
+          f'{"bulk us/item":>14} {"speedup":>8}')
+    for size in SIZES:
+        flat = [flat_input(i) for i in range(size)]
+        posts = post_inputs(size, 100)
+        for name, cls, inputs in (('flat', BenchFlat, flat),
+                                  ('shared', BenchPost, posts)):
+            loop = timed(lambda: [cls(**input) for input in inputs])
+            bulk = timed(lambda: cls.from_many(inputs))
+            print(f'{name:<12} {size:>8} {loop / size * 1e6:>14.1f} '
+                  f'{bulk / size * 1e6:>14.1f} {loop / bulk:>7.2f}x',
+                  flush=True)
+
+
+if __name__ == '__main__':
+    main()
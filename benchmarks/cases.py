@@ -0,0 +1,394 @@
+"""This module defines the benchmark cases. A case is a function which
+prepares its fixtures and returns the operation to measure.
+"""
+from __future__ import annotations
+from typing import Any, Callable
+from itertools import count, cycle
+from dataclasses import dataclass
+from io import StringIO
+from json import dumps, loads
+from jsonclasses import (jsonclass, types, IdentityMap, JSONEncoder,
+                         JSONWriter)
+from jsonclasses.ograph import OGraph
+from .models import (BenchFlat, BenchSlotFlat, BenchWide, BenchAuthor,
+                     BenchPost, BenchComment, BenchTag)
+
+
+Operation = Callable[[], Any]
+"""A single benchmarked operation."""
+
+Case = Callable[[], Operation]
+"""A benchmark case which returns its operation."""
+
+CASES: dict[str, Case] = {}
+"""The registered benchmark cases in running order."""
+
+
+def case(name: str) -> Callable[[Case], Case]:
+    """Register a benchmark case with `name`."""
+    def register(fn: Case) -> Case:
+        CASES[name] = fn
+        return fn
+    return register
+
+
+def flat_input(i: int = 1) -> dict[str, Any]:
+    return {'id': i, 'name': '  John  ', 'email': 'JOHN@EXAMPLE.COM',
+            'age': 30, 'score': 99.5}
+
+
+def wide_input(i: int = 1) -> dict[str, Any]:
+    input: dict[str, Any] = {'id': i, 'tags': ['a', 'b', 'c'],
+                             'meta': {'a': 'b', 'c': 'd'},
+                             'status': 'PUBLISHED'}
+    for n in range(10):
+        input[f's{n}'] = f'value {n}'
+        input[f'i{n}'] = n
+    for n in range(5):
+        input[f'f{n}'] = n + 0.5
+    return input
+
+
+def nested_input(posts: int = 10, comments: int = 5) -> dict[str, Any]:
+    ids = count(1)
+    return {'id': next(ids), 'name': 'John', 'posts': [
+        {'id': next(ids), 'title': f'Post {p}', 'body': 'Body',
+         'comments': [{'id': next(ids), 'content': f'Comment {c}'}
+                      for c in range(comments)]}
+        for p in range(posts)]}
+
+
+@case('define_class')
+def define_class() -> Operation:
+    graphs = count()
+
+    def op() -> None:
+        @jsonclass(class_graph=f'benchmarks_define_{next(graphs)}')
+        class Defined:
+            id: str = types.readonly.str.primary.mongoid.required
+            name: str = types.str.trim.minlength(2).maxlength(50).required
+            email: str = types.str.trim.tolower.email.unique.required
+            age: int = types.int.min(0).max(200).default(0).required
+            tags: list[str] = types.nonnull.listof(types.str.maxlength(20))
+    return op
+
+
+@case('init_flat')
+def init_flat() -> Operation:
+    input = flat_input()
+    return lambda: BenchFlat(**input)
+
+
+@case('init_flat_slots')
+def init_flat_slots() -> Operation:
+    input = flat_input()
+    return lambda: BenchSlotFlat(**input)
+
+
+@case('init_wide')
+def init_wide() -> Operation:
+    input = wide_input()
+    return lambda: BenchWide(**input)
+
+
+@case('init_nested')
+def init_nested() -> Operation:
+    input = nested_input()
+    return lambda: BenchAuthor(**input)
+
+
+def post_inputs(n: int, authors: int = 0) -> list[dict[str, Any]]:
+    """Inputs of `n` posts. Posts share `authors` authors if it's not 0."""
+    inputs: list[dict[str, Any]] = []
+    for i in range(n):
+        input: dict[str, Any] = {'id': i, 'title': f'Post {i}',
+                                 'body': 'Body'}
+        if authors:
+            input['author'] = {'id': i % authors, 'name': 'John'}
+        inputs.append(input)
+    return inputs
+
+
+@case('init_many')
+def init_many() -> Operation:
+    inputs = [flat_input(i) for i in range(1000)]
+    return lambda: [BenchFlat(**input) for input in inputs]
+
+
+@case('init_nested_session')
+def init_nested_session() -> Operation:
+    input = nested_input()
+
+    def op() -> None:
+        with IdentityMap():
+            BenchAuthor(**input)
+    return op
+
+
+@case('from_many')
+def from_many() -> Operation:
+    inputs = [flat_input(i) for i in range(1000)]
+    return lambda: BenchFlat.from_many(inputs)
+
+
+@case('from_many_shared')
+def from_many_shared() -> Operation:
+    inputs = post_inputs(1000, 10)
+    return lambda: BenchPost.from_many(inputs)
+
+
+@case('loads_dump')
+def loads_dump() -> Operation:
+    text = dumps([flat_input(i) for i in range(1000)])
+    return lambda: [BenchFlat(**record).validate() for record in loads(text)]
+
+
+@case('ingest_dump')
+def ingest_dump() -> Operation:
+    text = dumps([flat_input(i) for i in range(1000)])
+
+    def op() -> None:
+        for _ in BenchFlat.ingest(StringIO(text), batch_size=100):
+            pass
+    return op
+
+
+@case('set_flat')
+def set_flat() -> Operation:
+    obj = BenchFlat(**flat_input())
+    return lambda: obj.set(name='Jack', age=31)
+
+
+def unvalidated(obj: Any) -> Operation:
+    """Validate `obj` as if it's never validated."""
+    def op() -> None:
+        setattr(obj, '_vgraph', None)
+        obj.validate()
+    return op
+
+
+@case('validate_new')
+def validate_new() -> Operation:
+    obj = BenchWide(**wide_input())
+    return unvalidated(obj)
+
+
+@case('validate_modified')
+def validate_modified() -> Operation:
+    obj = BenchWide(**wide_input())
+    setattr(obj, '_is_new', False)
+    obj._mark_unmodified()
+    obj.s0 = 'modified'
+    return unvalidated(obj)
+
+
+@case('validate_clean')
+def validate_clean() -> Operation:
+    obj = BenchWide(**wide_input())
+    obj.validate()
+    return lambda: obj.is_valid
+
+
+@case('validate_graph_dirty')
+def validate_graph_dirty() -> Operation:
+    obj = BenchAuthor(**nested_input(posts=500, comments=2))
+    obj._mark_unmodified()
+    for post in obj.posts:
+        post._mark_unmodified()
+    names = cycle(['John', 'Jane'])
+
+    def op() -> None:
+        obj.name = next(names)
+        obj.validate()
+    return op
+
+
+@case('tojson_nested')
+def tojson_nested() -> Operation:
+    obj = BenchAuthor(**nested_input())
+    return obj.tojson
+
+
+@case('tojson_nested_rr')
+def tojson_nested_rr() -> Operation:
+    obj = BenchAuthor(**nested_input())
+    return lambda: obj.tojson(reverse_relationship=True)
+
+
+@case('tojson_loop')
+def tojson_loop() -> Operation:
+    objs = BenchPost.from_many(post_inputs(1000, 10))
+    return lambda: [obj.tojson() for obj in objs]
+
+
+@case('tojson_many')
+def tojson_many() -> Operation:
+    objs = BenchPost.from_many(post_inputs(1000, 10))
+    return lambda: BenchPost.tojson_many(objs)
+
+
+class Sink:
+    """A text stream which discards written text."""
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+
+@case('dumps_export')
+def dumps_export() -> Operation:
+    objs = [BenchAuthor(**nested_input()) for _ in range(20)]
+    sink = Sink()
+    return lambda: sink.write(dumps(objs, cls=JSONEncoder))
+
+
+@case('write_export')
+def write_export() -> Operation:
+    objs = [BenchAuthor(**nested_input()) for _ in range(20)]
+    sink = Sink()
+    return lambda: JSONWriter(sink).write(objs)
+
+
+@case('link_graph')
+def link_graph() -> Operation:
+    def op() -> None:
+        author = BenchAuthor(id=1, name='John')
+        tags = [BenchTag(id=100 + t, name=f'Tag {t}') for t in range(3)]
+        for p in range(5):
+            post = BenchPost(id=10 + p, title='Post', body='Body')
+            post.author = author
+            post.tags.extend(tags)
+            post.comments.append(BenchComment(id=1000 + p, content='C'))
+    return op
+
+
+@case('merge_graphs')
+def merge_graphs() -> Operation:
+    tags = [BenchTag(id=t, name=f'Tag {t}') for t in range(1000)]
+
+    def op() -> None:
+        graphs = [OGraph(tag) for tag in tags]
+        graph = graphs[0]
+        for other in graphs[1:]:
+            graph = graph.merged_graph(other)
+    return op
+
+
+@case('olist_mutation')
+def olist_mutation() -> Operation:
+    author = BenchAuthor(id=1, name='John')
+    posts = [BenchPost(id=10 + p, title='Post', body='Body')
+             for p in range(10)]
+
+    def op() -> None:
+        for post in posts:
+            author.posts.append(post)
+        for post in posts:
+            author.posts.remove(post)
+    return op
+
+
+@case('save_noop')
+def save_noop() -> Operation:
+    obj = BenchWide(**wide_input())
+
+    def op() -> None:
+        obj.s0 = 'modified'
+        obj.save()
+    return op
+
+
+@case('save_graph')
+def save_graph() -> Operation:
+    author = BenchAuthor(**nested_input())
+    titles = cycle(['Post', 'Title'])
+
+    def op() -> None:
+        title = next(titles)
+        for post in author.posts:
+            post.title = title
+        author.save()
+    return op
+
+
+def modified_flats(n: int) -> Callable[[], list[BenchFlat]]:
+    objs = [BenchFlat(**flat_input(i)) for i in range(n)]
+    names = cycle(['John', 'Jane'])
+
+    def modify() -> list[BenchFlat]:
+        name = next(names)
+        for obj in objs:
+            obj.name = name
+        return objs
+    return modify
+
+
+@case('save_loop')
+def save_loop() -> Operation:
+    modify = modified_flats(100)
+
+    def op() -> None:
+        for obj in modify():
+            obj.save()
+    return op
+
+
+@case('save_many')
+def save_many() -> Operation:
+    modify = modified_flats(100)
+    return lambda: BenchFlat.save_many(modify())
+
+
+@dataclass
+class PlainFlat:
+    id: int
+    name: str
+    email: str
+    age: int
+    score: float
+
+
+def read_fields(obj: Any) -> Operation:
+    def op() -> None:
+        for _ in range(100):
+            obj.id
+            obj.name
+            obj.email
+            obj.age
+            obj.score
+    return op
+
+
+@case('getattr_dataclass')
+def getattr_dataclass() -> Operation:
+    return read_fields(PlainFlat(id=1, name='John', email='john@example.com',
+                                 age=30, score=99.5))
+
+
+@case('getattr_field')
+def getattr_field() -> Operation:
+    return read_fields(BenchFlat(**flat_input()))
+
+
+@case('getattr_private')
+def getattr_private() -> Operation:
+    obj = BenchFlat(**flat_input())
+
+    def op() -> None:
+        for _ in range(100):
+            obj._is_new
+            obj._is_modified
+            obj._modified_fields
+            obj._previous_values
+            obj._graph
+    return op
+
+
+@case('setattr_field')
+def setattr_field() -> Operation:
+    obj = BenchFlat(**flat_input())
+
+    def op() -> None:
+        for i in range(100):
+            obj.age = i
+            obj.name = 'Jack' if i % 2 else 'John'
+    return op
@@ -0,0 +1,57 @@
+"""Microbenchmark of the per field cost of JSON class contexts.
+
+Run from the repository root with `python -m benchmarks.ctx_bench`.
+"""
+from __future__ import annotations
+from timeit import repeat
+from jsonclasses import jsonclass, types
+from jsonclasses.ctx import Ctx, CtxCfg
+
+
+@jsonclass(class_graph='ctx_bench')
+class BenchUser:
+    name: str = types.str.trim.minlength(2).maxlength(50).required
+    email: str = types.str.trim.tolower.email.required
+    age: int = types.int.min(0).max(200).required
+    score: float = types.float.min(0).max(100).default(0.0).required
+
+
+NUMBER = 20000
+REPEAT = 5
+MODIFIERS = 8
+
+
+def swap_values() -> None:
+    """Swap the context value once per modifier of a field."""
+    user = BenchUser(name='John', email='john@example.com', age=30)
+    fdef = BenchUser.cdef.field_named('name').fdef
+    ctx = Ctx.rootctx(user, CtxCfg()).nextv('John', 'name', fdef)
+    for _ in range(NUMBER):
+        for _ in range(MODIFIERS):
+            ctx = ctx.nval('John')
+
+
+def next_fields() -> None:
+    """Descend into a field of an object."""
+    user = BenchUser(name='John', email='john@example.com', age=30)
+    fdef = BenchUser.cdef.field_named('name').fdef
+    ctx = Ctx.rootctx(user, CtxCfg())
+    for _ in range(NUMBER):
+        ctx.nextv('John', 'name', fdef)
+
+
+def validate_objects() -> None:
+    """Validate a small object, every field runs its modifier chain."""
+    user = BenchUser(name='John', email='john@example.com', age=30)
+    for _ in range(NUMBER // 10):
+        user.validate()
+
+
+def main() -> None:
+    for bench in (swap_values, next_fields, validate_objects):
+        best = min(repeat(bench, number=1, repeat=REPEAT))
+        print(f'{bench.__name__:<20} {best * 1000:8.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""Benchmark of defining a large synthetic schema, which is what importing
+an application's models costs.
+
+Run from the repository root with `python -m benchmarks.import_bench`.
+"""
+from __future__ import annotations
+from enum import Enum
+from timeit import repeat
+from jsonclasses import jsonclass, types
+
+
+CLASSES = 400
+REPEAT = 3
+
+
+class Status(Enum):
+    ACTIVE = 'active'
+    INACTIVE = 'inactive'
+
+
+def define_schema(graph: str) -> None:
+    """Define `CLASSES` linked classes in a fresh class graph."""
+    for i in range(CLASSES):
+        namespace = {
+            '__annotations__': {
+                'id': str, 'name': str, 'email': str, 'age': int,
+                'score': float, 'tags': list[str], 'status': Status,
+                'meta': dict[str, str], 'parent': f'Model{graph}{i - 1}',
+                'children': f'list[Model{graph}{i + 1}]'
+            },
+            'id': types.readonly.str.primary.mongoid.required,
+            'name': types.str.trim.minlength(2).maxlength(50).index.required,
+            'email': types.str.trim.tolower.email.unique.required,
+            'age': types.int.min(0).max(200).default(0).required,
+            'score': types.float.min(0).max(100).writeonly,
+            'tags': types.nonnull.listof(types.str.trim.maxlength(20)),
+            'status': types.enum(Status).default(Status.ACTIVE).required,
+            'meta': types.dictof(types.str.maxlength(100)),
+            'parent': types.objof(f'Model{graph}{i - 1}').linkto,
+            'children': types.listof(f'Model{graph}{i + 1}')
+                             .linkedby('parent'),
+        }
+        cls = type(f'Model{graph}{i}', (), namespace)
+        jsonclass(class_graph=f'import_bench_{graph}')(cls)
+
+
+def main() -> None:
+    counter = iter(range(REPEAT))
+    best = min(repeat(lambda: define_schema(str(next(counter))),
+                      number=1, repeat=REPEAT))
+    print(f'{"define_schema":<20} {best * 1000:8.2f} ms ({CLASSES} classes)')
+
+
+if __name__ == '__main__':
+    main()
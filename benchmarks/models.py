@@ -0,0 +1,99 @@
+"""This module defines the JSON classes which are benchmarked."""
+from __future__ import annotations
+from typing import Optional
+from datetime import datetime
+from enum import Enum
+from jsonclasses import jsonclass, types
+
+
+class BenchStatus(Enum):
+    DRAFT = 'draft'
+    PUBLISHED = 'published'
+
+
+@jsonclass(class_graph='benchmarks')
+class BenchFlat:
+    id: int = types.int.primary.required
+    name: str = types.str.trim.minlength(2).maxlength(50).required
+    email: str = types.str.trim.tolower.email.required
+    age: int = types.int.min(0).max(200).required
+    score: float = types.float.min(0).max(100).default(0.0).required
+
+
+@jsonclass(class_graph='benchmarks', slots=True)
+class BenchSlotFlat:
+    id: int = types.int.primary.required
+    name: str = types.str.trim.minlength(2).maxlength(50).required
+    email: str = types.str.trim.tolower.email.required
+    age: int = types.int.min(0).max(200).required
+    score: float = types.float.min(0).max(100).default(0.0).required
+
+
+@jsonclass(class_graph='benchmarks')
+class BenchWide:
+    id: int = types.int.primary.required
+    s0: str = types.str.maxlength(50).required
+    s1: str = types.str.maxlength(50).required
+    s2: str = types.str.maxlength(50).required
+    s3: str = types.str.maxlength(50).required
+    s4: str = types.str.maxlength(50).required
+    s5: str = types.str.maxlength(50).required
+    s6: str = types.str.maxlength(50).required
+    s7: str = types.str.maxlength(50).required
+    s8: str = types.str.maxlength(50).required
+    s9: str = types.str.maxlength(50).required
+    i0: int = types.int.min(0).required
+    i1: int = types.int.min(0).required
+    i2: int = types.int.min(0).required
+    i3: int = types.int.min(0).required
+    i4: int = types.int.min(0).required
+    i5: int = types.int.min(0).required
+    i6: int = types.int.min(0).required
+    i7: int = types.int.min(0).required
+    i8: int = types.int.min(0).required
+    i9: int = types.int.min(0).required
+    f0: float = types.float.required
+    f1: float = types.float.required
+    f2: float = types.float.required
+    f3: float = types.float.required
+    f4: float = types.float.required
+    tags: list[str] = types.nonnull.listof(str)
+    meta: dict[str, str] = types.dictof(str)
+    status: BenchStatus = types.enum(BenchStatus).default(BenchStatus.DRAFT)
+    created_at: datetime = types.datetime.tscreated.required
+    updated_at: datetime = types.datetime.tsupdated.required
+
+
+@jsonclass(class_graph='benchmarks')
+class BenchAuthor:
+    id: int = types.int.primary.required
+    name: str = types.str.required
+    posts: list[BenchPost] = types.nonnull.listof('BenchPost') \
+                                  .linkedby('author')
+
+
+@jsonclass(class_graph='benchmarks')
+class BenchPost:
+    id: int = types.int.primary.required
+    title: str = types.str.maxlength(100).required
+    body: str = types.str.required
+    author: Optional[BenchAuthor] = types.objof('BenchAuthor').linkto
+    comments: list[BenchComment] = types.nonnull.listof('BenchComment') \
+                                        .linkedby('post')
+    tags: list[BenchTag] = types.nonnull.listof('BenchTag') \
+                                .linkedthru('posts')
+
+
+@jsonclass(class_graph='benchmarks')
+class BenchComment:
+    id: int = types.int.primary.required
+    content: str = types.str.required
+    post: Optional[BenchPost] = types.objof('BenchPost').linkto
+
+
+@jsonclass(class_graph='benchmarks')
+class BenchTag:
+    id: int = types.int.primary.required
+    name: str = types.str.required
+    posts: list[BenchPost] = types.nonnull.listof('BenchPost') \
+                                  .linkedthru('tags')
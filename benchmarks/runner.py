@@ -0,0 +1,149 @@
+"""This module measures benchmark cases and compares results with a stored
+baseline.
+"""
+from __future__ import annotations
+from typing import NamedTuple, Optional
+from time import perf_counter
+from json import dump, load
+from pathlib import Path
+from platform import python_version
+from gc import collect
+import tracemalloc
+from .cases import Case, Operation
+
+
+BASELINE_PATH = Path(__file__).parent / 'baseline.json'
+"""The path of the stored baseline."""
+
+
+class Result(NamedTuple):
+    """The measured result of a benchmark case."""
+
+    name: str
+    """The name of the case."""
+
+    ops: float
+    """Operations per second, the best of all rounds."""
+
+    kib: float
+    """The peak memory allocated by a single operation in KiB."""
+
+    blocks: int
+    """The number of memory blocks allocated and not freed by a single
+    operation."""
+
+
+class Comparison(NamedTuple):
+    """The comparison of a result with its baseline."""
+
+    result: Result
+    """The current result."""
+
+    baseline: Optional[Result]
+    """The baseline result, None if the case is new."""
+
+    ratio: Optional[float]
+    """The ratio of current speed to baseline speed."""
+
+    regressed: bool
+    """Whether the case is significantly slower than its baseline."""
+
+
+def _calibrate(op: Operation, min_time: float) -> int:
+    number = 1
+    while True:
+        start = perf_counter()
+        for _ in range(number):
+            op()
+        if perf_counter() - start >= min_time:
+            return number
+        number *= 2
+
+
+def _allocations(op: Operation) -> tuple[float, int]:
+    collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        start, _ = tracemalloc.get_traced_memory()
+        op()
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    stats = after.compare_to(before, 'lineno')
+    blocks = sum(max(stat.count_diff, 0) for stat in stats)
+    return (peak - start) / 1024, blocks
+
+
+def measure(name: str, case: Case, rounds: int = 5,
+            min_time: float = 0.1) -> Result:
+    """Measure a benchmark case.
+
+    Args:
+        name (str): The name of the case.
+        case (Case): The case to measure.
+        rounds (int): The number of timed rounds, the best round is taken.
+        min_time (float): The minimal duration of a round in seconds.
+
+    Returns:
+        Result: The measured result.
+    """
+    op = case()
+    op()
+    number = _calibrate(op, min_time)
+    best = float('inf')
+    for _ in range(rounds):
+        start = perf_counter()
+        for _ in range(number):
+            op()
+        best = min(best, (perf_counter() - start) / number)
+    kib, blocks = _allocations(op)
+    return Result(name=name, ops=1 / best, kib=kib, blocks=blocks)
+
+
+def save_baseline(results: list[Result],
+                  path: Path = BASELINE_PATH) -> None:
+    """Store results as the baseline. Cases which are not measured this time
+    keep their stored baseline.
+    """
+    baseline = load_baseline(path)
+    baseline.update({r.name: r for r in results})
+    with open(path, 'w') as file:
+        dump({'python': python_version(),
+              'cases': {name: {'ops': round(r.ops, 2),
+                               'kib': round(r.kib, 2),
+                               'blocks': r.blocks}
+                        for name, r in baseline.items()}},
+             file, indent=2)
+        file.write('\n')
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> dict[str, Result]:
+    """Load the stored baseline. If there isn't one, empty dict is returned.
+    """
+    if not path.exists():
+        return {}
+    with open(path) as file:
+        data = load(file)
+    return {name: Result(name=name, ops=item['ops'], kib=item['kib'],
+                         blocks=item['blocks'])
+            for name, item in data['cases'].items()}
+
+
+def compare(results: list[Result], baseline: dict[str, Result],
+            threshold: float) -> list[Comparison]:
+    """Compare results with the baseline. A case regresses if its speed is
+    lower than the baseline speed by more than `threshold`.
+    """
+    comparisons: list[Comparison] = []
+    for result in results:
+        base = baseline.get(result.name)
+        if base is None:
+            comparisons.append(Comparison(result, None, None, False))
+            continue
+        ratio = result.ops / base.ops
+        comparisons.append(Comparison(result, base, ratio,
+                                      ratio < 1 - threshold))
+    return comparisons
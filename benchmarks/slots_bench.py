@@ -0,0 +1,38 @@
+"""Benchmark of the memory footprint of a single object which is held in a
+cache, with and without slotted storage.
+
+Run from the repository root with `python -m benchmarks.slots_bench`.
+"""
+from __future__ import annotations
+from gc import collect
+import tracemalloc
+from .cases import flat_input
+from .models import BenchFlat, BenchSlotFlat
+
+
+OBJECTS = 10000
+
+
+def footprint(cls: type) -> float:
+    """Measure the retained bytes of a single object of `cls`."""
+    inputs = [flat_input(i) for i in range(OBJECTS)]
+    collect()
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        objects = [cls(**input) for input in inputs]
+        collect()
+        end, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del objects
+    return (end - start) / OBJECTS
+
+
+def main() -> None:
+    for cls in (BenchFlat, BenchSlotFlat):
+        print(f'{cls.__name__:<20} {footprint(cls):8.1f} bytes/object')
+
+
+if __name__ == '__main__':
+    main()
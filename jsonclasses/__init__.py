@@ -15,4 +15,6 @@ from .jsonenum import jsonenum
 from .types import types
 from .typing import linkto, linkedby, linkedthru
 from .json_encoder import JSONEncoder
+from .json_writer import JSONWriter
+from .identity_map import IdentityMap, current_identity_map
 from .isjsonclass import isjsonclass, isjsonobject
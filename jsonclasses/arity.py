@@ -0,0 +1,65 @@
+"""This module defines utilities for calling user callables with the number
+of arguments they accept. Parameter counts are inspected once per callable
+and cached, thus calling user callables doesn't inspect signatures each time.
+"""
+from __future__ import annotations
+from typing import Any, Callable, Optional
+from inspect import signature, ismethod
+from weakref import WeakKeyDictionary
+
+
+_param_counts: WeakKeyDictionary[Callable, int] = WeakKeyDictionary()
+_method_param_counts: WeakKeyDictionary[Callable, int] = WeakKeyDictionary()
+
+
+def param_count(fn: Callable) -> int:
+    """Get the number of parameters of a callable. The result is cached
+    weakly by the callable, bound methods are cached by their functions.
+
+    Args:
+        fn (Callable): The callable to inspect.
+
+    Returns:
+        int: The number of parameters.
+    """
+    if ismethod(fn):
+        cache, key = _method_param_counts, fn.__func__
+    else:
+        cache, key = _param_counts, fn
+    try:
+        return cache[key]
+    except KeyError:
+        count = len(signature(fn).parameters)
+        cache[key] = count
+        return count
+    except TypeError:
+        return len(signature(fn).parameters)
+
+
+def adapt(fn: Callable,
+          layouts: Optional[dict[int, tuple[int, ...]]] = None
+          ) -> Callable[..., Any]:
+    """Adapt a user callable into an invoker. The invoker accepts all the
+    arguments a call site provides and calls `fn` with the leading arguments
+    it accepts.
+
+    Args:
+        fn (Callable): The user callable.
+        layouts (Optional[dict[int, tuple[int, ...]]]): The indexes of \
+            arguments to pass by parameter count. This is only required if \
+            arguments are not taken from the beginning.
+
+    Returns:
+        Callable[..., Any]: The invoker.
+    """
+    count = param_count(fn)
+    if layouts is not None and count in layouts:
+        indexes = layouts[count]
+        return lambda *args: fn(*[args[i] for i in indexes])
+    if count == 0:
+        return lambda *args: fn()
+    if count == 1:
+        return lambda *args: fn(args[0])
+    if count == 2:
+        return lambda *args: fn(args[0], args[1])
+    return lambda *args: fn(*args[:count])
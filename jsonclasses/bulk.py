@@ -0,0 +1,169 @@
+"""This module defines bulk saving and deleting. Permission checks, callbacks
+and validation run for every object of a batch, then objects are written or
+deleted through the bulk hooks of the ORM integration if it defines them.
+Objects which fail are reported per item instead of aborting the batch.
+"""
+from __future__ import annotations
+from typing import Any, Callable, Iterable, NamedTuple, Optional, TYPE_CHECKING
+from .mgraph import MGraph
+from .orm_object import ORMObject
+if TYPE_CHECKING:
+    from .jobject import JObject
+
+
+class BulkError(NamedTuple):
+    """An object which is not saved or deleted.
+    """
+
+    index: int
+    """The index of the object in the batch."""
+
+    object: Any
+    """The object."""
+
+    exception: Exception
+    """The exception of checking, validating, writing or deleting the
+    object."""
+
+
+class BulkResult(NamedTuple):
+    """The result of a bulk operation.
+    """
+
+    objects: list[Any]
+    """The objects which are saved or deleted, in batch order."""
+
+    errors: list[BulkError]
+    """The objects which are not saved or deleted, in batch order."""
+
+
+def _bulk_hook(cls: type, name: str) -> Optional[Callable]:
+    """Get a bulk hook which the class defines. The declaration of the hook
+    on `ORMObject` doesn't count.
+    """
+    hook = getattr(cls, name, None)
+    if hook is None:
+        return None
+    declared = getattr(ORMObject, name)
+    if getattr(hook, '__func__', hook) is getattr(declared, '__func__', None):
+        return None
+    return hook
+
+
+def save_many(cls: type[JObject],
+              objects: Iterable[JObject],
+              validate_all_fields: bool = False,
+              skip_validation: bool = False) -> BulkResult:
+    """Save objects into database in a batch. Each object is saved like it's
+    saved with `save`, and objects reachable from several objects are
+    written once.
+
+    If the class defines the `_orm_write_many` class method, objects of the
+    whole batch are written with a single call, and a failed call fails each
+    object it writes. Otherwise objects are written with `_database_write_many`
+    object by object.
+
+    Args:
+        objects (Iterable[JObject]): The objects to save.
+        validate_all_fields (bool): Whether collect all validation error \
+            messages of an object.
+        skip_validation (bool): Whether skip validating the objects.
+
+    Returns:
+        BulkResult: The saved objects and the errors of objects which are \
+            not saved.
+    """
+    errors: list[BulkError] = []
+    prepared: list[tuple[int, JObject, list[JObject], list[JObject]]] = []
+    for index, object in enumerate(objects):
+        try:
+            roots, plan = object._prepare_save(validate_all_fields,
+                                               skip_validation)
+        except Exception as e:
+            errors.append(BulkError(index, object, e))
+            continue
+        prepared.append((index, object, roots, plan))
+    mgraph = MGraph()
+    for _, _, roots, _ in prepared:
+        for root in roots:
+            root._set_on_save(mgraph)
+    saved: list[tuple[int, JObject, list[JObject]]] = []
+    write_many = _bulk_hook(cls, '_orm_write_many')
+    if write_many is not None and prepared:
+        batch: dict[int, JObject] = {}
+        for _, _, _, plan in prepared:
+            for item in plan:
+                batch.setdefault(id(item), item)
+        try:
+            write_many(list(batch.values()))
+        except Exception as e:
+            errors.extend(BulkError(index, object, e)
+                          for index, object, _, _ in prepared)
+        else:
+            saved = [(index, object, plan)
+                     for index, object, _, plan in prepared]
+    else:
+        written: set[int] = set()
+        for index, object, roots, plan in prepared:
+            plan = [item for item in plan if id(item) not in written]
+            try:
+                object._database_write_many(plan, roots)
+            except Exception as e:
+                errors.append(BulkError(index, object, e))
+                continue
+            written.update(id(item) for item in plan)
+            saved.append((index, object, plan))
+    for _, _, plan in saved:
+        for item in plan:
+            for lst in item.unlinked_objects.values():
+                lst.clear()
+    errors.sort(key=lambda error: error.index)
+    return BulkResult([object for _, object, _ in saved], errors)
+
+
+def delete_many(cls: type[JObject],
+                objects: Iterable[JObject]) -> BulkResult:
+    """Delete objects from database in a batch. Each object is deleted like
+    it's deleted with `delete`.
+
+    If the class defines the `_orm_delete_many` class method, objects are
+    deleted with a single call, and a failed call fails each object.
+    Otherwise objects are deleted with `_orm_delete` one by one.
+
+    Args:
+        objects (Iterable[JObject]): The objects to delete.
+
+    Returns:
+        BulkResult: The deleted objects and the errors of objects which are \
+            not deleted.
+    """
+    errors: list[BulkError] = []
+    prepared: list[tuple[int, JObject]] = []
+    for index, object in enumerate(objects):
+        try:
+            object._can_delete_check()
+            object._run_on_delete_callbacks()
+        except Exception as e:
+            errors.append(BulkError(index, object, e))
+            continue
+        prepared.append((index, object))
+    deleted: list[tuple[int, JObject]] = []
+    delete_many = _bulk_hook(cls, '_orm_delete_many')
+    if delete_many is not None and prepared:
+        try:
+            delete_many([object for _, object in prepared])
+        except Exception as e:
+            errors.extend(BulkError(index, object, e)
+                          for index, object in prepared)
+        else:
+            deleted = prepared
+    else:
+        for index, object in prepared:
+            try:
+                object._orm_delete()
+            except Exception as e:
+                errors.append(BulkError(index, object, e))
+                continue
+            deleted.append((index, object))
+    errors.sort(key=lambda error: error.index)
+    return BulkResult([object for _, object in deleted], errors)
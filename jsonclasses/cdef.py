@@ -11,8 +11,15 @@ from dataclasses import fields as dataclass_fields
 from .jfield import JField
 from .fdef import FStore, DeleteRule, FType
 from .rtypes import rtypes, rnamedtypes
+from .excs import (UnresolvedTypeNameException, JSONClassNotFoundException,
+                   JSONClassTypedDictNotFoundException)
 if TYPE_CHECKING:
     from .jconf import JConf
+    from .tplan import TPlan
+    from .oplan import OPlan
+    from .ctx import CtxCfg
+    from .types import Types
+    from .fdef import Fdef
 
 
 @final
@@ -60,6 +67,13 @@ class Cdef:
         self._assign_operator_fields: list[JField] = []
         self._auth_identity_fields: list[JField] = []
         self._auth_by_fields: list[JField] = []
+        self._tplan: Optional[TPlan] = None
+        self._oplans: dict[CtxCfg, OPlan] = {}
+        self._root_types: Optional[Types] = None
+        self._calc_field_map: dict[str, JField] = {}
+        self._local_key_fields: Optional[dict[str, JField]] = None
+        self._blank_plan: Optional[tuple[list[str], list[JField]]] = None
+        self._ref_fields: Optional[list[JField]] = None
         for field in dataclass_fields(cls):
             name = field.name
             self._field_names.append(name)
@@ -81,6 +95,7 @@ class Cdef:
                 self._primary_field = jfield
             if types.fdef._fstore == FStore.CALCULATED:
                 self._calc_fields.append(jfield)
+                self._calc_field_map[name] = jfield
             if types.fdef._setter is not None:
                 self._setter_fields.append(jfield)
             if types.fdef._delete_rule == DeleteRule.DENY:
@@ -116,25 +131,27 @@ class Cdef:
                 jfield._types = rnamedtypes(jfield.types, cgraph, self.name)
 
     def _resolve_ref_names(self: Cdef) -> None:
+        rkes = self.jconf.ref_key_encoding_strategy
+        jkes = self.jconf.key_encoder
         for jfield in self._tuple_fields:
-            if jfield.types.fdef._fstore == FStore.LOCAL_KEY:
-                ref_key_encoding_strategy = self.jconf.ref_key_encoding_strategy
+            fstore = jfield.types.fdef._fstore
+            if fstore != FStore.LOCAL_KEY and fstore != FStore.FOREIGN_KEY:
+                continue
+            rk = rkes(jfield)
+            jrk = jkes(rk)
+            jfield._ref_key = rk
+            jfield._json_ref_key = jrk
+            if fstore == FStore.LOCAL_KEY:
                 if jfield.fdef.ftype == FType.INSTANCE:
-                    self._reference_names.append(ref_key_encoding_strategy(jfield))
-                    self._camelized_reference_names.append(
-                        self.jconf.key_encoding_strategy(ref_key_encoding_strategy(jfield)))
+                    self._reference_names.append(rk)
+                    self._camelized_reference_names.append(jrk)
                 elif jfield.fdef.ftype == FType.LIST:
-                    self._list_reference_names.append(ref_key_encoding_strategy(jfield))
-                    self._camelized_list_reference_names.append(
-                        self.jconf.key_encoding_strategy(ref_key_encoding_strategy(jfield)))
-            elif jfield.types.fdef._fstore == FStore.FOREIGN_KEY:
-                if jfield.types.fdef._use_join_table:
-                    rkes = self.jconf.ref_key_encoding_strategy
-                    jkes = self.jconf.key_encoding_strategy
-                    rk = rkes(jfield)
-                    self._virtual_reference_names.append(rk)
-                    self._camelized_virtual_reference_names.append(jkes(rk))
-                    self._virtual_reference_fields[rk] = jfield
+                    self._list_reference_names.append(rk)
+                    self._camelized_list_reference_names.append(jrk)
+            elif jfield.types.fdef._use_join_table:
+                self._virtual_reference_names.append(rk)
+                self._camelized_virtual_reference_names.append(jrk)
+                self._virtual_reference_fields[rk] = jfield
         self._available_names: set[str] = set(self._field_names
                                               + self._camelized_field_names
                                               + self._reference_names
@@ -165,6 +182,12 @@ class Cdef:
         """
         return self._jconf
 
+    def field_or_none(self: Cdef, name: str) -> Optional[JField]:
+        """Get the field which is named `name`. If there isn't one, None is
+        returned.
+        """
+        return self._dict_fields.get(name)
+
     def field_named(self: Cdef, name: str) -> JField:
         """
         Get the field which is named `name`.
@@ -204,6 +227,52 @@ class Cdef:
         self._calc_field_names = list(map(lambda f: f.name, self._calc_fields))
         return self._calc_field_names
 
+    @property
+    def calc_field_map(self: Cdef) -> dict[str, JField]:
+        """Calculated fields of this class definition keyed by name.
+        """
+        return self._calc_field_map
+
+    @property
+    def local_key_fields(self: Cdef) -> dict[str, JField]:
+        """Local key fields of this class definition keyed by local key name.
+        """
+        if self._local_key_fields is None:
+            self._local_key_fields = {
+                f.ref_key: f for f in self._tuple_fields
+                if f.fdef.fstore == FStore.LOCAL_KEY}
+        return self._local_key_fields
+
+    @property
+    def blank_plan(self: Cdef) -> tuple[list[str], list[JField]]:
+        """The fields to blank on initializing. Names of stored fields which
+        are not references are blanked directly. Reference fields are blanked
+        through the attribute hook to maintain local keys and links.
+        """
+        if self._blank_plan is None:
+            names: list[str] = []
+            refs: list[JField] = []
+            for field in self._tuple_fields:
+                if field.fdef.fstore == FStore.CALCULATED:
+                    continue
+                if field.fdef.is_ref:
+                    refs.append(field)
+                else:
+                    names.append(field.name)
+            self._blank_plan = (names, refs)
+        return self._blank_plan
+
+    @property
+    def ref_fields(self: Cdef) -> list[JField]:
+        """Stored reference fields of this class definition. Objects on these
+        fields are saved separately from the objects referencing them.
+        """
+        if self._ref_fields is None:
+            self._ref_fields = [
+                f for f in self._tuple_fields
+                if f.fdef.fstore != FStore.CALCULATED and f.fdef.is_ref]
+        return self._ref_fields
+
     @property
     def setter_fields(self: Cdef) -> list[JField]:
         """Calculated fields with setter of this class definition.
@@ -283,6 +352,66 @@ class Cdef:
         else:
             return None
 
+    @property
+    def root_types(self: Cdef) -> Types:
+        """The canonical types of an object of this class when it's the root
+        of an operation. This is created on first access and shared by root
+        contexts, do not modify it.
+        """
+        if self._root_types is None:
+            from .types import types
+            root_types = types.objof(self._cls)
+            root_types.fdef._cdef = self
+            self._root_types = root_types
+        return self._root_types
+
+    @property
+    def root_fdef(self: Cdef) -> Fdef:
+        """The field definition of an object of this class when it's the root
+        of an operation.
+        """
+        return self.root_types.fdef
+
+    @property
+    def tplan(self: Cdef) -> Optional[TPlan]:
+        """The compiled transform plan of this class definition. This is
+        compiled on first access. If referenced types cannot be resolved yet,
+        None is returned and the interpretive transforming should be used.
+        """
+        if self._tplan is None:
+            from .tplan import TPlan
+            try:
+                self._tplan = TPlan(self)
+            except (UnresolvedTypeNameException,
+                    JSONClassNotFoundException,
+                    JSONClassTypedDictNotFoundException):
+                return None
+        return self._tplan
+
+    def oplan(self: Cdef, ctxcfg: CtxCfg) -> Optional[OPlan]:
+        """Get the output plan of this class definition under `ctxcfg`. The
+        plan is computed on first access and cached per context
+        configuration. If referenced types cannot be resolved yet, None is
+        returned.
+
+        Args:
+            ctxcfg (CtxCfg): The context configuration of outputting.
+
+        Returns:
+            Optional[OPlan]: The output plan or None.
+        """
+        oplan = self._oplans.get(ctxcfg)
+        if oplan is None:
+            from .oplan import OPlan
+            try:
+                oplan = OPlan(self, ctxcfg)
+            except (UnresolvedTypeNameException,
+                    JSONClassNotFoundException,
+                    JSONClassTypedDictNotFoundException):
+                return None
+            self._oplans[ctxcfg] = oplan
+        return oplan
+
     @property
     def available_names(self: Cdef) -> set[str]:
         self._resolve_ref_names_if_needed()
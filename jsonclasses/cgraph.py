@@ -61,7 +61,9 @@ class CGraph:
                                      can_create=[],
                                      can_update=[],
                                      can_delete=[],
-                                     can_read=[])
+                                     can_read=[],
+                                     compiled=False,
+                                     slots=False)
         self.__class__._initialized_map[name] = True
         return None
 
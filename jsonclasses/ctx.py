@@ -2,7 +2,7 @@
 from __future__ import annotations
 from typing import Any, NamedTuple, Union, Optional, cast, TYPE_CHECKING
 from .jconf import JConf
-from .types import types
+from .keypath import EMPTY_KEYPATH, KeyPath
 from .mgraph import MGraph
 from .excs import ValidationException
 if TYPE_CHECKING:
@@ -34,27 +34,183 @@ class CtxCfg(NamedTuple):
     """On tojson, whether output null value instead of unexisting field.
     """
 
-class Ctx(NamedTuple):
-    root: JObject
-    owner: JObject
-    parent: list | dict | JObject
-    holder: Optional[JObject]
-    val: Any
-    original: Any
-    ctxcfg: CtxCfg
-    keypathr: list[str | int]
-    fkeypathr: list[str | int]
-    keypatho: list[str | int]
-    fkeypatho: list[str | int]
-    keypathp: list[str | int]
-    fkeypathp: list[str | int]
-    keypathh: list[str | int]
-    fkeypathh: list[str | int]
-    fdef: Fdef
-    operator: Any
-    mgraph: MGraph = MGraph()
-    idchain: list[str] = []
-    passin: Optional[Any] = None
+
+class CtxFrame:
+    """The per field invariants of a context. A frame is shared by contexts
+    which only differ in value, thus swapping the value of a context doesn't
+    copy them.
+    """
+
+    __slots__ = ('root', 'owner', 'parent', 'holder', 'original', 'ctxcfg',
+                 'kpr', 'fkpr', 'kpo', 'fkpo', 'kpp', 'fkpp', 'kph', 'fkph',
+                 'fdef', 'operator', 'mgraph', 'idchain', 'passin')
+
+    def __init__(self: CtxFrame,
+                 root: JObject,
+                 owner: JObject,
+                 parent: list | dict | JObject,
+                 holder: Optional[JObject],
+                 original: Any,
+                 ctxcfg: CtxCfg,
+                 kpr: KeyPath,
+                 fkpr: KeyPath,
+                 kpo: KeyPath,
+                 fkpo: KeyPath,
+                 kpp: KeyPath,
+                 fkpp: KeyPath,
+                 kph: KeyPath,
+                 fkph: KeyPath,
+                 fdef: Fdef,
+                 operator: Any,
+                 mgraph: MGraph,
+                 idchain: list[str],
+                 passin: Optional[Any] = None) -> None:
+        self.root = root
+        self.owner = owner
+        self.parent = parent
+        self.holder = holder
+        self.original = original
+        self.ctxcfg = ctxcfg
+        self.kpr = kpr
+        self.fkpr = fkpr
+        self.kpo = kpo
+        self.fkpo = fkpo
+        self.kpp = kpp
+        self.fkpp = fkpp
+        self.kph = kph
+        self.fkph = fkph
+        self.fdef = fdef
+        self.operator = operator
+        self.mgraph = mgraph
+        self.idchain = idchain
+        self.passin = passin
+
+
+class Ctx:
+    """The context of a value in a JSON class operation. A context is a frame
+    with a value. Do not modify a context, use `nval` to get a context with
+    another value.
+    """
+
+    __slots__ = ('frame', 'val')
+
+    def __init__(self: Ctx, frame: CtxFrame, val: Any) -> None:
+        self.frame = frame
+        self.val = val
+
+    @property
+    def root(self: Ctx) -> JObject:
+        """The root object of the operation.
+        """
+        return self.frame.root
+
+    @property
+    def owner(self: Ctx) -> JObject:
+        """The object which owns the current value.
+        """
+        return self.frame.owner
+
+    @property
+    def parent(self: Ctx) -> list | dict | JObject:
+        """The direct container of the current value.
+        """
+        return self.frame.parent
+
+    @property
+    def holder(self: Ctx) -> Optional[JObject]:
+        """The object which holds the owner.
+        """
+        return self.frame.holder
+
+    @property
+    def original(self: Ctx) -> Any:
+        """The original value before the operation.
+        """
+        return self.frame.original
+
+    @property
+    def ctxcfg(self: Ctx) -> CtxCfg:
+        """The context configuration.
+        """
+        return self.frame.ctxcfg
+
+    @property
+    def kpr(self: Ctx) -> KeyPath:
+        """The keypath from the root object.
+        """
+        return self.frame.kpr
+
+    @property
+    def fkpr(self: Ctx) -> KeyPath:
+        """The JSON keypath from the root object.
+        """
+        return self.frame.fkpr
+
+    @property
+    def kpo(self: Ctx) -> KeyPath:
+        """The keypath from the owner object.
+        """
+        return self.frame.kpo
+
+    @property
+    def fkpo(self: Ctx) -> KeyPath:
+        """The JSON keypath from the owner object.
+        """
+        return self.frame.fkpo
+
+    @property
+    def kpp(self: Ctx) -> KeyPath:
+        """The keypath from the parent container.
+        """
+        return self.frame.kpp
+
+    @property
+    def fkpp(self: Ctx) -> KeyPath:
+        """The JSON keypath from the parent container.
+        """
+        return self.frame.fkpp
+
+    @property
+    def kph(self: Ctx) -> KeyPath:
+        """The keypath from the holder object.
+        """
+        return self.frame.kph
+
+    @property
+    def fkph(self: Ctx) -> KeyPath:
+        """The JSON keypath from the holder object.
+        """
+        return self.frame.fkph
+
+    @property
+    def fdef(self: Ctx) -> Fdef:
+        """The field definition of the current value.
+        """
+        return self.frame.fdef
+
+    @property
+    def operator(self: Ctx) -> Any:
+        """The operator of the operation.
+        """
+        return self.frame.operator
+
+    @property
+    def mgraph(self: Ctx) -> MGraph:
+        """The modified graph of the operation.
+        """
+        return self.frame.mgraph
+
+    @property
+    def idchain(self: Ctx) -> list[str]:
+        """The class names which are outputted along the keypath.
+        """
+        return self.frame.idchain
+
+    @property
+    def passin(self: Ctx) -> Optional[Any]:
+        """The value passed in by the caller.
+        """
+        return self.frame.passin
 
     @property
     def cdefroot(self: Ctx) -> Cdef:
@@ -84,196 +240,185 @@ class Ctx(NamedTuple):
     def iscreate(self: Ctx) -> bool:
         return self.original is None
 
+    @property
+    def keypathr(self: Ctx) -> list[str | int]:
+        return self.kpr.keys
+
+    @property
+    def fkeypathr(self: Ctx) -> list[str | int]:
+        return self.fkpr.keys
+
+    @property
+    def keypatho(self: Ctx) -> list[str | int]:
+        return self.kpo.keys
+
+    @property
+    def fkeypatho(self: Ctx) -> list[str | int]:
+        return self.fkpo.keys
+
+    @property
+    def keypathp(self: Ctx) -> list[str | int]:
+        return self.kpp.keys
+
+    @property
+    def fkeypathp(self: Ctx) -> list[str | int]:
+        return self.fkpp.keys
+
+    @property
+    def keypathh(self: Ctx) -> list[str | int]:
+        return self.kph.keys
+
+    @property
+    def fkeypathh(self: Ctx) -> list[str | int]:
+        return self.fkph.keys
+
     @property
     def skeypathr(self: Ctx) -> str:
-        return '.'.join([str(k) for k in self.keypathr])
+        return self.kpr.string
 
     @property
     def skeypatho(self: Ctx) -> str:
-        return '.'.join([str(k) for k in self.keypatho])
+        return self.kpo.string
 
     @property
     def skeypathp(self: Ctx) -> str:
-        return '.'.join([str(k) for k in self.keypathp])
+        return self.kpp.string
 
     @property
     def skeypathh(self: Ctx) -> str:
-        return '.'.join([str(k) for k in self.keypathh])
+        return self.kph.string
 
     @property
     def sfkeypathr(self: Ctx) -> str:
-        return '.'.join([str(k) for k in self.fkeypathr])
+        return self.fkpr.string
 
     @property
     def sfkeypatho(self: Ctx) -> str:
-        return '.'.join([str(k) for k in self.fkeypatho])
+        return self.fkpo.string
 
     @property
     def sfkeypathp(self: Ctx) -> str:
-        return '.'.join([str(k) for k in self.fkeypathp])
+        return self.fkpp.string
 
     @property
     def sfkeypathh(self: Ctx) -> str:
-        return '.'.join([str(k) for k in self.fkeypathh])
+        return self.fkph.string
 
     @classmethod
     def rootctx(cls: type[Ctx], root: JObject, ctxcfg: CtxCfg,
-                value: Any = None) -> Ctx:
-        fdef = types.objof(root.__class__).fdef
-        fdef._cdef = root.__class__.cdef
-        return Ctx(root=root, owner=root, parent=root, holder=None,
-                   val=value if value is not None else root,
-                   original=root, ctxcfg=ctxcfg, keypatho=[], fkeypatho=[],
-                   keypathr=[], fkeypathr=[], keypathp=[], fkeypathp=[],
-                   keypathh=[], fkeypathh=[], fdef=fdef,
-                   operator=root._operator, mgraph=MGraph(), idchain=[])
+                value: Any = None, mgraph: Optional[MGraph] = None) -> Ctx:
+        fdef = root.__class__.cdef.root_fdef
+        e = EMPTY_KEYPATH
+        if mgraph is None:
+            mgraph = MGraph()
+        frame = CtxFrame(root=root, owner=root, parent=root, holder=None,
+                         original=root, ctxcfg=ctxcfg, kpr=e, fkpr=e, kpo=e,
+                         fkpo=e, kpp=e, fkpp=e, kph=e, fkph=e, fdef=fdef,
+                         operator=root._operator, mgraph=mgraph,
+                         idchain=[])
+        return Ctx(frame, value if value is not None else root)
 
     @classmethod
     def rootctxp(cls: type[Ctx], root: JObject, key: str, val: Any, passin: Any) -> Ctx:
-        fdef = types.objof(root.__class__).fdef
-        fdef._cdef = root.__class__.cdef
-        ekey = root.__class__.cdef.jconf.key_encoding_strategy(key)
-        return Ctx(root=root, owner=root, parent=root, holder=None, val=val,
-                   original=root, ctxcfg=CtxCfg(),
-                   keypatho=[key], fkeypatho=[ekey],
-                   keypathr=[key], fkeypathr=[ekey],
-                   keypathp=[key], fkeypathp=[ekey],
-                   keypathh=[key], fkeypathh=[ekey],
-                   fdef=fdef,
-                   operator=root._operator, mgraph=MGraph(), idchain=[],
-                   passin=passin)
+        fdef = root.__class__.cdef.root_fdef
+        ekey = root.__class__.cdef.jconf.key_encoder(key)
+        kp = EMPTY_KEYPATH.append(key)
+        fkp = EMPTY_KEYPATH.append(ekey)
+        frame = CtxFrame(root=root, owner=root, parent=root, holder=None,
+                         original=root, ctxcfg=CtxCfg(), kpr=kp, fkpr=fkp,
+                         kpo=kp, fkpo=fkp, kpp=kp, fkpp=fkp, kph=kp,
+                         fkph=fkp, fdef=fdef, operator=root._operator,
+                         mgraph=MGraph(), idchain=[], passin=passin)
+        return Ctx(frame, val)
 
     def alterfdef(self: Ctx, fdef: Fdef) -> Ctx:
-        return Ctx(root=self.root, owner=self.owner, parent=self.parent, holder=self.holder,
-                   val=self.val,
-                   original=self.original, ctxcfg=self.ctxcfg, keypatho=self.keypatho, fkeypatho=self.fkeypatho,
-                   keypathr=self.keypathr, fkeypathr=self.fkeypathr, keypathp=self.keypathp, fkeypathp=self.fkeypathp,
-                   keypathh=self.keypathh, fkeypathh=self.fkeypathh, fdef=fdef,
-                   operator=self.operator, mgraph=self.mgraph, idchain=self.idchain)
+        f = self.frame
+        frame = CtxFrame(root=f.root, owner=f.owner, parent=f.parent,
+                         holder=f.holder, original=f.original,
+                         ctxcfg=f.ctxcfg, kpr=f.kpr, fkpr=f.fkpr, kpo=f.kpo,
+                         fkpo=f.fkpo, kpp=f.kpp, fkpp=f.fkpp, kph=f.kph,
+                         fkph=f.fkph, fdef=fdef, operator=f.operator,
+                         mgraph=f.mgraph, idchain=f.idchain)
+        return Ctx(frame, self.val)
 
     def nval(self: Ctx, newval: Any) -> Ctx:
-        return Ctx(root=self.root, owner=self.owner, parent=self.parent,
-                   holder=self.holder, val=newval, original=self.original,
-                   ctxcfg=self.ctxcfg,
-                   keypatho=self.keypatho, fkeypatho=self.fkeypatho,
-                   keypathr=self.keypathr, fkeypathr=self.fkeypathr,
-                   keypathp=self.keypathp, fkeypathp=self.fkeypathp,
-                   keypathh=self.keypathh, fkeypathh=self.fkeypathh,
-                   fdef=self.fdef,
-                   operator=self.operator, mgraph=self.mgraph,
-                   idchain=self.idchain, passin=self.passin)
+        return Ctx(self.frame, newval)
 
     def nextv(self: Ctx, val: Any, key: str | int, fdef: Fdef) -> Ctx:
-        ekey = self.owner.__class__.cdef.jconf.key_encoding_strategy(key)
-        return Ctx(root=self.root, owner=self.owner, parent=self.parent,
-                   holder=self.holder, val=val, original=None,
-                   ctxcfg=self.ctxcfg,
-                   keypatho=[*self.keypatho, key],
-                   fkeypatho=[*self.fkeypatho, ekey],
-                   keypathr=[*self.keypathr, key],
-                   fkeypathr=[*self.fkeypathr, ekey],
-                   keypathp=[*self.keypathp, key],
-                   fkeypathp=[*self.fkeypathp, ekey],
-                   keypathh=[*self.keypathh, key],
-                   fkeypathh=[*self.fkeypathh, ekey],
-                   fdef=fdef,
-                   operator=self.operator, mgraph=self.mgraph,
-                   idchain=self.idchain, passin=self.passin)
+        f = self.frame
+        ekey = f.owner.__class__.cdef.jconf.key_encoder(key)
+        frame = CtxFrame(f.root, f.owner, f.parent, f.holder, None, f.ctxcfg,
+                         KeyPath(f.kpr, key), KeyPath(f.fkpr, ekey),
+                         KeyPath(f.kpo, key), KeyPath(f.fkpo, ekey),
+                         KeyPath(f.kpp, key), KeyPath(f.fkpp, ekey),
+                         KeyPath(f.kph, key), KeyPath(f.fkph, ekey),
+                         fdef, f.operator, f.mgraph, f.idchain, f.passin)
+        return Ctx(frame, val)
 
     def nexto(self: Ctx, val: Any, key: str | int, fdef: Fdef) -> Ctx:
-        ekey = self.owner.__class__.cdef.jconf.key_encoding_strategy(key)
-        return Ctx(root=self.root, owner=val, parent=val, holder=self.owner,
-                   val=val, original=None, ctxcfg=self.ctxcfg, keypatho=[],
-                   fkeypatho=[],
-                   keypathr=[*self.keypathr, key],
-                   fkeypathr=[*self.fkeypathr, ekey],
-                   keypathp=[], fkeypathp=[],
-                   keypathh=[key], fkeypathh=[ekey], fdef=fdef,
-                   operator=self.operator,
-                   mgraph=self.mgraph, idchain=self.idchain,
-                   passin=self.passin)
+        f = self.frame
+        ekey = f.owner.__class__.cdef.jconf.key_encoder(key)
+        e = EMPTY_KEYPATH
+        frame = CtxFrame(f.root, val, val, f.owner, None, f.ctxcfg,
+                         KeyPath(f.kpr, key), KeyPath(f.fkpr, ekey),
+                         e, e, e, e, KeyPath(e, key), KeyPath(e, ekey),
+                         fdef, f.operator, f.mgraph, f.idchain, f.passin)
+        return Ctx(frame, val)
 
     def nextvc(self: Ctx, val: Any, key: str | int, fdef: Fdef, c: str) -> Ctx:
-        ekey = self.owner.__class__.cdef.jconf.key_encoding_strategy(key)
-        return Ctx(root=self.root, owner=self.owner, parent=self.parent,
-                   holder=self.holder, val=val, original=None,
-                   ctxcfg=self.ctxcfg,
-                   keypatho=[*self.keypatho, key],
-                   fkeypatho=[*self.fkeypatho, ekey],
-                   keypathr=[*self.keypathr, key],
-                   fkeypathr=[*self.fkeypathr, ekey],
-                   keypathp=[*self.keypathp, key],
-                   fkeypathp=[*self.fkeypathp, ekey],
-                   keypathh=[*self.keypathh, key],
-                   fkeypathh=[*self.fkeypathh, ekey],
-                   fdef=fdef,
-                   operator=self.operator, mgraph=self.mgraph,
-                   idchain=[*self.idchain, c], passin=self.passin)
+        f = self.frame
+        ekey = f.owner.__class__.cdef.jconf.key_encoder(key)
+        frame = CtxFrame(f.root, f.owner, f.parent, f.holder, None, f.ctxcfg,
+                         KeyPath(f.kpr, key), KeyPath(f.fkpr, ekey),
+                         KeyPath(f.kpo, key), KeyPath(f.fkpo, ekey),
+                         KeyPath(f.kpp, key), KeyPath(f.fkpp, ekey),
+                         KeyPath(f.kph, key), KeyPath(f.fkph, ekey),
+                         fdef, f.operator, f.mgraph, [*f.idchain, c],
+                         f.passin)
+        return Ctx(frame, val)
 
     def nextoc(self: Ctx, val: Any, key: str | int, fdef: Fdef, c: str) -> Ctx:
-        ekey = self.owner.__class__.cdef.jconf.key_encoding_strategy(key)
-        return Ctx(root=self.root, owner=val, parent=val, holder=self.owner,
-                   val=val, original=None, ctxcfg=self.ctxcfg,
-                   keypatho=[],
-                   fkeypatho=[],
-                   keypathr=[*self.keypathr, key],
-                   fkeypathr=[*self.fkeypathr, ekey],
-                   keypathp=[],
-                   fkeypathp=[],
-                   keypathh=[key],
-                   fkeypathh=[ekey],
-                   fdef=fdef,
-                   operator=self.operator, mgraph=self.mgraph,
-                   idchain=[*self.idchain, c], passin=self.passin)
+        f = self.frame
+        ekey = f.owner.__class__.cdef.jconf.key_encoder(key)
+        e = EMPTY_KEYPATH
+        frame = CtxFrame(f.root, val, val, f.owner, None, f.ctxcfg,
+                         KeyPath(f.kpr, key), KeyPath(f.fkpr, ekey),
+                         e, e, e, e, KeyPath(e, key), KeyPath(e, ekey),
+                         fdef, f.operator, f.mgraph, [*f.idchain, c],
+                         f.passin)
+        return Ctx(frame, val)
 
     def nextvo(self: Ctx, val: Any, key: str | int, fdef: Fdef, o: JObject) -> Ctx:
-        ekey = self.owner.__class__.cdef.jconf.key_encoding_strategy(key)
-        return Ctx(root=self.root, owner=o, parent=self.parent,
-                   holder=self.holder, val=val, original=None,
-                   ctxcfg=self.ctxcfg,
-                   keypatho=[*self.keypatho, key],
-                   fkeypatho=[*self.fkeypatho, ekey],
-                   keypathr=[*self.keypathr, key],
-                   fkeypathr=[*self.fkeypathr, ekey],
-                   keypathp=[*self.keypathp, key],
-                   fkeypathp=[*self.fkeypathp, ekey],
-                   keypathh=[*self.keypathh, key],
-                   fkeypathh=[*self.fkeypathh, ekey],
-                   fdef=fdef,
-                   operator=self.operator, mgraph=self.mgraph,
-                   idchain=self.idchain, passin=self.passin)
+        f = self.frame
+        ekey = f.owner.__class__.cdef.jconf.key_encoder(key)
+        frame = CtxFrame(f.root, o, f.parent, f.holder, None, f.ctxcfg,
+                         KeyPath(f.kpr, key), KeyPath(f.fkpr, ekey),
+                         KeyPath(f.kpo, key), KeyPath(f.fkpo, ekey),
+                         KeyPath(f.kpp, key), KeyPath(f.fkpp, ekey),
+                         KeyPath(f.kph, key), KeyPath(f.fkph, ekey),
+                         fdef, f.operator, f.mgraph, f.idchain, f.passin)
+        return Ctx(frame, val)
 
     def colval(self: Ctx, val: Any, key: str | int, fdef: Fdef, p: Any) -> Ctx:
-        return Ctx(root=self.root, owner=self.owner, parent=p,
-                   holder=self.holder,
-                   val=val, original=None, ctxcfg=self.ctxcfg,
-                   keypatho=[*self.keypatho, key],
-                   fkeypatho=[*self.fkeypatho, key],
-                   keypathr=[*self.keypathr, key],
-                   fkeypathr=[*self.fkeypathr, key],
-                   keypathp=[key],
-                   fkeypathp=[*self.fkeypathp, key],
-                   keypathh=[*self.keypathh, key],
-                   fkeypathh=[*self.fkeypathh, key],
-                   fdef=fdef,
-                   operator=self.operator, mgraph=self.mgraph,
-                   idchain=self.idchain, passin=self.passin)
+        f = self.frame
+        frame = CtxFrame(f.root, f.owner, p, f.holder, None, f.ctxcfg,
+                         KeyPath(f.kpr, key), KeyPath(f.fkpr, key),
+                         KeyPath(f.kpo, key), KeyPath(f.fkpo, key),
+                         KeyPath(EMPTY_KEYPATH, key), KeyPath(f.fkpp, key),
+                         KeyPath(f.kph, key), KeyPath(f.fkph, key),
+                         fdef, f.operator, f.mgraph, f.idchain, f.passin)
+        return Ctx(frame, val)
 
     def default(self: Ctx, owner: JObject, key: str | int, fdef: Fdef) -> Ctx:
-        ekey = self.owner.__class__.cdef.jconf.key_encoding_strategy(key)
-        return Ctx(root=self.root, owner=owner, parent=owner,
-                   holder=self.holder, val=None,
-                   original=None, ctxcfg=self.ctxcfg,
-                   keypatho=[*self.keypatho, key],
-                   fkeypatho=[*self.fkeypatho, ekey],
-                   keypathr=[*self.keypathr, key],
-                   fkeypathr=[*self.fkeypathr, ekey],
-                   keypathp=[*self.keypathp, key],
-                   fkeypathp=[*self.fkeypathp, ekey],
-                   keypathh=[*self.keypathh, key], fdef=fdef,
-                   fkeypathh=[*self.fkeypathh, ekey],
-                   operator=self.operator, mgraph=self.mgraph,
-                   idchain=self.idchain, passin=self.passin)
+        f = self.frame
+        ekey = f.owner.__class__.cdef.jconf.key_encoder(key)
+        frame = CtxFrame(f.root, owner, owner, f.holder, None, f.ctxcfg,
+                         KeyPath(f.kpr, key), KeyPath(f.fkpr, ekey),
+                         KeyPath(f.kpo, key), KeyPath(f.fkpo, ekey),
+                         KeyPath(f.kpp, key), KeyPath(f.fkpp, ekey),
+                         KeyPath(f.kph, key), KeyPath(f.fkph, ekey),
+                         fdef, f.operator, f.mgraph, f.idchain, f.passin)
+        return Ctx(frame, None)
 
     def raise_vexc(self: Ctx, msg: str) -> None:
         """Raise validation error with message.
@@ -114,6 +114,10 @@ class CopyBehavior(Enum):
 class Fdef:
     """The description of a JSONClass field. Some type markers annotate on
     this definition.
+
+    Field definitions are copy on write. Chaining a types marker makes a
+    shallow copy, thus modifiers should replace attribute values in `define`
+    instead of mutating shared values in place.
     """
 
     def __init__(self: Fdef) -> None:
@@ -165,6 +169,11 @@ class Fdef:
         self._auth_by: bool = False
         self._auth_by_checker: Optional[Types] = None
 
+    def __copy__(self: Fdef) -> Fdef:
+        fdef = Fdef.__new__(Fdef)
+        fdef.__dict__.update(self.__dict__)
+        return fdef
+
     @property
     def cdef(self: Fdef) -> Cdef:
         """The class definition which owns this field.
@@ -329,7 +338,7 @@ class Fdef:
             return cast(Types, None)
         if self._resolved_item_types is not None:
             return self._resolved_item_types
-        self._resolved_item_types = rtypes(self.raw_item_types)
+        self._resolved_item_types = Types(rtypes(self.raw_item_types))
         self._resolved_item_types.fdef._cdef = self.cdef
         self._resolved_item_types = rnamedtypes(
             self._resolved_item_types,
@@ -0,0 +1,162 @@
+"""This module defines `IdentityMap`, the opt-in session cache of JSON Class
+objects keyed by class and primary key. Inside an identity map session,
+nested inputs with a primary key which is seen before resolve to the known
+object, and ORM integrations return known objects instead of materializing
+records again. Thus each object materializes once per session.
+
+The current identity map is stored in a context variable. An asyncio task
+sees the identity map of the context it's created in. Sessions entered are
+kept in a context variable too, thus tasks can enter and exit one identity
+map in any order.
+"""
+from __future__ import annotations
+from typing import Any, Optional, TYPE_CHECKING
+from collections import OrderedDict
+from contextvars import ContextVar, Token
+from weakref import ref, ReferenceType
+from .mgraph import _pkey
+if TYPE_CHECKING:
+    from .jobject import JObject
+
+
+_current: ContextVar[Optional[IdentityMap]] = \
+    ContextVar('jsonclasses_identity_map', default=None)
+_tokens: ContextVar[tuple[Token, ...]] = \
+    ContextVar('jsonclasses_identity_map_tokens', default=())
+
+
+def current_identity_map() -> Optional[IdentityMap]:
+    """Get the identity map of the current session.
+
+    Returns:
+        Optional[IdentityMap]: The identity map, or None if no session is \
+            entered.
+    """
+    return _current.get()
+
+
+class IdentityMap:
+    """The identity map holds JSON Class objects of a session keyed by class
+    and primary key. Objects are held with weak references, an object which
+    is not used anymore leaves the map. The least recently used objects are
+    dropped when the map holds more objects than its size.
+
+      from jsonclasses import IdentityMap
+
+      with IdentityMap():
+          a = User.id(1).exec()
+          b = User.id(1).exec()
+          assert a is b
+
+    Objects with a primary key are added when they're initialized inside the
+    session. ORM integrations look up objects with `current_identity_map`
+    before materializing records.
+    """
+
+    def __init__(self: IdentityMap, size: int = 10000) -> None:
+        """Create an identity map.
+
+        Args:
+            size (int): The maximum number of objects the map holds.
+        """
+        self._size = size
+        self._refs: OrderedDict[tuple[type, Any], ReferenceType] = \
+            OrderedDict()
+
+    def __enter__(self: IdentityMap) -> IdentityMap:
+        _tokens.set(_tokens.get() + (_current.set(self),))
+        return self
+
+    def __exit__(self: IdentityMap, *args: Any) -> None:
+        tokens = _tokens.get()
+        _tokens.set(tokens[:-1])
+        _current.reset(tokens[-1])
+
+    def __len__(self: IdentityMap) -> int:
+        return len(self._refs)
+
+    def _key(self: IdentityMap, cls: type, pk: Any) -> tuple[type, Any]:
+        try:
+            hash(pk)
+        except TypeError:
+            return (cls, _pkey(pk))
+        return (cls, pk)
+
+    def get(self: IdentityMap, cls: type[JObject],
+            pk: Any) -> Optional[JObject]:
+        """Get the object of a class with a primary key.
+
+        Args:
+            cls (type[JObject]): The class of the object.
+            pk (Any): The primary key value.
+
+        Returns:
+            Optional[JObject]: The object, or None if it's not in the map.
+        """
+        key = self._key(cls, pk)
+        oref = self._refs.get(key)
+        if oref is None:
+            return None
+        object = oref()
+        if object is not None:
+            self._refs.move_to_end(key)
+        return object
+
+    def put(self: IdentityMap, object: JObject,
+            pk: Any = None) -> JObject:
+        """Add an object to the map unless an object of its class and
+        primary key is in the map already.
+
+        Args:
+            object (JObject): The object.
+            pk (Any): The primary key value. The primary field value of the \
+                object is used if it's None.
+
+        Returns:
+            JObject: The object of the class and primary key in the map. \
+                It's `object` unless another object is added before. An \
+                object without a primary key is not added and returned.
+        """
+        if pk is None:
+            pfield = object.__class__.cdef.primary_field
+            if pfield is None:
+                return object
+            pk = getattr(object, pfield.name)
+            if pk is None:
+                return object
+        key = self._key(object.__class__, pk)
+        oref = self._refs.get(key)
+        if oref is not None:
+            exist = oref()
+            if exist is not None:
+                self._refs.move_to_end(key)
+                return exist
+        refs = self._refs
+
+        def remove(dead: ReferenceType) -> None:
+            if refs.get(key) is dead:
+                del refs[key]
+        self._refs[key] = ref(object, remove)
+        self._refs.move_to_end(key)
+        while len(self._refs) > self._size:
+            self._refs.popitem(last=False)
+        return object
+
+    def discard(self: IdentityMap, object: JObject) -> None:
+        """Remove an object from the map if it's in the map.
+        """
+        pfield = object.__class__.cdef.primary_field
+        if pfield is None:
+            return
+        pk = getattr(object, pfield.name)
+        if pk is None:
+            return
+        key = self._key(object.__class__, pk)
+        oref = self._refs.get(key)
+        if oref is not None and oref() is object:
+            del self._refs[key]
+
+    def clear(self: IdentityMap) -> None:
+        """Remove all objects from the map.
+        """
+        self._refs.clear()
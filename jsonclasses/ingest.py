@@ -0,0 +1,244 @@
+"""This module defines the ingestion of JSON dumps. A dump is either newline
+delimited JSON or a top level JSON array. Records are read from the stream
+incrementally and initialized into validated JSON Class objects in batches,
+thus memory is bounded by the batch size instead of the input size.
+"""
+from __future__ import annotations
+from typing import Any, IO, Iterator, NamedTuple, TYPE_CHECKING
+from codecs import getincrementaldecoder
+from json import JSONDecoder, JSONDecodeError
+from .excs import ValidationException
+if TYPE_CHECKING:
+    from .jobject import JObject
+
+
+_WHITESPACE = ' \t\n\r'
+
+_NUMBER_CHARS = '0123456789+-.eE'
+
+_LITERALS = ('true', 'false', 'null', 'NaN', 'Infinity', '-Infinity')
+
+
+class IngestError(NamedTuple):
+    """A record which is not ingested.
+    """
+
+    index: int
+    """The index of the record in the dump."""
+
+    record: Any
+    """The decoded record, or the raw line if it's not decodable."""
+
+    exception: Exception
+    """The exception of decoding, initializing or validating the record."""
+
+
+class IngestBatch(NamedTuple):
+    """A batch of ingested records.
+    """
+
+    objects: list[Any]
+    """The valid objects which are initialized from records of the batch."""
+
+    errors: list[IngestError]
+    """The records of the batch which are not ingested."""
+
+
+class _Chars:
+    """A text reader over a text or binary stream."""
+
+    def __init__(self: _Chars, stream: IO, chunk_size: int,
+                 encoding: str) -> None:
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._decoder = getincrementaldecoder(encoding)()
+        self.eof = False
+
+    def read(self: _Chars, size: int = 0) -> str:
+        """Read at least one character unless the stream is exhausted."""
+        text = ''
+        while not text and not self.eof:
+            data = self._stream.read(max(size, self._chunk_size))
+            if isinstance(data, str):
+                text = data
+                self.eof = not data
+            else:
+                self.eof = not data
+                text = self._decoder.decode(data, final=self.eof)
+        return text
+
+
+def iter_records(stream: IO,
+                 chunk_size: int = 65536,
+                 encoding: str = 'utf-8') -> Iterator[tuple[Any, Any]]:
+    """Read records from a JSON dump incrementally. A dump which starts with
+    `[` is read as a JSON array, otherwise it's read as newline delimited
+    JSON.
+
+    Args:
+        stream (IO): A readable text or binary stream.
+        chunk_size (int): The number of characters or bytes to read at once.
+        encoding (str): The encoding of a binary stream.
+
+    Yields:
+        tuple[Any, Any]: The decoded record and None, or the raw line and \
+            the decoding exception of a line which is not decodable.
+
+    Raises:
+        JSONDecodeError: If a JSON array dump is malformed or it's followed \
+            by anything other than whitespaces.
+    """
+    chars = _Chars(stream, chunk_size, encoding)
+    buffer = chars.read()
+    start = 0
+    while start < len(buffer) or not chars.eof:
+        if start == len(buffer):
+            buffer, start = chars.read(), 0
+        elif buffer[start] in _WHITESPACE:
+            start += 1
+        else:
+            break
+    if start == len(buffer):
+        return
+    if buffer[start] == '[':
+        yield from _iter_array(chars, buffer, start + 1)
+    else:
+        yield from _iter_lines(chars, buffer[start:])
+
+
+def _iter_lines(chars: _Chars, buffer: str) -> Iterator[tuple[Any, Any]]:
+    decoder = JSONDecoder()
+    while True:
+        lines = buffer.split('\n')
+        buffer = lines.pop()
+        if chars.eof:
+            lines.append(buffer)
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                yield decoder.decode(line), None
+            except JSONDecodeError as e:
+                yield line, e
+        if chars.eof:
+            return
+        buffer += chars.read()
+
+
+def _iter_array(chars: _Chars, buffer: str,
+                start: int) -> Iterator[tuple[Any, Any]]:
+    decoder = JSONDecoder()
+    expect_item = True
+    empty = True
+    size = 0
+    while True:
+        # skip whitespaces and separators
+        while start < len(buffer) and buffer[start] in _WHITESPACE:
+            start += 1
+        if start == len(buffer):
+            if chars.eof:
+                raise JSONDecodeError('Unterminated array', buffer, start)
+            buffer, start = buffer[start:] + chars.read(), 0
+            continue
+        char = buffer[start]
+        if char == ']' and (empty or not expect_item):
+            _check_end(chars, buffer, start + 1)
+            return
+        if not expect_item:
+            if char != ',':
+                raise JSONDecodeError('Expecting \',\' delimiter',
+                                      buffer, start)
+            start += 1
+            expect_item = True
+            continue
+        try:
+            record, end = decoder.raw_decode(buffer, start)
+        except JSONDecodeError as e:
+            # only a record which is cut at the end of the buffer is retried
+            if chars.eof or not _is_cut(e, buffer):
+                raise
+            record, end = None, len(buffer)
+        # a record is complete when it's followed by a character which
+        # doesn't continue it
+        if end == len(buffer) or (
+                record.__class__ in (int, float)
+                and not buffer[end:].strip(_NUMBER_CHARS) and not chars.eof):
+            if chars.eof:
+                raise JSONDecodeError('Unterminated array', buffer, start)
+            # read more for a large record, the size grows on each retry
+            size = max(size * 2, len(buffer) - start)
+            buffer, start = buffer[start:] + chars.read(size), 0
+            continue
+        size = 0
+        start = end
+        expect_item = False
+        empty = False
+        yield record, None
+
+
+def _check_end(chars: _Chars, buffer: str, start: int) -> None:
+    """Check that only whitespaces follow the JSON array of a dump."""
+    while True:
+        while start < len(buffer) and buffer[start] in _WHITESPACE:
+            start += 1
+        if start < len(buffer):
+            raise JSONDecodeError('Extra data', buffer, start)
+        if chars.eof:
+            return
+        buffer, start = chars.read(), 0
+
+
+def _is_cut(error: JSONDecodeError, buffer: str) -> bool:
+    """Check whether a decoding error is caused by a record which is cut at
+    the end of the buffer rather than a malformed record.
+    """
+    if error.pos >= len(buffer):
+        return True
+    if error.msg.startswith('Unterminated string'):
+        return True
+    rest = buffer[error.pos:]
+    if not rest.strip(_NUMBER_CHARS):
+        return True
+    if error.msg.startswith('Invalid \\uXXXX escape') and len(rest) < 6:
+        return True
+    return any(literal.startswith(rest) for literal in _LITERALS)
+
+
+def ingest(cls: type[JObject],
+           stream: IO,
+           batch_size: int = 1000,
+           chunk_size: int = 65536,
+           encoding: str = 'utf-8') -> Iterator[IngestBatch]:
+    """Ingest a JSON dump into validated JSON Class objects in batches.
+    Records which are not decodable, not JSON objects or not valid are
+    reported in batches instead of aborting the ingestion.
+
+    Args:
+        stream (IO): A readable text or binary stream of newline delimited \
+            JSON or a JSON array.
+        batch_size (int): The number of records of a batch.
+        chunk_size (int): The number of characters or bytes to read at once.
+        encoding (str): The encoding of a binary stream.
+
+    Yields:
+        IngestBatch: The valid objects and the errors of each batch.
+    """
+    objects: list[Any] = []
+    errors: list[IngestError] = []
+    index = -1
+    for index, (record, exception) in enumerate(
+            iter_records(stream, chunk_size, encoding)):
+        if exception is None and not isinstance(record, dict):
+            exception = TypeError('record is not a JSON object')
+        if exception is None:
+            try:
+                objects.append(cls(**record).validate())
+            except ValidationException as e:
+                exception = e
+        if exception is not None:
+            errors.append(IngestError(index, record, exception))
+        if (index + 1) % batch_size == 0:
+            yield IngestBatch(objects, errors)
+            objects, errors = [], []
+    if (index + 1) % batch_size != 0:
+        yield IngestBatch(objects, errors)
@@ -4,6 +4,7 @@ configuration object tweaks the behavior of JSON classes.
 from __future__ import annotations
 from typing import Optional, Callable, Any, cast, final, TYPE_CHECKING
 from .jobject import JObject
+from .keypath import memoized_key_strategy
 if TYPE_CHECKING:
     from .jfield import JField
     from .cgraph import CGraph
@@ -42,7 +43,9 @@ class JConf:
                  can_create: CanCreate | list[CanCreate] | Types | None,
                  can_update: CanUpdate | list[CanUpdate] | Types | None,
                  can_delete: CanDelete | list[CanDelete] | Types | None,
-                 can_read: CanRead | list[CanRead] | Types | None) -> None:
+                 can_read: CanRead | list[CanRead] | Types | None,
+                 compiled: Optional[bool] = None,
+                 slots: Optional[bool] = None) -> None:
         """
         Initialize a new configuration object.
 
@@ -79,18 +82,25 @@ class JConf:
                 deletion guard.
             can_read (Optional[Union[CanRead, list[CanRead]]]): The reading
                 guard.
+            compiled (Optional[bool]): Whether transform inputs with the \
+                compiled per-class transform plan.
+            slots (Optional[bool]): Whether store instance values in slots \
+                and allocate bookkeeping containers on first use.
         """
         from .types import Types
         self._cls: Optional[type[JObject]] = None
         self._cgraph = cgraph or 'default'
         self._key_encoding_strategy = key_encoding_strategy
         self._key_decoding_strategy = key_decoding_strategy
+        self._key_encoder: Optional[Callable[[str], str]] = None
         self._strict_input = strict_input
         self._ref_key_encoding_strategy = ref_key_encoding_strategy
         self._validate_all_fields = validate_all_fields
         self._abstract = abstract
         self._reset_all_fields = reset_all_fields
         self._output_null = output_null
+        self._compiled = compiled
+        self._slots = slots
         if callable(on_create) or isinstance(on_create, Types):
             self._on_create = [on_create]
         elif isinstance(on_create, list):
@@ -170,6 +180,10 @@ class JConf:
             return False
         if self.can_read != other_config.can_read:
             return False
+        if self.compiled != other_config.compiled:
+            return False
+        if self.slots != other_config.slots:
+            return False
         return True
 
     @property
@@ -193,6 +207,16 @@ class JConf:
             return self.cgraph.default_config.key_encoding_strategy
         return self._key_encoding_strategy
 
+    @property
+    def key_encoder(self: JConf) -> Callable[[str], str]:
+        """The bounded memoized object key encoding strategy. Use this on
+        hot paths.
+        """
+        if self._key_encoder is None:
+            self._key_encoder = memoized_key_strategy(
+                self.key_encoding_strategy)
+        return self._key_encoder
+
     @property
     def key_decoding_strategy(self: JConf) -> Callable[[str], str]:
         """The object key decoding strategy.
@@ -251,6 +275,23 @@ class JConf:
             return self.cgraph.default_config.output_null
         return self._output_null
 
+    @property
+    def compiled(self: JConf) -> bool:
+        """Whether transform inputs with the compiled per-class transform
+        plan.
+        """
+        if self._compiled is None:
+            return self.cgraph.default_config.compiled
+        return self._compiled
+
+    @property
+    def slots(self: JConf) -> bool:
+        """Whether instances store values in slots instead of a dict.
+        """
+        if self._slots is None:
+            return self.cgraph.default_config.slots
+        return self._slots
+
     @property
     def on_create(self: JConf) -> list[OnCreate | Types]:
         """The object creation callback.
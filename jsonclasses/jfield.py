@@ -25,6 +25,9 @@ class JField:
         self._name = name
         self._default = default
         self._types = types
+        self._json_name: str = cdef.jconf.key_encoder(name)
+        self._ref_key: Optional[str] = None
+        self._json_ref_key: Optional[str] = None
         self._resolved_foreign = False
         self._foreign_cdef = None
         self._foreign_field = None
@@ -48,7 +51,25 @@ class JField:
     def json_name(self: JField) -> str:
         """The name of the field when converted into JSON dict.
         """
-        return self.cdef.jconf.key_encoding_strategy(self._name)
+        return self._json_name
+
+    @property
+    def ref_key(self: JField) -> Optional[str]:
+        """The reference key name of this field in Python. This is None if
+        this field is not a reference field.
+        """
+        if not self._cdef._ref_names_resolved:
+            self._cdef._resolve_ref_names_if_needed()
+        return self._ref_key
+
+    @property
+    def json_ref_key(self: JField) -> Optional[str]:
+        """The reference key name of this field when converted into JSON
+        dict. This is None if this field is not a reference field.
+        """
+        if not self._cdef._ref_names_resolved:
+            self._cdef._resolve_ref_names_if_needed()
+        return self._json_ref_key
 
     @property
     def default(self: JField) -> Any:
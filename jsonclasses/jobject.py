@@ -3,11 +3,15 @@ confirm to.
 """
 from __future__ import annotations
 from typing import (
-    Any, Callable, TypeVar, Optional, ClassVar, Protocol, Set, TYPE_CHECKING
+    Any, IO, Callable, Iterable, Iterator, TypeVar, Optional, ClassVar,
+    Protocol, Set, TYPE_CHECKING
 )
 if TYPE_CHECKING:
     from .cdef import Cdef
     from .fdef import Fdef
+    from .mgraph import MGraph
+    from .ingest import IngestBatch
+    from .bulk import BulkResult
     from .odict import OwnedDict
     from .olist import OwnedList
     from .jfield import JField
@@ -31,6 +35,23 @@ class JObject(Protocol):
         """
         ...
 
+    @classmethod
+    def from_many(cls: type[T], items: Iterable[dict[str, Any]]) -> list[T]:
+        """The from_many class method initializes objects from a list of
+        dicts in a batch. Objects with a same primary key are initialized
+        into a single object.
+        """
+        ...
+
+    @classmethod
+    def ingest(cls: type[T], stream: IO, batch_size: int = 1000,
+               chunk_size: int = 65536,
+               encoding: str = 'utf-8') -> Iterator[IngestBatch]:
+        """The ingest class method reads a JSON dump incrementally and yields
+        validated objects and errors of records in batches.
+        """
+        ...
+
     def set(self: T, **kwargs: dict[str, Any]) -> T:
         """The set method takes keyword arguments to update the field values of
         the object. Invalid fields are filtered. Eager validation are
@@ -53,12 +74,27 @@ class JObject(Protocol):
         """
         ...
 
+    @classmethod
+    def tojson_many(cls: type[T], objects: Iterable[JObject],
+                    ignore_writeonly: bool | None = False,
+                    reverse_relationship: bool | None = False,
+                    output_null: bool | None = None,
+                    stream: bool = False
+                    ) -> list[dict[str, Any]] | Iterator[dict[str, Any]]:
+        """The tojson_many class method converts objects into json dicts in a
+        batch. It returns a generator if `stream` is True.
+        """
+        ...
+
     def validate(self: T, all_fields: Optional[bool]) -> T:
         """This validate method validates the JSON class object. It raises if
         it's not valid.
         """
         ...
 
+    def _validate(self: T, all_fields: Optional[bool],
+                  mgraph: MGraph) -> None: ...
+
     @property
     def is_valid(self: T) -> bool: ...
 
@@ -98,17 +134,69 @@ class JObject(Protocol):
         """
         ...
 
+    @classmethod
+    def save_many(cls: type[T], objects: Iterable[JObject],
+                  validate_all_fields: bool = False,
+                  skip_validation: bool = False) -> BulkResult:
+        """The save_many class method saves objects in a batch. Objects
+        which are not saved are reported per item.
+        """
+        ...
+
+    def _save_plan(self: T) -> tuple[list[JObject], list[JObject]]: ...
+
+    def _prepare_save(self: T,
+                      validate_all_fields: bool = False,
+                      skip_validation: bool = False
+                      ) -> tuple[list[JObject], list[JObject]]: ...
+
     def delete(self: T) -> T: ...
 
+    @classmethod
+    def delete_many(cls: type[T], objects: Iterable[JObject]) -> BulkResult:
+        """The delete_many class method deletes objects in a batch. Objects
+        which are not deleted are reported per item.
+        """
+        ...
+
     def restore(self: T) -> T: ...
 
     def complete(self: T) -> T: ...
 
     def include(self: T, field_name: str) -> T: ...
 
+    @classmethod
+    def include_many(cls: type[T], objects: Iterable[JObject],
+                     keypath: str) -> list[JObject]: ...
+
+    async def asave(self: T,
+                    validate_all_fields: Optional[bool] = None,
+                    skip_validation: Optional[bool] = None) -> T: ...
+
+    async def adelete(self: T) -> T: ...
+
+    async def arestore(self: T) -> T: ...
+
+    async def acomplete(self: T) -> T: ...
+
+    async def ainclude(self: T, field_name: str) -> T: ...
+
+    @classmethod
+    async def ainclude_many(cls: type[T], objects: Iterable[JObject],
+                            keypath: str) -> list[JObject]: ...
+
+    def _include_plan(self: T,
+                      field_name: str) -> tuple[Any, Callable[[Any], Any]]: ...
+
+    def _init(self: T,
+              single_kwargs: dict[str, Any],
+              compound_kwargs: dict[str, Any],
+              mgraph: Optional[MGraph] = None) -> None: ...
+
     def _set(self: T,
              kwargs: dict[str, Any],
-             fill_blanks: Optional[bool]) -> None: ...
+             fill_blanks: Optional[bool],
+             mgraph: Optional[MGraph] = None) -> None: ...
 
     def _keypath_set(self: T, kwargs: dict[str, Any]) -> None: ...
 
@@ -121,6 +209,8 @@ class JObject(Protocol):
 
     def _orm_complete(self: T) -> None: ...
 
+    async def _aorm_complete(self: T) -> None: ...
+
     @property
     def _data_dict(self: T) -> dict[str, Any]: ...
 
@@ -150,16 +240,28 @@ class JObject(Protocol):
 
     def _clear_unlinked_object(self: T) -> None: ...
 
-    def _set_on_save(self: T) -> None: ...
+    def _set_on_save(self: T, mgraph: Optional[MGraph] = None) -> None: ...
 
     def _clear_temp_fields(self: T) -> None: ...
 
     def _database_write(self: T) -> None: ...
 
+    def _database_write_many(self: T, objects: list[JObject],
+                             roots: list[JObject]) -> None: ...
+
     def _orm_delete(self: T) -> None: ...
 
     def _orm_restore(self: T) -> None: ...
 
+    async def _adatabase_write(self: T) -> None: ...
+
+    async def _adatabase_write_many(self: T, objects: list[JObject],
+                                    roots: list[JObject]) -> None: ...
+
+    async def _aorm_delete(self: T) -> None: ...
+
+    async def _aorm_restore(self: T) -> None: ...
+
     def _can_cu_check_common(self: T,
                              callbacks: list[Callable | Types],
                              action: str) -> None: ...
@@ -5,6 +5,7 @@ that encodes JSON Classes objects.
 from typing import Any
 from json.encoder import JSONEncoder as PythonDefaultJSONEncoder
 from .jobject import JObject
+from .isjsonclass import isjsonobject
 
 
 class JSONEncoder(PythonDefaultJSONEncoder):
@@ -15,8 +16,16 @@ class JSONEncoder(PythonDefaultJSONEncoder):
       from jsonclasses import JSONEncoder
 
       dumps(obj, cls=JSONEncoder)
+
+    A list of jsonclasses objects is converted in a batch with `tojson_many`.
     """
 
     def default(self, o: Any):
         return o.tojson() if hasattr(o.__class__, '__is_jsonclass__') \
             else super().default(o)
+
+    def iterencode(self, o: Any, _one_shot: bool = False):
+        if isinstance(o, (list, tuple)) and len(o) > 0 \
+                and all(isjsonobject(item) for item in o):
+            o = o[0].__class__.tojson_many(o)
+        return super().iterencode(o, _one_shot)
@@ -0,0 +1,233 @@
+"""
+This module contains `JSONWriter`, the writer which writes JSON Classes objects
+to a stream as JSON text incrementally, without building the JSON dict of the
+whole object graph.
+"""
+from __future__ import annotations
+from typing import Any, IO, Iterator, Optional, TYPE_CHECKING
+from io import BufferedIOBase, RawIOBase
+from json.encoder import encode_basestring_ascii
+from .ctx import Ctx, CtxCfg
+from .mgraph import MGraph
+from .isjsonclass import isjsonobject
+from .json_encoder import JSONEncoder
+from .modifiers.instanceof_modifier import InstanceOfModifier
+from .modifiers.listof_modifier import ListOfModifier
+if TYPE_CHECKING:
+    from .jobject import JObject
+    from .oplan import OField
+
+
+def _scalar(value: Any) -> Optional[str]:
+    """Encode a scalar value like `JSONEncoder` without the encoder machinery.
+    None is returned for other values.
+    """
+    cls = value.__class__
+    if cls is str:
+        return encode_basestring_ascii(value)
+    if cls is int:
+        return int.__repr__(value)
+    if value is None:
+        return 'null'
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    return None
+
+
+class _Keys(dict):
+    """Encoded JSON keys with the key separator, encoded on first use."""
+
+    def __missing__(self, key: str) -> str:
+        text = encode_basestring_ascii(key) + ': '
+        self[key] = text
+        return text
+
+
+class JSONWriter:
+    """The JSONWriter writes JSON Classes objects to a text or binary stream.
+    Objects are walked with their output plans, thus the output is identical
+    to the output of `tojson`. Nested objects and lists of objects are written
+    as they are walked, other values are encoded with `JSONEncoder`. Written
+    text is buffered and written to the stream in chunks.
+
+      from jsonclasses import JSONWriter
+
+      with open('users.json', 'w') as file:
+          JSONWriter(file).write(users)
+
+    A list, a tuple or an iterator of objects is written as a JSON array, each
+    object is converted like it's converted with `tojson` on its own.
+    """
+
+    def __init__(self: JSONWriter,
+                 stream: IO,
+                 ignore_writeonly: bool = False,
+                 reverse_relationship: bool = False,
+                 output_null: bool | None = None,
+                 chunk_size: int = 65536,
+                 encoding: str = 'utf-8') -> None:
+        """Create a JSON writer.
+
+        Args:
+            stream (IO): A writable text or binary stream. Text is encoded \
+                with `encoding` for a binary stream.
+            ignore_writeonly (bool): Whether ignore writeonly marks on fields.
+            reverse_relationship (bool): Whether including reverse \
+                relationship in json outputs.
+            output_null (bool): Whether output null instead of leaving \
+                unexisting fields for null values.
+            chunk_size (int): The number of buffered characters which \
+                triggers writing to the stream.
+            encoding (str): The encoding of a binary stream.
+        """
+        self._stream = stream
+        self._binary = isinstance(stream, (RawIOBase, BufferedIOBase))
+        self._encoding = encoding
+        self._chunk_size = chunk_size
+        self._buffer: list[str] = []
+        self._size = 0
+        self._ctxcfg = CtxCfg(ignore_writeonly=ignore_writeonly,
+                              reverse_relationship=reverse_relationship,
+                              output_null=output_null)
+        self._encoder = JSONEncoder()
+        self._checks: dict[type, bool] = {}
+        self._keys = _Keys()
+
+    def write(self: JSONWriter, value: Any) -> None:
+        """Write a value as a JSON document and flush it to the stream.
+
+        Args:
+            value (Any): A JSON Class object, a list, a tuple or an iterator \
+                of values, or a value which `JSONEncoder` encodes.
+        """
+        self._write_value(value, MGraph())
+        self.flush()
+
+    def flush(self: JSONWriter) -> None:
+        """Write buffered text to the stream and flush the stream.
+        """
+        self._write_chunk()
+        flush = getattr(self._stream, 'flush', None)
+        if flush is not None:
+            flush()
+
+    def _emit(self: JSONWriter, text: str) -> None:
+        self._buffer.append(text)
+        self._size += len(text)
+        if self._size >= self._chunk_size:
+            self._write_chunk()
+
+    def _write_chunk(self: JSONWriter) -> None:
+        if not self._buffer:
+            return
+        chunk = ''.join(self._buffer)
+        self._buffer = []
+        self._size = 0
+        if self._binary:
+            self._stream.write(chunk.encode(self._encoding))
+        else:
+            self._stream.write(chunk)
+
+    def _write_json(self: JSONWriter, value: Any) -> None:
+        text = _scalar(value)
+        if text is not None:
+            self._emit(text)
+            return
+        for text in self._encoder.iterencode(value):
+            self._emit(text)
+
+    def _write_value(self: JSONWriter, value: Any, mgraph: MGraph) -> None:
+        if isjsonobject(value):
+            self._write_root(value, mgraph)
+        elif isinstance(value, (list, tuple, Iterator)):
+            self._emit('[')
+            for i, item in enumerate(value):
+                if i > 0:
+                    self._emit(', ')
+                self._write_value(item, mgraph)
+            self._emit(']')
+        else:
+            self._write_json(value)
+
+    def _write_root(self: JSONWriter, object: JObject, mgraph: MGraph) -> None:
+        cls = object.__class__
+        check = self._checks.get(cls)
+        if check is None:
+            check = len(cls.cdef.jconf.can_read) > 0
+            self._checks[cls] = check
+        if check:
+            object._can_read_check()
+        self._write_object(Ctx.rootctx(object, self._ctxcfg, None, mgraph))
+
+    def _write_object(self: JSONWriter, ctx: Ctx) -> None:
+        cls = ctx.val.__class__
+        oplan = cls.cdef.oplan(ctx.ctxcfg)
+        if oplan is None:
+            self._write_json(InstanceOfModifier(cls).tojson(ctx))
+            return
+        output_null = oplan.output_null
+        keys = self._keys
+        first = True
+        self._emit('{')
+        for key, f, value in oplan.entries(ctx):
+            if f is None or f.passthrough:
+                if value is None and not output_null:
+                    continue
+                self._emit(keys[key] if first else ', ' + keys[key])
+                self._write_json(value)
+            else:
+                ictx = oplan.field_ctx(ctx, f, value)
+                walked = self._walked(f, ictx)
+                if walked is None:
+                    value = f.modifier.tojson(ictx)
+                if value is None and not output_null:
+                    continue
+                self._emit(keys[key] if first else ', ' + keys[key])
+                if walked is None:
+                    self._write_json(value)
+                elif walked is InstanceOfModifier:
+                    self._write_item(ictx)
+                else:
+                    self._write_items(ictx)
+            first = False
+        self._emit('}')
+
+    def _walked(self: JSONWriter, f: OField, ctx: Ctx) -> Optional[type]:
+        """Get the modifier class of a field value which is written as it's
+        walked. None is returned if the value should be converted with the
+        field modifier.
+        """
+        jvs = f.modifier.jvs
+        if len(jvs) != 1:
+            return None
+        value = ctx.val
+        if isinstance(jvs[0], InstanceOfModifier):
+            if value is None or isjsonobject(value):
+                return InstanceOfModifier
+        elif isinstance(jvs[0], ListOfModifier):
+            if value is None:
+                return InstanceOfModifier
+            if isinstance(value, list):
+                ijvs = ctx.fdef.item_types.modifier.jvs
+                if len(ijvs) == 1 and isinstance(ijvs[0], InstanceOfModifier):
+                    return ListOfModifier
+        return None
+
+    def _write_items(self: JSONWriter, ctx: Ctx) -> None:
+        itypes = ctx.fdef.item_types
+        self._emit('[')
+        for i, item in enumerate(ctx.val):
+            if i > 0:
+                self._emit(', ')
+            self._write_item(ctx.colval(item, i, itypes.fdef, ctx.val))
+        self._emit(']')
+
+    def _write_item(self: JSONWriter, ctx: Ctx) -> None:
+        if ctx.val is None:
+            self._emit('null')
+        elif isjsonobject(ctx.val):
+            self._write_object(ctx)
+        else:
+            self._write_json(ctx.val)
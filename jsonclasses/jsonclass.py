@@ -13,7 +13,8 @@ from .jconf import (
 )
 from .jfield import JField
 from .cdef import Cdef
-from .jsonclassify import jsonclassify
+from .jsonclassify import jsonclassify, install_calc_getattribute
+from .slots import slotify
 from .jobject import JObject
 if TYPE_CHECKING:
     from .types import Types
@@ -46,6 +47,8 @@ def jsonclass(
     can_update: CanUpdate | list[CanUpdate] | Types | None = None,
     can_delete: CanDelete | list[CanDelete] | Types | None = None,
     can_read: CanRead | list[CanRead] | Types | None = None,
+    compiled: Optional[bool] = None,
+    slots: Optional[bool] = None,
 ) -> Callable[[T], T | type[JObject]]: ...
 
 
@@ -69,6 +72,8 @@ def jsonclass(
     can_update: CanUpdate | list[CanUpdate] | Types | None = None,
     can_delete: CanDelete | list[CanDelete] | Types | None = None,
     can_read: CanRead | list[CanRead] | Types | None = None,
+    compiled: Optional[bool] = None,
+    slots: Optional[bool] = None,
 ) -> T | type[JObject]: ...
 
 
@@ -91,6 +96,8 @@ def jsonclass(
     can_update: CanUpdate | list[CanUpdate] | Types | None = None,
     can_delete: CanDelete | list[CanDelete] | Types | None = None,
     can_read: CanRead | list[CanRead] | Types | None = None,
+    compiled: Optional[bool] = None,
+    slots: Optional[bool] = None,
 ) -> Union[Callable[[T], T | type[JObject]], T | type[JObject]]:
     """The jsonclass object class decorator. To declare a jsonclass class, use
     this syntax:
@@ -122,11 +129,17 @@ def jsonclass(
             can_create=can_create,
             can_update=can_update,
             can_delete=can_delete,
-            can_read=can_read)
+            can_read=can_read,
+            compiled=compiled,
+            slots=slots)
         dcls: type = dataclass(init=False)(cls)
         jcls = jsonclassify(dcls)
         cdef = Cdef(jcls, jconf)
+        if jconf.slots:
+            jcls = slotify(jcls, cdef)
+            cdef = Cdef(jcls, jconf)
         jcls.cdef = cdef
+        install_calc_getattribute(jcls)
         jconf.cgraph.put(cdef)
         return jcls
     else:
@@ -149,5 +162,7 @@ def jsonclass(
                 can_create=can_create,
                 can_update=can_update,
                 can_delete=can_delete,
-                can_read=can_read)
+                can_read=can_read,
+                compiled=compiled,
+                slots=slots)
         return parametered_jsonclass
@@ -1,7 +1,7 @@
 """This module defines the `jsonclassify` function."""
 from __future__ import annotations
-from typing import Any, Callable, Optional, Union, cast
-from inspect import signature, getmro
+from typing import Any, Callable, Iterable, Iterator, Optional, Union, cast
+from asyncio import gather
 from .jobject import JObject
 from .ctx import Ctx, CtxCfg
 from .fdef import Fdef, FStore, FType
@@ -9,7 +9,13 @@ from .types import Types
 from .modifiers.instanceof_modifier import InstanceOfModifier
 from .jfield import JField
 from .isjsonclass import isjsonobject
+from .arity import param_count
 from .ograph import OGraph
+from .mgraph import MGraph
+from .identity_map import current_identity_map
+from .ingest import ingest
+from .bulk import save_many, delete_many
+from .vgraph import mark_dirty, stamp
 from .odict import OwnedDict
 from .olist import OwnedList
 from .outils import (
@@ -35,25 +41,104 @@ def __init__(self: JObject, **kwargs: dict[str, Any]) -> None:
     """
     if self.__class__.cdef.jconf.abstract:
         raise AbstractJSONClassException(self.__class__)
+    self._init(single_key_args(kwargs), compound_key_args(kwargs))
+
+
+def _init(self: JObject,
+          single_kwargs: dict[str, Any],
+          compound_kwargs: dict[str, Any],
+          mgraph: Optional[MGraph] = None) -> None:
+    """Initialize a jsonclass object internally with arguments which are
+    already split into single keys and compound keys.
+    """
+    names, refs = self.__class__.cdef.blank_plan
     self._set_initial_status()
-    for field in self.__class__.cdef.fields:
-        if field.fdef.fstore != FStore.CALCULATED:
-            setattr(self, field.name, None)
+    for name in names:
+        self.__original_setattr__(name, None)
+    for field in refs:
+        setattr(self, field.name, None)
         if field.fdef.fstore == FStore.LOCAL_KEY:
-            transformer = self.__class__.cdef.jconf.ref_key_encoding_strategy
-            local_key = transformer(field)
+            local_key = field.ref_key
             if field.fdef.ftype == FType.LIST:
                 setattr(self, local_key, to_owned_list(self, [], local_key))
             else:
                 setattr(self, local_key, None)
-            self._local_keys.add(local_key)
-            self._local_key_map[local_key] = field.name
-    self._set(single_key_args(kwargs), fill_blanks=True)
-    self._keypath_set(compound_key_args(kwargs))
-    try:
-        self._graph.put(self)
-    except UnlinkableJSONClassException:
-        pass
+    self._set(single_kwargs, fill_blanks=True, mgraph=mgraph)
+    if compound_kwargs:
+        self._keypath_set(compound_kwargs)
+    graph = self._graph
+    if graph is False:
+        self._graph = OGraph(self)
+    else:
+        try:
+            graph.put(self)
+        except UnlinkableJSONClassException:
+            pass
+
+
+def from_many(cls: type[JObject],
+              items: Iterable[dict[str, Any]]) -> list[JObject]:
+    """Initialize jsonclass objects from a list of dicts in a batch. This
+    method is suitable for accepting web inputs like JSON arrays. Every
+    object is initialized like it's initialized individually, except that
+    objects are initialized with a shared mark graph. Objects with a same
+    primary key, either top level or nested, are initialized into a single
+    object, later values are applied to the existing object like `set`.
+    Inside an identity map session, objects of the session are reused the
+    same way.
+
+    Args:
+        items (Iterable[dict[str, Any]]): The inputs of the objects.
+
+    Returns:
+        list[JObject]: The initialized objects in the order they first \
+            appear at top level. Items with a primary key which is seen \
+            before, either top level or nested, don't produce new objects.
+    """
+    if cls.cdef.jconf.abstract:
+        raise AbstractJSONClassException(cls)
+    pfield = cls.cdef.primary_field
+    pkey = pfield.name if pfield is not None else None
+    mgraph = MGraph()
+    imap = current_identity_map()
+    splits: dict[tuple[str, ...], tuple[list[str], list[str]]] = {}
+    result: list[JObject] = []
+    listed: set[int] = set()
+    for item in items:
+        keys = tuple(item)
+        split = splits.get(keys)
+        if split is None:
+            compound = compound_key_args(item)
+            split = ([k for k in keys if k not in compound], list(compound))
+            splits[keys] = split
+        single_keys, compound_keys = split
+        if compound_keys:
+            single = {k: item[k] for k in single_keys}
+            compound = {k: item[k] for k in compound_keys}
+        else:
+            single = item
+            compound = {}
+        pvalue = item.get(pkey) if pkey is not None else None
+        exist_item = None
+        if pvalue is not None:
+            exist_item = mgraph.getp(cls, pvalue)
+            if exist_item is None and imap is not None:
+                exist_item = imap.get(cls, pvalue)
+                if exist_item is not None:
+                    mgraph.putp(pvalue, exist_item)
+        if exist_item is not None:
+            exist_item._set(single, fill_blanks=False, mgraph=mgraph)
+            if compound:
+                exist_item._keypath_set(compound)
+            if id(exist_item) not in listed:
+                listed.add(id(exist_item))
+                result.append(exist_item)
+            continue
+        obj = cls.__new__(cls)
+        obj._init(single, compound, mgraph)
+        listed.add(id(obj))
+        result.append(obj)
+    return result
 
 
 def jsonobject_set(self: JObject, **kwargs: dict[str, Any]) -> JObject:
@@ -70,10 +155,11 @@ def jsonobject_set(self: JObject, **kwargs: dict[str, Any]) -> JObject:
 
 
 def _set(self: JObject,
-         kwargs: dict[str, Any], fill_blanks: bool = False) -> None:
+         kwargs: dict[str, Any], fill_blanks: bool = False,
+         mgraph: Optional[MGraph] = None) -> None:
     """Set values of a jsonclass object internally."""
     ctxcfg = CtxCfg(fill_dest_blanks=fill_blanks, all_fields=False)
-    ctx = Ctx.rootctx(self, ctxcfg, kwargs)
+    ctx = Ctx.rootctx(self, ctxcfg, kwargs, mgraph)
     InstanceOfModifier(self.__class__).transform(ctx)
 
 
@@ -166,6 +252,58 @@ def tojson(self: JObject,
     return InstanceOfModifier(self.__class__).tojson(ctx)
 
 
+def tojson_many(cls: type[JObject],
+                objects: Iterable[JObject],
+                ignore_writeonly: bool = False,
+                reverse_relationship: bool = False,
+                output_null: bool | None = None,
+                stream: bool = False
+                ) -> Union[list[dict[str, Any]], Iterator[dict[str, Any]]]:
+    """Convert JSON Class objects to JSON dicts in a batch. Each output is
+    identical to the output of `tojson` of the object. Read permission
+    configurations and output plans are looked up once per class.
+
+    Args:
+        objects (Iterable[JObject]): The objects to convert. Objects are not \
+            required to be instances of this class.
+        ignore_writeonly (bool): Whether ignore writeonly marks on fields.
+        reverse_relationship (bool): Whether including reverse relationship \
+            in json outputs.
+        output_null (bool): Whether output null instead of leaving \
+            unexisting fields for null values.
+        stream (bool): Whether return a generator which converts an object \
+            when its output is requested. Read permission of an object is \
+            checked when it's reached.
+
+    Returns:
+        Union[list[dict[str, Any]], Iterator[dict[str, Any]]]: The JSON dicts \
+            in the order of the objects.
+    """
+    ctxcfg = CtxCfg(ignore_writeonly=ignore_writeonly,
+                    reverse_relationship=reverse_relationship,
+                    output_null=output_null)
+    outputs = _tojson_many(objects, ctxcfg)
+    return outputs if stream else list(outputs)
+
+
+def _tojson_many(objects: Iterable[JObject],
+                 ctxcfg: CtxCfg) -> Iterator[dict[str, Any]]:
+    mgraph = MGraph()
+    plans: dict[type, tuple[bool, Any]] = {}
+    for object in objects:
+        cls = object.__class__
+        plan = plans.get(cls)
+        if plan is None:
+            oplan = cls.cdef.oplan(ctxcfg)
+            plan = (len(cls.cdef.jconf.can_read) > 0,
+                    oplan if oplan is not None else InstanceOfModifier(cls))
+            plans[cls] = plan
+        check, output = plan
+        if check:
+            object._can_read_check()
+        yield output.tojson(Ctx.rootctx(object, ctxcfg, None, mgraph))
+
+
 def validate(self: JObject, all_fields: Optional[bool] = None) -> JObject:
     """Validate the jsonclass object's validity. Raises ValidationException
     on validation failed.
@@ -178,12 +316,28 @@ def validate(self: JObject, all_fields: Optional[bool] = None) -> JObject:
     Returns:
         None: upon successful validation, returns nothing.
     """
-    ctxcfg = CtxCfg(all_fields=all_fields)
-    ctx = Ctx.rootctx(self, ctxcfg)
-    InstanceOfModifier(self.__class__).validate(ctx)
+    vgraph = self._vgraph
+    if vgraph is not None and vgraph.is_clean(self, self._operator):
+        return self
+    mgraph = MGraph()
+    self._validate(all_fields, mgraph)
+    stamp(mgraph, self._operator)
     return self
 
 
+def _validate(self: JObject, all_fields: Optional[bool],
+              mgraph: MGraph) -> None:
+    """Validate this object without stamping. Objects marked in `mgraph` are
+    not validated again, thus a mark graph can be shared by validations of
+    several objects.
+    """
+    vgraph = self._vgraph
+    if vgraph is not None and vgraph.is_clean(self, self._operator):
+        return
+    ctx = Ctx.rootctx(self, CtxCfg(all_fields=all_fields), None, mgraph)
+    InstanceOfModifier(self.__class__).validate(ctx)
+
+
 @property
 def is_valid(self: JObject) -> bool:
     """Test whether the jsonclass object is valid or not. This method
@@ -213,10 +367,10 @@ def opby(self: JObject, operator: Any) -> JObject:
     if self.is_new:
         class_def = self.__class__.cdef
         for field in class_def.assign_operator_fields:
-            fidname = self.__class__.cdef.jconf.ref_key_encoding_strategy(field)
+            fidname = field.ref_key
             if field.fdef.operator_assign_transformer is not None:
                 transformer = field.fdef.operator_assign_transformer
-                params_len = len(signature(transformer).parameters)
+                params_len = param_count(transformer)
                 if params_len == 1:
                     setattr(self, fidname, transformer(operator)._id)
                 elif params_len == 2:
@@ -315,24 +469,122 @@ def save(self: JObject,
          skip_validation: bool = False) -> JObject:
     """Save this object into database. This will not write if no storage
     modifier is used.
+
+    Objects unlinked from the saving graph are saved with this object. Every
+    object is validated and gets setonsave called once, then the objects
+    to write are handed to `_database_write_many` in a batch.
     """
-    self._can_create_or_update_check()
-    if self.is_new:
-        self._run_on_create_callbacks()
-    else:
-        self._run_on_update_callbacks()
-    if not skip_validation:
-        self.validate(all_fields=validate_all_fields)
-    self._set_on_save()
-    self._database_write()
-    for _, lst in self.unlinked_objects.items():
-        for item in lst:
-            lst.remove(item)
-            item.save(validate_all_fields=validate_all_fields,
-                      skip_validation=skip_validation)
+    roots, objects = self._prepare_save(validate_all_fields, skip_validation)
+    mgraph = MGraph()
+    for root in roots:
+        root._set_on_save(mgraph)
+    self._database_write_many(objects, roots)
+    for object in objects:
+        for lst in object.unlinked_objects.values():
+            lst.clear()
     return self
 
 
+def _prepare_save(self: JObject,
+                  validate_all_fields: bool = False,
+                  skip_validation: bool = False
+                  ) -> tuple[list[JObject], list[JObject]]:
+    """Plan saving this object, run permission checks and callbacks of the
+    roots and validate the objects. Nothing is written.
+
+    Returns:
+        tuple[list[JObject], list[JObject]]: The roots and the objects to \
+            write. See `_save_plan`.
+    """
+    roots, objects = self._save_plan()
+    for root in roots:
+        root._can_create_or_update_check()
+        if root.is_new:
+            root._run_on_create_callbacks()
+        else:
+            root._run_on_update_callbacks()
+    if not skip_validation:
+        mgraph = MGraph()
+        for root in roots:
+            root._validate(validate_all_fields, mgraph)
+        stamp(mgraph, self._operator)
+    return roots, objects
+
+
+def _save_plan(self: JObject) -> tuple[list[JObject], list[JObject]]:
+    """Plan saving this object. The object graph is walked with a work
+    queue, objects unlinked from walked objects are walked as well.
+
+    Returns:
+        tuple[list[JObject], list[JObject]]: The roots and the objects to \
+            write. The roots are this object and unlinked objects, each \
+            object of the graph is reachable from a root. The objects to \
+            write are the roots and new or modified objects, objects are \
+            ordered after objects they hold local keys of.
+    """
+    mgraph = MGraph()
+    mgraph.put(self)
+    roots: list[JObject] = [self]
+    root_ids: set[int] = {id(self)}
+    dirty: dict[int, JObject] = {id(self): self}
+    queue: list[JObject] = [self]
+    while queue:
+        object = queue.pop()
+        for field in object.__class__.cdef.ref_fields:
+            value = getattr(object, field.name)
+            items = value if isinstance(value, list) else (value,)
+            for item in items:
+                if item is not None and not mgraph.has(item):
+                    mgraph.put(item)
+                    queue.append(item)
+                    if item.is_new or item.is_modified:
+                        dirty[id(item)] = item
+        for lst in object.unlinked_objects.values():
+            for item in lst:
+                if id(item) not in root_ids:
+                    root_ids.add(id(item))
+                    roots.append(item)
+                    dirty[id(item)] = item
+                if not mgraph.has(item):
+                    mgraph.put(item)
+                    queue.append(item)
+    return roots, _save_order(dirty)
+
+
+def _save_order(objects: dict[int, JObject]) -> list[JObject]:
+    """Order objects after objects they hold local keys of. A reference
+    cycle is broken at the object where it's found.
+    """
+    order: list[JObject] = []
+    done: dict[int, bool] = {}
+    for object in objects.values():
+        if id(object) in done:
+            continue
+        done[id(object)] = False
+        stack = [(object, _save_deps(object))]
+        while stack:
+            node, deps = stack[-1]
+            for dep in deps:
+                if id(dep) in objects and id(dep) not in done:
+                    done[id(dep)] = False
+                    stack.append((dep, _save_deps(dep)))
+                    break
+            else:
+                stack.pop()
+                done[id(node)] = True
+                order.append(node)
+    return order
+
+
+def _save_deps(object: JObject) -> Iterator[JObject]:
+    for field in object.__class__.cdef.local_key_fields.values():
+        value = getattr(object, field.name)
+        if isinstance(value, list):
+            yield from (item for item in value if item is not None)
+        elif value is not None:
+            yield value
+
+
 def delete(self: JObject) -> JObject:
     """Delete this object from database and clear linked relationships with
     delete rule.
@@ -363,9 +615,75 @@ def complete(self: JObject) -> JObject:
     return self
 
 
+async def asave(self: JObject,
+                validate_all_fields: bool = False,
+                skip_validation: bool = False) -> JObject:
+    """Save this object into database asynchronously. Objects are planned,
+    checked and validated like `save` does, then the objects to write are
+    handed to `_adatabase_write_many` in a batch.
+    """
+    roots, objects = self._prepare_save(validate_all_fields, skip_validation)
+    mgraph = MGraph()
+    for root in roots:
+        root._set_on_save(mgraph)
+    await self._adatabase_write_many(objects, roots)
+    for object in objects:
+        for lst in object.unlinked_objects.values():
+            lst.clear()
+    return self
+
+
+async def adelete(self: JObject) -> JObject:
+    """Delete this object from database asynchronously and clear linked
+    relationships with delete rule.
+    """
+    self._can_delete_check()
+    self._run_on_delete_callbacks()
+    await self._aorm_delete()
+    return self
+
+
+async def arestore(self: JObject) -> JObject:
+    """Restore this object from database asynchronously and setup lost
+    relationships with delete rule.
+    """
+    await self._aorm_restore()
+    return self
+
+
+async def acomplete(self: JObject) -> JObject:
+    """Fetch missing field values from the underlying ORM asynchronously.
+    """
+    if self.is_partial:
+        saved_modified_fields = list(self._modified_fields)
+        saved_is_modified = self._is_modified
+        await self._aorm_complete()
+        self._is_modified = saved_is_modified
+        self._modified_fields = saved_modified_fields
+    return self
+
+
 def include(self: JObject, field_name: str) -> JObject:
     """Fetch objects on reference field.
     """
+    query, assign = self._include_plan(field_name)
+    assign(query.exec() if query is not None else None)
+    return self
+
+
+async def ainclude(self: JObject, field_name: str) -> JObject:
+    """Fetch objects on reference field asynchronously.
+    """
+    query, assign = self._include_plan(field_name)
+    assign(await query if query is not None else None)
+    return self
+
+
+def _include_plan(self: JObject,
+                  field_name: str) -> tuple[Any, Callable[[Any], Any]]:
+    """Get the query which fetches objects on reference field and the
+    function which assigns the query result.
+    """
     field = self.__class__.cdef.field_named(field_name)
     if field.fdef.ftype == FType.INSTANCE:
         cls = cast(ORMObject, field.fdef.inst_cls)
@@ -373,37 +691,168 @@ def include(self: JObject, field_name: str) -> JObject:
         cls = field.fdef.item_types.fdef.inst_cls
     modified_fields = self.modified_fields
     is_modified = self.is_modified
+    query = None
     if field.fdef.fstore == FStore.LOCAL_KEY:
         if field.fdef.ftype == FType.INSTANCE:
-            rkes = self.__class__.cdef.jconf.ref_key_encoding_strategy
-            ridname = rkes(field)
-            rid = getattr(self, ridname)
-            result = cls.id(rid).exec()
-            setattr(self, field.name, result)
+            query = cls.id(getattr(self, field.ref_key))
         elif field.fdef.ftype == FType.LIST:
-            rkes = self.__class__.cdef.jconf.ref_key_encoding_strategy
-            ridname = rkes(field)
-            rids = getattr(self, ridname)
-            result = cls.ids(rids).exec()
-            setattr(self, field.name, result)
+            query = cls.ids(getattr(self, field.ref_key))
     elif field.fdef.fstore == FStore.FOREIGN_KEY:
         if field.fdef.use_join_table:
-            pass
+            query, assign_many = _include_field_plan([self], field)
+            if query is None:
+                # nothing to fetch, like `include_many`
+                return None, lambda _: assign_many([])
+            return query, assign_many
         elif field.fdef.ftype == FType.INSTANCE:
             ffield = field.foreign_field
-            rkes = cls.cdef.jconf.ref_key_encoding_strategy
-            idref = rkes(ffield)
-            result = cls.one(**{idref: self._id}).exec()
-            setattr(self, field.name, result)
+            query = cls.one(**{ffield.ref_key: self._id})
         elif field.fdef.ftype == FType.LIST:
             ffield = field.foreign_field
-            rkes = cls.cdef.jconf.ref_key_encoding_strategy
-            idref = rkes(ffield)
-            result = cls.find(**{idref: [self._id]}).exec()
+            query = cls.find(**{ffield.ref_key: [self._id]})
+
+    def assign(result: Any) -> None:
+        if query is not None:
             setattr(self, field.name, result)
-    setattr(self, '_modified_fields', set(modified_fields))
-    setattr(self, '_is_modified', is_modified)
-    return self
+        setattr(self, '_modified_fields', set(modified_fields))
+        setattr(self, '_is_modified', is_modified)
+    return query, assign
+
+
+def include_many(cls: type[JObject],
+                 objects: Iterable[JObject],
+                 keypath: str) -> list[JObject]:
+    """Fetch objects on a reference field of objects in a batch. One query is
+    issued for the whole batch through the ORM query protocol instead of one
+    query per object. Fetched objects are assigned to the objects, thus they
+    are linked into the object graphs. Modification status of the objects and
+    fetched objects is kept.
+
+    Objects on a join table field are fetched with a filter on the key list
+    of the other side like `Tag.find(post_ids=[1, 2])`, and fetched objects
+    are expected to carry the key list of the objects they link to.
+
+    Args:
+        objects (Iterable[JObject]): The objects to fetch for. Objects are \
+            not required to be instances of this class.
+        keypath (str): The name of a reference field, or names of reference \
+            fields joined by dots like `'author.profile'`. Each level is \
+            fetched for objects fetched by the previous level.
+
+    Returns:
+        list[JObject]: The objects.
+    """
+    objects = list(objects)
+    level = objects
+    for name in keypath.split('.'):
+        fetched: list[JObject] = []
+        for query, assign in _include_level_plans(level, name):
+            fetched.extend(assign(query.exec() if query is not None else []))
+        level = fetched
+    return objects
+
+
+async def ainclude_many(cls: type[JObject],
+                        objects: Iterable[JObject],
+                        keypath: str) -> list[JObject]:
+    """Fetch objects on a reference field of objects in a batch
+    asynchronously. Queries of a level are awaited concurrently. See
+    `include_many`.
+    """
+    objects = list(objects)
+    level = objects
+    for name in keypath.split('.'):
+        plans = _include_level_plans(level, name)
+        results = await gather(*(query if query is not None else _none([])
+                                 for query, _ in plans))
+        fetched: list[JObject] = []
+        for (_, assign), result in zip(plans, results):
+            fetched.extend(assign(result))
+        level = fetched
+    return objects
+
+
+async def _none(value: Any) -> Any:
+    return value
+
+
+def _include_level_plans(
+        objects: list[JObject],
+        name: str) -> list[tuple[Any, Callable[[Any], list[JObject]]]]:
+    """Get queries and assigning functions of including field `name` on
+    distinct objects, one for each class.
+    """
+    groups: dict[type, list[JObject]] = {}
+    seen: set[int] = set()
+    for object in objects:
+        if id(object) not in seen:
+            seen.add(id(object))
+            groups.setdefault(object.__class__, []).append(object)
+    return [_include_field_plan(owners, owner_cls.cdef.field_named(name))
+            for owner_cls, owners in groups.items()]
+
+
+def _include_field_plan(
+        owners: list[JObject],
+        field: JField) -> tuple[Any, Callable[[Any], list[JObject]]]:
+    """Get the query which fetches objects on `field` of owners and the
+    function which assigns the fetched objects and returns them.
+    """
+    fdef = field.fdef
+    is_list = fdef.ftype == FType.LIST
+    if is_list:
+        cls = cast(ORMObject, fdef.item_types.fdef.inst_cls)
+    else:
+        cls = cast(ORMObject, fdef.inst_cls)
+    query = None
+    if fdef.fstore == FStore.LOCAL_KEY:
+        keys = [getattr(o, field.ref_key) for o in owners]
+        rids = list(dict.fromkeys(
+            k for ks in keys for k in (ks if is_list else [ks])
+            if k is not None))
+        if rids:
+            query = cls.ids(rids)
+    elif fdef.fstore == FStore.FOREIGN_KEY:
+        ffield = field.foreign_field
+        oids = list(dict.fromkeys(o._id for o in owners if o._id is not None))
+        if oids:
+            query = cls.find(**{ffield.ref_key: oids})
+
+    def assign(results: list[JObject]) -> list[JObject]:
+        values: dict[int, Any] = {}
+        if fdef.fstore == FStore.LOCAL_KEY:
+            rmap = {r._id: r for r in results}
+            for owner, ks in zip(owners, keys):
+                if is_list:
+                    values[id(owner)] = [rmap[k] for k in ks if k in rmap]
+                else:
+                    values[id(owner)] = rmap.get(ks)
+        elif fdef.fstore == FStore.FOREIGN_KEY:
+            groups: dict[Any, list[JObject]] = {}
+            for result in results:
+                rkeys = getattr(result, ffield.ref_key, None)
+                if not isinstance(rkeys, list):
+                    rkeys = [rkeys]
+                for rkey in rkeys:
+                    groups.setdefault(rkey, []).append(result)
+            for owner in owners:
+                group = groups.get(owner._id, [])
+                if is_list:
+                    values[id(owner)] = group
+                else:
+                    values[id(owner)] = group[0] if group else None
+        else:
+            return []
+        statuses = [(o, set(o.modified_fields), o.is_modified)
+                    for o in [*owners, *results]]
+        for owner in owners:
+            setattr(owner, field.name, values[id(owner)])
+        for object, modified_fields, is_modified in statuses:
+            setattr(object, '_modified_fields', modified_fields)
+            setattr(object, '_is_modified', is_modified)
+        return results
+    return query, assign
+
 
 def _orm_complete(self: JObject) -> JObject:
     """ORM method override. Fetch missing field values and assign to this object.
@@ -411,15 +860,23 @@ def _orm_complete(self: JObject) -> JObject:
     pass
 
 
+async def _aorm_complete(self: JObject) -> None:
+    """ORM method override. Fetch missing field values asynchronously. The
+    synchronous `_orm_complete` is used by default.
+    """
+    self._orm_complete()
+
+
 @property
 def _data_dict(self: JObject) -> dict[str, Any]:
     """A dict which is a subview of __dict__ that only contains public data
     field items.
     """
     retval = {}
+    local_keys = self.__class__.cdef.local_key_fields
     for k, v in self.__dict__.items():
         if not k.startswith('_'):
-            if k not in self._local_keys:
+            if k not in local_keys:
                 retval[k] = v
     return retval
 
@@ -430,6 +887,7 @@ def _mark_new(self: JObject) -> None:
     setattr(self, '_is_modified', False)
     setattr(self, '_modified_fields', set())
     setattr(self, '_previous_values', {})
+    mark_dirty(self)
 
 
 def _mark_unmodified(self: JObject) -> None:
@@ -442,16 +900,15 @@ def _mark_unmodified(self: JObject) -> None:
 
 def _set_initial_status(self: JObject) -> None:
     """Set the initial status of the JSON class object."""
+    setattr(self, '_vgraph', None)
     self._mark_new()
     setattr(self, '_is_partial', False)
     setattr(self, '_is_deleted', False)
     setattr(self, '_previous_values', {})
-    setattr(self, '_local_keys', set())
-    setattr(self, '_local_key_map', {})
     setattr(self, '_unlinked_objects', {})
     setattr(self, '_link_keys', {})
     setattr(self, '_unlink_keys', {})
-    setattr(self, '_graph', OGraph())
+    setattr(self, '_graph', False)
     setattr(self, '_operator', None)
 
 
@@ -461,16 +918,14 @@ def _mark_not_new(self: JObject) -> None:
 
 
 def _link_local_keys(self: JObject, fname: str, key: str | int) -> None:
-    field = self.__class__.cdef.field_named(fname)
-    ids_name = self.__class__.cdef.jconf.ref_key_encoding_strategy(field)
+    ids_name = self.__class__.cdef.field_named(fname).ref_key
     if getattr(self, ids_name) is None:
         setattr(self, ids_name, [])
     getattr(self, ids_name).append(key)
 
 
 def _unlink_local_keys(self: JObject, fname: str, key: str | int) -> None:
-    field = self.__class__.cdef.field_named(fname)
-    ids_name = self.__class__.cdef.jconf.ref_key_encoding_strategy(field)
+    ids_name = self.__class__.cdef.field_named(fname).ref_key
     if getattr(self, ids_name) is None:
         return
     getattr(self, ids_name).remove(key)
@@ -513,13 +968,13 @@ def _clear_unlinked_object(self: JObject) -> None:
     self._unlinked_objects = {}
 
 
-def _set_on_save(self: JObject) -> None:
+def _set_on_save(self: JObject, mgraph: Optional[MGraph] = None) -> None:
     """Update fields with setonsave marks if this object is modified. This
     is a graph operation. Objects chained with the saving object will also
-    get setonsave called and saved.
+    get setonsave called and saved. Objects marked in `mgraph` are skipped.
     """
     modifier = InstanceOfModifier(self.__class__)
-    ctx = Ctx.rootctx(self, CtxCfg())
+    ctx = Ctx.rootctx(self, CtxCfg(), None, mgraph)
     modifier.serialize(ctx)
 
 
@@ -533,6 +988,22 @@ def _database_write(self: JObject) -> None:
     pass
 
 
+def _database_write_many(self: JObject,
+                         objects: list[JObject],
+                         roots: list[JObject]) -> None:
+    """ORM method override. Write objects saved with this object in a batch.
+
+    Args:
+        objects (list[JObject]): The objects to write. Objects are ordered \
+            after objects they hold local keys of.
+        roots (list[JObject]): The saving object and unlinked objects. By \
+            default, each root is written with `_database_write`, which \
+            writes the graph of the root.
+    """
+    for root in roots:
+        root._database_write()
+
+
 def _orm_delete(self: JObject) -> None:
     pass
 
@@ -541,6 +1012,31 @@ def _orm_restore(self: JObject) -> None:
     pass
 
 
+async def _adatabase_write(self: JObject) -> None:
+    """ORM method override. Write this object asynchronously. The synchronous
+    `_database_write` is used by default.
+    """
+    self._database_write()
+
+
+async def _adatabase_write_many(self: JObject,
+                                objects: list[JObject],
+                                roots: list[JObject]) -> None:
+    """ORM method override. Write objects saved with this object in a batch
+    asynchronously. See `_database_write_many`. By default, roots are
+    written concurrently with `_adatabase_write`.
+    """
+    await gather(*(root._adatabase_write() for root in roots))
+
+
+async def _aorm_delete(self: JObject) -> None:
+    self._orm_delete()
+
+
+async def _aorm_restore(self: JObject) -> None:
+    self._orm_restore()
+
+
 def _can_cu_check_common(self: JObject,
                          callbacks: list[Types | Callable],
                          action: str) -> None:
@@ -588,8 +1084,7 @@ def _can_read_check(self: JObject) -> None:
 
 def _run_on_create_callbacks(self: JObject) -> None:
     for callback in self.__class__.cdef.jconf.on_create:
-        params_len = len(signature(callback).parameters)
-        if params_len == 1:
+        if param_count(callback) == 1:
             callback(self)
         else:
             callback(self, getattr(self, '_operator'))
@@ -597,8 +1092,7 @@ def _run_on_create_callbacks(self: JObject) -> None:
 
 def _run_on_update_callbacks(self: JObject) -> None:
     for callback in self.__class__.cdef.jconf.on_update:
-        params_len = len(signature(callback).parameters)
-        if params_len == 1:
+        if param_count(callback) == 1:
             callback(self)
         else:
             callback(self, getattr(self, '_operator'))
@@ -606,8 +1100,7 @@ def _run_on_update_callbacks(self: JObject) -> None:
 
 def _run_on_delete_callbacks(self: JObject) -> None:
     for callback in self.__class__.cdef.jconf.on_delete:
-        params_len = len(signature(callback).parameters)
-        if params_len == 1:
+        if param_count(callback) == 1:
             callback(self)
         else:
             callback(self, getattr(self, '_operator'))
@@ -621,94 +1114,96 @@ def _id(self: JObject) -> Union[str, int, None]:
     return getattr(self, field.name)
 
 
-def __is_private_attr__(name: str) -> bool:
-    """Returns true if the attribute name indicates private attribute."""
-    return name.startswith('_')
+_MISSING = object()
+"""The sentinel of attributes which are not set yet."""
 
 
 def __setattr__(self: JObject, name: str, value: Any) -> None:
     # use original setattr for private fields
-    if __is_private_attr__(name):
+    if name.startswith('_'):
         self.__original_setattr__(name, value)
         return
-    # use special method for local keys
-    if name in self._local_keys:
-        if value == getattr(self, name):
-            return
-        field_name = self._local_key_map[name]
-        field = self.__class__.cdef.field_named(field_name)
-        if field.fdef.ftype == FType.INSTANCE:
-            if value is None:
-                self.__original_setattr__(name, value)
-                setattr(self, field_name, None)
-            else:
+    cdef = type(self).cdef
+    field = cdef.field_or_none(name)
+    if field is None:
+        # use special method for local keys
+        lfield = cdef.local_key_fields.get(name)
+        if lfield is not None:
+            if value == getattr(self, name, _MISSING):
+                return
+            mark_dirty(self)
+            field_name = lfield.name
+            if lfield.fdef.ftype == FType.INSTANCE:
                 # temporarily set to none if key is modified
                 # in the future, may query object from graph
                 self.__original_setattr__(name, value)
                 setattr(self, field_name, None)
-        elif field.fdef.ftype == FType.LIST:
-            olist = to_owned_list(self, value or [], name)
-            self.__original_setattr__(name, olist)
-            if (value is None) or (value is []):
-                setattr(self, field_name, [])
-            else:
-                new_list = []
-                curvals = getattr(self, field_name)
-                if curvals is None:
-                    curvals = []
-                for item in value:
-                    existitem = next((v for v in curvals if v._id == item), None)
-                    if existitem is not None:
-                        new_list.append(existitem)
-                setattr(self, field_name, new_list)
-        if not self.is_new:
-            setattr(self, '_is_modified', True)
-            self._modified_fields.add(field_name)
-    # use original setattr for non JSON class fields
-    try:
-        field = self.__class__.cdef.field_named(name)
-    except ValueError:
+            elif lfield.fdef.ftype == FType.LIST:
+                olist = to_owned_list(self, value or [], name)
+                self.__original_setattr__(name, olist)
+                if (value is None) or (value is []):
+                    setattr(self, field_name, [])
+                else:
+                    new_list = []
+                    curvals = getattr(self, field_name)
+                    if curvals is None:
+                        curvals = []
+                    for item in value:
+                        existitem = next((v for v in curvals if v._id == item), None)
+                        if existitem is not None:
+                            new_list.append(existitem)
+                    setattr(self, field_name, new_list)
+            if not self._is_new:
+                self._is_modified = True
+                self._modified_fields.add(field_name)
+        # use original setattr for non JSON class fields
         self.__original_setattr__(name, value)
         return
     # this is a JSON class field attribute
-    if field.fdef.fstore == FStore.CALCULATED:
-        if field.fdef.setter is None:
+    fdef = field.fdef
+    if fdef.fstore == FStore.CALCULATED:
+        if fdef.setter is None:
             raise Exception('do not set to readonly calculation field')
         else:
-            if callable(field.fdef.setter):
-                field.fdef.setter(value, self)
+            if callable(fdef.setter):
+                fdef.setter(value, self)
             else:
                 ctx = Ctx.rootctxp(self, name, None, value)
-                field.fdef.setter.modifier.transform(ctx)
+                fdef.setter.modifier.transform(ctx)
             return
-    if hasattr(self, name) and value == getattr(self, name):
-        return
+    try:
+        current = object.__getattribute__(self, name)
+    except AttributeError:
+        exists = False
+    else:
+        exists = True
+        if value == current:
+            return
+    mark_dirty(self)
     # track modified and previous value
-    if not self.is_new:
-        setattr(self, '_is_modified', True)
+    if not self._is_new:
+        self._is_modified = True
         self._modified_fields.add(name)
-        if self.__class__.cdef.jconf.reset_all_fields or \
-                field.fdef.has_reset_modifier:
-            if name not in self.previous_values:
-                self.previous_values[name] = getattr(self, name)
+        if cdef.jconf.reset_all_fields or fdef.has_reset_modifier:
+            if name not in self._previous_values:
+                self._previous_values[name] = getattr(self, name)
     # make list and dict assignments owned and monitored
     if isinstance(value, list):
         value = to_owned_list(self, value, name)
     if isinstance(value, dict):
         value = to_owned_dict(self, value, name)
-    if field.fdef.is_ref:
-        if hasattr(self, name):
-            self.__unlink_field__(field, getattr(self, name))
+    if fdef.is_ref:
+        if exists:
+            self.__unlink_field__(field, current)
         self.__original_setattr__(name, value)
-        if field.fdef.fstore == FStore.LOCAL_KEY:
-            rkes = self.__class__.cdef.jconf.ref_key_encoding_strategy
-            rname = rkes(field)
-            if field.fdef.ftype == FType.INSTANCE:
+        if fdef.fstore == FStore.LOCAL_KEY:
+            rname = field.ref_key
+            if fdef.ftype == FType.INSTANCE:
                 if value is None:
                     self.__original_setattr__(rname, None)
                 if isjsonobject(value):
                     self.__original_setattr__(rname, value._id)
-            elif field.fdef.ftype == FType.LIST:
+            elif fdef.ftype == FType.LIST:
                 if value is None:
                     olist = to_owned_list(self, [], rname)
                     self.__original_setattr__(rname, olist)
@@ -724,22 +1219,31 @@ def __setattr__(self: JObject, name: str, value: Any) -> None:
         self.__original_setattr__(name, value)
 
 
-def __getattribute__(self: JObject, name: str, default: Any = None) -> Any:
-    """This getattr takes calculated fields into account.
+def __getattribute__(self: JObject, name: str) -> Any:
+    """This getattr takes calculated fields into account. This is only
+    installed on classes which have calculated fields.
     """
-    if name.startswith('_'):
-        cls = getmro(type(self))[-2]
-        return super(cls, self).__getattribute__(name)
-    cdef = self.__class__.cdef
-    if name in cdef.calc_field_names:
-        getter = cdef.field_named(name).fdef.getter
-        if callable(getter):
-            return getter(self)
-        else:
-            ctx = Ctx.rootctx(self, CtxCfg(), self)
-            return getter.modifier.transform(ctx)
-    cls = getmro(type(self))[-2]
-    return super(cls, self).__getattribute__(name)
+    if name[:1] != '_':
+        field = type(self).cdef.calc_field_map.get(name)
+        if field is not None:
+            getter = field.fdef.getter
+            if callable(getter):
+                return getter(self)
+            else:
+                ctx = Ctx.rootctx(self, CtxCfg(), self)
+                return getter.modifier.transform(ctx)
+    return object.__getattribute__(self, name)
+
+
+def install_calc_getattribute(class_: type[JObject]) -> None:
+    """Make a JSON class with calculated fields resolve them on attribute
+    access. Classes without calculated fields use the builtin attribute access.
+
+    Args:
+        class_ (type[JObject]): A JSON class with class definition.
+    """
+    if class_.cdef.calc_fields:
+        class_.__getattribute__ = __getattribute__
 
 
 def __odict_will_change__(self: JObject, odict: OwnedDict) -> None:
@@ -760,6 +1264,7 @@ def __odict_will_change__(self: JObject, odict: OwnedDict) -> None:
 
 
 def __odict_add__(self, odict: OwnedDict, key: str, val: Any) -> None:
+    mark_dirty(self)
     if isinstance(val, dict):
         odict[key] = to_owned_dict(self, val,
                                    concat_keypath(odict.keypath, key))
@@ -773,6 +1278,7 @@ def __odict_add__(self, odict: OwnedDict, key: str, val: Any) -> None:
 
 
 def __odict_del__(self, odict: OwnedDict, val: Any) -> None:
+    mark_dirty(self)
     # record modified
     if not self.is_new:
         setattr(self, '_is_modified', True)
@@ -802,9 +1308,11 @@ def __olist_will_change__(self, olist: OwnedList) -> None:
 
 
 def __olist_add__(self: JObject, olist: OwnedList, idx: int, val: Any) -> None:
+    mark_dirty(self)
     cdef = self.__class__.cdef
-    if olist.keypath in self._local_keys:
-        fname = self._local_key_map[olist.keypath]
+    lfield = cdef.local_key_fields.get(olist.keypath)
+    if lfield is not None:
+        fname = lfield.name
         if not self._is_new and fname not in self._modified_fields:
             self._modified_fields.add(fname)
             self._is_modified = True
@@ -816,9 +1324,7 @@ def __olist_add__(self: JObject, olist: OwnedList, idx: int, val: Any) -> None:
     if field is not None and field.fdef.is_ref:
         self.__link_field__(field, [val])
         if field.fdef.fstore == FStore.LOCAL_KEY:
-            rkes = cdef.jconf.ref_key_encoding_strategy
-            rk = rkes(field)
-            rlist = getattr(self, rk)
+            rlist = getattr(self, field.ref_key)
             if len(rlist) != len(olist):
                 if val._id is None:
                     raise ValueError('a referenced object must have a valid primary key')
@@ -836,9 +1342,11 @@ def __olist_add__(self: JObject, olist: OwnedList, idx: int, val: Any) -> None:
 
 
 def __olist_del__(self: JObject, olist: OwnedList, val: Any) -> None:
+    mark_dirty(self)
     cdef = self.__class__.cdef
-    if olist.keypath in self._local_keys:
-        fname = self._local_key_map[olist.keypath]
+    lfield = cdef.local_key_fields.get(olist.keypath)
+    if lfield is not None:
+        fname = lfield.name
         if not self._is_new and fname not in self._modified_fields:
             self._modified_fields.add(fname)
             self._is_modified = True
@@ -859,9 +1367,7 @@ def __olist_del__(self: JObject, olist: OwnedList, val: Any) -> None:
         self.__unlink_field__(field, [val])
         if field.fdef.fstore == FStore.LOCAL_KEY:
             ## TODO: replace the underneath implementation
-            rkes = cdef.jconf.ref_key_encoding_strategy
-            rk = rkes(field)
-            rlist = getattr(self, rk)
+            rlist = getattr(self, field.ref_key)
             if len(rlist) != len(olist):
                 if val is not None and val._id in rlist:
                     rlist.remove(val._id)
@@ -872,6 +1378,7 @@ def __olist_del__(self: JObject, olist: OwnedList, val: Any) -> None:
 
 
 def __olist_sor__(self, olist: OwnedList) -> None:
+    mark_dirty(self)
     # TODO: sort local keys here
     # record modified
     if not self.is_new:
@@ -896,11 +1403,11 @@ def __unlink_field__(self: JObject, field: JField, value: Any) -> None:
             return
         if other_field.fdef.ftype == FType.INSTANCE:
             if getattr(item, other_field.name) is self:
+                mark_dirty(item)
                 item.__original_setattr__(other_field.name, None)
                 of = other_field
                 if of.fdef.fstore == FStore.LOCAL_KEY:
-                    tsfm = item.__class__.cdef.jconf.ref_key_encoding_strategy
-                    item.__original_setattr__(tsfm(other_field), None)
+                    item.__original_setattr__(other_field.ref_key, None)
                     item._modified_fields.add(other_field.name)
                 item._add_unlinked_object(other_field.name, self)
         elif other_field.fdef.ftype == FType.LIST:
@@ -927,29 +1434,38 @@ def __link_field__(self: JObject, field: JField, value: Any) -> None:
         if other_field is None:
             return
         if other_field.fdef.ftype == FType.INSTANCE:
-            if getattr(item, other_field.name) != self:
+            if getattr(item, other_field.name) is not self:
                 setattr(item, other_field.name, self)
                 item._del_unlinked_object(other_field.name, self)
         elif other_field.fdef.ftype == FType.LIST:
-            if not isinstance(getattr(item, other_field.name), list):
+            other_list = getattr(item, other_field.name)
+            if not isinstance(other_list, list):
                 setattr(item, other_field.name, [self])
                 item._del_unlinked_object(other_field.name, self)
-            else:
-                if self not in getattr(item, other_field.name):
-                    getattr(item, other_field.name).append(self)
-                    item._del_unlinked_object(other_field.name, self)
+            elif not any(o is self for o in other_list):
+                # compare identities, equal data doesn't make a same object
+                other_list.append(self)
+                item._del_unlinked_object(other_field.name, self)
         self.__link_graph__(item)
 
 
 def __link_graph__(self: JObject, other: JObject) -> None:
+    """Merge the object graph of `other` into this object's graph.
     """
-    """
+    graph = self._graph
+    if graph is False:
+        # the graph of an initializing object is created on linking
+        graph = OGraph()
+        self._graph = graph
     try:
-        if not self._graph.has(self):
-            self._graph.put(self)
+        if not graph.has(self):
+            graph.put(self)
     except UnlinkableJSONClassException:
         pass
-    self._graph = self._graph.merged_graph(other._graph)
+    if other._graph is False:
+        # an initializing object merges graphs when it links itself
+        return
+    graph.merged_graph(other._graph)
 
 
 def jsonclassify(class_: type) -> type[JObject]:
@@ -968,10 +1484,14 @@ def jsonclassify(class_: type) -> type[JObject]:
     class_.__is_jsonclass__ = True
     # public methods
     class_.__init__ = __init__
+    class_.from_many = classmethod(from_many)
+    class_.ingest = classmethod(ingest)
     class_.set = jsonobject_set
     class_.update = update
     class_.tojson = tojson
+    class_.tojson_many = classmethod(tojson_many)
     class_.validate = validate
+    class_._validate = _validate
     class_.is_valid = is_valid
     class_.opby = opby
     class_.is_new = is_new
@@ -984,15 +1504,29 @@ def jsonclassify(class_: type) -> type[JObject]:
     class_.unlinked_objects = unlinked_objects
     class_.reset = reset
     class_.save = save
+    class_.save_many = classmethod(save_many)
+    class_._save_plan = _save_plan
+    class_._prepare_save = _prepare_save
     class_.delete = delete
+    class_.delete_many = classmethod(delete_many)
     class_.restore = restore
     class_.complete = complete
     class_.include = include
+    class_.include_many = classmethod(include_many)
+    class_.asave = asave
+    class_.adelete = adelete
+    class_.arestore = arestore
+    class_.acomplete = acomplete
+    class_.ainclude = ainclude
+    class_.ainclude_many = classmethod(ainclude_many)
     # protected methods
+    class_._init = _init
     class_._set = _set
     class_._keypath_set = _keypath_set
     class_._set_to_container = _set_to_container
     class_._orm_complete = _orm_complete
+    class_._aorm_complete = _aorm_complete
+    class_._include_plan = _include_plan
     class_._data_dict = _data_dict
     class_._mark_new = _mark_new
     class_._mark_unmodified = _mark_unmodified
@@ -1008,8 +1542,13 @@ def jsonclassify(class_: type) -> type[JObject]:
     class_._set_on_save = _set_on_save
     class_._clear_temp_fields = _clear_temp_fields
     class_._database_write = _database_write
+    class_._database_write_many = _database_write_many
     class_._orm_delete = _orm_delete
     class_._orm_restore = _orm_restore
+    class_._adatabase_write = _adatabase_write
+    class_._adatabase_write_many = _adatabase_write_many
+    class_._aorm_delete = _aorm_delete
+    class_._aorm_restore = _aorm_restore
     class_._can_cu_check_common = _can_cu_check_common
     class_._can_create_or_update_check = _can_create_or_update_check
     class_._can_delete_check = _can_delete_check
@@ -1021,7 +1560,6 @@ def jsonclassify(class_: type) -> type[JObject]:
     # private methods
     class_.__original_setattr__ = class_.__setattr__
     class_.__setattr__ = __setattr__
-    class_.__getattribute__ = __getattribute__
     class_.__odict_will_change__ = __odict_will_change__
     class_.__odict_add__ = __odict_add__
     class_.__odict_del__ = __odict_del__
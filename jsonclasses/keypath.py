@@ -1,6 +1,9 @@
 """This module defines utility functions for working with keypaths."""
 from __future__ import annotations
-from typing import Any, Union, TYPE_CHECKING
+from typing import Any, Callable, Optional, Union, TYPE_CHECKING
+from types import ModuleType
+from functools import cache, lru_cache
+from importlib import import_module
 from re import split,search
 from .pkgutils import check_and_install_packages
 from .fdef import FStore, FType
@@ -8,27 +11,68 @@ if TYPE_CHECKING:
     from .jfield import JField
 
 
+KEY_STRATEGY_CACHE_SIZE = 4096
+"""The maximum number of memoized keys of each key strategy. Keys can come
+from user inputs, thus the memoization is bounded.
+"""
+
+
 def check_inflection_installed() -> None:
     packages = {'inflection': ('inflection', '>=0.5.1,<1.0.0')}
     check_and_install_packages(packages)
 
 
-def camelize_key(key: str) -> str:
+@cache
+def inflection() -> ModuleType:
+    """Get the inflection module. The installation is checked only once.
+    """
     check_inflection_installed()
-    from inflection import camelize
-    return camelize(key, False)
+    return import_module('inflection')
+
+
+@lru_cache(maxsize=KEY_STRATEGY_CACHE_SIZE)
+def camelize_key(key: str) -> str:
+    return inflection().camelize(key, False)
 
 
+@lru_cache(maxsize=KEY_STRATEGY_CACHE_SIZE)
 def underscore_key(key: str) -> str:
-    check_inflection_installed()
-    from inflection import underscore
-    return underscore(key)
+    return inflection().underscore(key)
 
 
 def identical_key(key: str) -> str:
     return key
 
 
+KEY_STRATEGY_MEMO_SIZE = 256
+"""The maximum number of memoized key strategies. Strategies can be created
+per class, thus memoized strategies are bounded too.
+"""
+
+
+def memoized_key_strategy(
+        strategy: Callable[[str], str]) -> Callable[[str], str]:
+    """Get the bounded memoized version of a key strategy. Each strategy
+    function has its own least recently used cache.
+
+    Args:
+        strategy (Callable[[str], str]): The key encoding or decoding \
+            strategy.
+
+    Returns:
+        Callable[[str], str]: The memoized key strategy.
+    """
+    if strategy is identical_key or hasattr(strategy, 'cache_info'):
+        return strategy
+    return _memoized_key_strategy(strategy)
+
+
+@lru_cache(maxsize=KEY_STRATEGY_MEMO_SIZE)
+def _memoized_key_strategy(
+        strategy: Callable[[str], str]) -> Callable[[str], str]:
+    return lru_cache(maxsize=KEY_STRATEGY_CACHE_SIZE)(strategy)
+
+
 def reference_key(field: JField) -> str:
     """
     Figure out the correct reference key name from the field definition.
@@ -44,13 +88,11 @@ def reference_key(field: JField) -> str:
         ValueError: ValueError is raised if the field definition is not a \
             supported reference field.
     """
-    check_inflection_installed()
-    from inflection import singularize
     if field.fdef.fstore not in \
             [FStore.FOREIGN_KEY, FStore.LOCAL_KEY]:
         raise ValueError(f"field named {field.name} is not a reference field")
     if field.fdef.ftype == FType.LIST:
-        return singularize(field.name) + '_ids'
+        return inflection().singularize(field.name) + '_ids'
     elif field.fdef.ftype == FType.INSTANCE:
         return field.name + '_id'
     else:
@@ -58,6 +100,74 @@ def reference_key(field: JField) -> str:
                          "supported reference field type")
 
 
+class KeyPath:
+    """A persistent keypath which is linked to its parent keypath. Appending a
+    key shares the parent, thus it costs a single small allocation. The list
+    and string representations are materialized on demand and cached.
+    """
+
+    __slots__ = ('parent', 'key', 'length', '_list', '_str')
+
+    def __init__(self: KeyPath,
+                 parent: Optional[KeyPath] = None,
+                 key: Union[str, int, None] = None) -> None:
+        self.parent = parent
+        self.key = key
+        self.length: int = 0 if parent is None else parent.length + 1
+        self._list: Optional[list[Union[str, int]]] = None
+        self._str: Optional[str] = None
+
+    def append(self: KeyPath, key: Union[str, int]) -> KeyPath:
+        """Create a new keypath with `key` appended.
+        """
+        return KeyPath(self, key)
+
+    @classmethod
+    def of(cls: type[KeyPath], *keys: Union[str, int]) -> KeyPath:
+        """Create a keypath from keys.
+        """
+        kp = EMPTY_KEYPATH
+        for key in keys:
+            kp = KeyPath(kp, key)
+        return kp
+
+    @property
+    def keys(self: KeyPath) -> list[Union[str, int]]:
+        """The keys of this keypath. The returned list is cached and shared,
+        do not modify it.
+        """
+        if self._list is None:
+            keys: list[Union[str, int]] = []
+            node = self
+            while node.parent is not None:
+                if node._list is not None:
+                    keys.extend(reversed(node._list))
+                    break
+                keys.append(node.key)
+                node = node.parent
+            keys.reverse()
+            self._list = keys
+        return self._list
+
+    @property
+    def string(self: KeyPath) -> str:
+        """The dot separated string of this keypath.
+        """
+        if self._str is None:
+            self._str = '.'.join([str(k) for k in self.keys])
+        return self._str
+
+    def __len__(self: KeyPath) -> int:
+        return self.length
+
+    def __repr__(self: KeyPath) -> str:
+        return f'<KeyPath {self.string!r}>'
+
+
+EMPTY_KEYPATH = KeyPath()
+"""The empty keypath which every keypath starts from."""
+
+
 def new_mongoid() -> str:
     from bson.objectid import ObjectId
     return str(ObjectId())
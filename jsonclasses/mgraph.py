@@ -1,21 +1,38 @@
 """This module defineds the JSON Class object mapping graph."""
 from __future__ import annotations
-from typing import Iterator, Union, Optional, TYPE_CHECKING
+from typing import Any, Iterator, Union, Optional, TYPE_CHECKING
 if TYPE_CHECKING:
     from .jobject import JObject
 
 
+def _pkey(pk: Any) -> Any:
+    """Get the table key of an unhashable primary key value."""
+    return ('str', str(pk))
+
+
 class MarkClassTable:
+    """The mark table of a single JSON class. Objects with primary key values
+    are keyed by the primary key values. Objects without primary key values
+    are keyed by their identities.
+    """
 
-    def __init__(self):
-        self._primary_key_table = {}
-        self._memory_id_table = {}
+    def __init__(self, cls: Optional[type[JObject]] = None) -> None:
+        self._primary_key_table: dict[Any, JObject] = {}
+        self._memory_id_table: dict[int, JObject] = {}
+        field = None
+        if cls is not None:
+            field = cls.cdef.primary_field
+        self._pk_name: Optional[str] = field.name if field else None
+
+    def _pk(self, object: JObject) -> Any:
+        if self._pk_name is None:
+            return None
+        return getattr(object, self._pk_name)
 
     def put(self, object: JObject) -> None:
-        pk = object._id
+        pk = self._pk(object)
         if pk is None:
-            memory_id = hex(id(object))
-            self._memory_id_table[memory_id] = object
+            self._memory_id_table[id(object)] = object
         else:
             self.putp(pk, object)
 
@@ -23,33 +40,30 @@ class MarkClassTable:
         """Put object to this class table when designated primary key. This is
         useful when transforming and the values are not set yet.
         """
-        self._primary_key_table[str(pk)] = object
+        try:
+            self._primary_key_table[pk] = object
+        except TypeError:
+            self._primary_key_table[_pkey(pk)] = object
 
     def has(self, object: JObject) -> bool:
-        pk = object._id
-        if pk is not None:
-            if self._primary_key_table.get(str(pk)) is not None:
-                return True
-        memory_id = hex(id(object))
-        if self._memory_id_table.get(memory_id) is not None:
-            return True
-        return False
+        return self.get(object) is not None
 
     def get(self, object: JObject) -> Optional[JObject]:
-        pk = object._id
+        pk = self._pk(object)
         if pk is not None:
-            if self._primary_key_table.get(str(pk)) is not None:
-                return self._primary_key_table.get(str(pk))
-        memory_id = hex(id(object))
-        if self._memory_id_table.get(memory_id) is not None:
-            return self._memory_id_table.get(memory_id)
-        return None
+            found = self.getp(pk)
+            if found is not None:
+                return found
+        return self._memory_id_table.get(id(object))
 
     def getp(self, pk: Union[str, int]) -> Optional[JObject]:
-        return self._primary_key_table.get(str(pk))
+        try:
+            return self._primary_key_table.get(pk)
+        except TypeError:
+            return self._primary_key_table.get(_pkey(pk))
 
     def getm(self, memid: int) -> Optional[JObject]:
-        return self._memory_id_table.get(hex(memid))
+        return self._memory_id_table.get(memid)
 
 
 class MGraph:
@@ -58,12 +72,14 @@ class MGraph:
     """
 
     def __init__(self):
-        self._class_tables: dict[str, MarkClassTable] = {}
+        self._class_tables: dict[type, MarkClassTable] = {}
 
     def class_table(self, cls: type) -> MarkClassTable[JObject]:
-        if self._class_tables.get(cls.__name__) is None:
-            self._class_tables[cls.__name__] = MarkClassTable()
-        return self._class_tables[cls.__name__]
+        table = self._class_tables.get(cls)
+        if table is None:
+            table = MarkClassTable(cls)
+            self._class_tables[cls] = table
+        return table
 
     def put(self, object: JObject) -> None:
         self.class_table(object.__class__).put(object)
@@ -72,7 +88,7 @@ class MGraph:
         self.class_table(object.__class__).putp(pk, object)
 
     def has(self, object: JObject) -> bool:
-        return self.class_table(object.__class__).has(object)
+        return self.class_table(object.__class__).get(object) is not None
 
     def get(self, object: JObject) -> JObject:
         return self.class_table(object.__class__).get(object)
@@ -86,12 +102,10 @@ class MGraph:
         return self.class_table(cls).getm(memid)
 
     def __iter__(self) -> Iterator:
-        lst = []
+        seen: set[int] = set()
         for ct in self._class_tables.values():
-            for obj in ct._primary_key_table.values():
-                if obj not in lst:
-                    lst.append(obj)
-            for obj in ct._memory_id_table.values():
-                if obj not in lst:
-                    lst.append(obj)
-        return lst.__iter__()
+            for table in (ct._primary_key_table, ct._memory_id_table):
+                for obj in table.values():
+                    if id(obj) not in seen:
+                        seen.add(id(obj))
+                        yield obj
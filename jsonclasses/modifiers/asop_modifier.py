@@ -1,7 +1,7 @@
 """module for assigning operator modifier."""
 from __future__ import annotations
 from typing import Callable, TYPE_CHECKING
-from inspect import signature
+from ..arity import param_count
 from ..fdef import Fdef
 from .modifier import Modifier
 if TYPE_CHECKING:
@@ -16,7 +16,7 @@ class AsopModifier(Modifier):
     def __init__(self, transformer: Callable) -> None:
         if not callable(transformer):
             raise ValueError('asop transformer is not callable')
-        params_len = len(signature(transformer).parameters)
+        params_len = param_count(transformer)
         if params_len > 3 or params_len < 1:
             raise ValueError('not a valid asop transformer')
         self.transformer = transformer
@@ -26,8 +26,8 @@ class AsopModifier(Modifier):
         fdef._operator_assign_transformer = self.transformer
 
     def validate(self, ctx: Ctx) -> None:
-        if ctx.holder.is_new or ctx.keypathr[-1] in ctx.holder.modified_fields:
-            field = ctx.holder.__class__.cdef.field_named(ctx.keypathr[-1])
-            fidname = ctx.holder.__class__.cdef.jconf.ref_key_encoding_strategy(field)
+        if ctx.holder.is_new or ctx.kpr.key in ctx.holder.modified_fields:
+            field = ctx.holder.__class__.cdef.field_named(ctx.kpr.key)
+            fidname = field.ref_key
             if getattr(ctx.holder, fidname) is None:
                 ctx.raise_vexc('no operator being assigned')
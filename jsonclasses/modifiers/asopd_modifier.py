@@ -16,8 +16,8 @@ class AsopdModifier(Modifier):
         fdef._requires_operator_assign = True
 
     def validate(self, ctx: Ctx) -> None:
-        if ctx.holder.is_new or ctx.keypathr[-1] in ctx.holder.modified_fields:
-            field = ctx.holder.__class__.cdef.field_named(ctx.keypathr[-1])
-            fidname = ctx.holder.__class__.cdef.jconf.ref_key_encoding_strategy(field)
+        if ctx.holder.is_new or ctx.kpr.key in ctx.holder.modified_fields:
+            field = ctx.holder.__class__.cdef.field_named(ctx.kpr.key)
+            fidname = field.ref_key
             if getattr(ctx.holder, fidname) is None:
                 ctx.raise_vexc('no operator being assigned')
@@ -1,6 +1,6 @@
 from __future__ import annotations
 from typing import Any, Callable, TYPE_CHECKING
-from inspect import signature
+from ..arity import param_count
 from ..fdef import FStore, Fdef
 from .modifier import Modifier
 if TYPE_CHECKING:
@@ -15,8 +15,7 @@ class AssignModifier(Modifier):
         self.name = name
         self.val = val
         if callable(val):
-            params_len = len(signature(val).parameters)
-            if params_len != 0:
+            if param_count(val) != 0:
                 raise ValueError('not a valid assigner')
 
     def transform(self, ctx: Ctx) -> Any:
@@ -1,7 +1,6 @@
 """module for authorization identity modifier."""
 from __future__ import annotations
 from typing import Callable, TYPE_CHECKING
-from inspect import signature
 from ..fdef import Fdef
 from .modifier import Modifier
 if TYPE_CHECKING:
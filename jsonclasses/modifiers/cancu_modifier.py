@@ -1,7 +1,7 @@
 """module for canu modifier."""
 from __future__ import annotations
 from typing import Callable, TYPE_CHECKING
-from inspect import signature
+from ..arity import adapt
 from .modifier import Modifier
 from ..fdef import Fdef
 from ..excs import ValidationException
@@ -16,20 +16,14 @@ class CanCUModifier(Modifier):
 
     def __init__(self, checker: Callable | Types) -> None:
         self.checker = checker
+        if callable(checker):
+            self._invoker = adapt(checker)
 
     def validate(self, ctx: Ctx) -> None:
         if ctx.operator is None:
             ctx.raise_vexc('operator not present')
         if callable(self.checker):
-            params_len = len(signature(self.op_callable).parameters)
-            if params_len == 1:
-                result = self.op_callable(ctx.operator)
-            elif params_len == 2:
-                result = self.op_callable(ctx.operator, ctx.owner)
-            elif params_len == 3:
-                result = self.op_callable(ctx.operator, ctx.owner, ctx.val)
-            elif params_len == 4:
-                result = self.op_callable(ctx.operator, ctx.owner, ctx.val, ctx)
+            result = self._invoker(ctx.operator, ctx.owner, ctx.val, ctx)
             if result is None:
                 return
             if result is True:
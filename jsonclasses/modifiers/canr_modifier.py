@@ -1,7 +1,7 @@
 """module for canr modifier."""
 from __future__ import annotations
 from typing import Callable, Any, TYPE_CHECKING
-from inspect import signature
+from ..arity import adapt
 from .modifier import Modifier
 from ..fdef import Fdef
 from ..excs import ValidationException
@@ -16,21 +16,15 @@ class CanRModifier(Modifier):
 
     def __init__(self, checker: Callable | Types) -> None:
         self.checker = checker
+        if callable(checker):
+            self._invoker = adapt(checker)
 
     def tojson(self, ctx: Ctx) -> Any:
         super().tojson(ctx)
         if ctx.operator is None:
             return None
         if callable(self.checker):
-            params_len = len(signature(self.op_callable).parameters)
-            if params_len == 1:
-                result = self.op_callable(ctx.operator)
-            elif params_len == 2:
-                result = self.op_callable(ctx.operator, ctx.owner)
-            elif params_len == 3:
-                result = self.op_callable(ctx.operator, ctx.owner, ctx.val)
-            elif params_len == 4:
-                result = self.op_callable(ctx.operator, ctx.owner, ctx.val, ctx)
+            result = self._invoker(ctx.operator, ctx.owner, ctx.val, ctx)
             if result is None:
                 return ctx.val
             if result is True:
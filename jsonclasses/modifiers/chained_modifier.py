@@ -2,7 +2,6 @@
 from __future__ import annotations
 from jsonclasses.vmsgcollector import VMsgCollector
 from typing import Any, Optional, cast, TYPE_CHECKING
-from functools import reduce
 from ..excs import ValidationException
 from .modifier import Modifier
 from .eager_modifier import EagerModifier
@@ -17,6 +16,23 @@ class ChainedModifier(Modifier):
 
     def __init__(self, modifiers: Optional[list[Modifier]] = None) -> None:
         self.vs = modifiers or []
+        levidx = self._last_vidx(EagerModifier)
+        fpvidx = self._first_vidx(PreserializeModifier)
+        self._tvs: tuple[Modifier, ...] = \
+            tuple(self.vs[:levidx]) if levidx is not None else ()
+        self._nvs: tuple[Modifier, ...] = tuple(self.vs[levidx:fpvidx])
+        self._pvs: tuple[Modifier, ...] = \
+            tuple(self.vs[fpvidx:]) if fpvidx is not None else ()
+        # per phase dispatch lists, modifiers inheriting the no-op
+        # implementation of a phase from `Modifier` are skipped
+        self._ttvs = tuple(v for v in self._tvs
+                           if _overrides(v, 'transform')
+                           or _overrides(v, 'validate'))
+        self._tnvs = tuple(v for v in self._nvs if _overrides(v, 'transform'))
+        self._vnvs = tuple(v for v in self._nvs if _overrides(v, 'validate'))
+        self._jvs = tuple(v for v in self.vs if _overrides(v, 'tojson'))
+        self._stvs = tuple(v for v in self._tvs if _overrides(v, 'serialize'))
+        self._snvs = tuple(v for v in self._nvs if _overrides(v, 'serialize'))
 
     def append(self, *args: Modifier) -> ChainedModifier:
         """Append modifiers to this chained modifier chain."""
@@ -36,36 +52,36 @@ class ChainedModifier(Modifier):
         return self.vs.index(v) if v is not None else None
 
     @property
-    def _levidx(self) -> Optional[int]:
-        return self._last_vidx(EagerModifier)
-
-    @property
-    def _fpvidx(self) -> Optional[int]:
-        return self._first_vidx(PreserializeModifier)
+    def jvs(self) -> tuple[Modifier, ...]:
+        """The modifiers which convert values on outputting to JSON. Other
+        modifiers are skipped by `tojson`.
+        """
+        return self._jvs
 
     @property
-    def _tvs(self) -> list[Modifier]:
+    def tvs(self) -> tuple[Modifier, ...]:
         """The modifiers which should be perform eager validation on.
 
         This is from the beginning to the last eager modifier before the first
         preserialize modifier.
         """
         # TODO: accounting into e and p
-        return self.vs[:self._levidx] if self._levidx is not None else []
-
-    @property
-    def _pvs(self) -> list[Modifier]:
-        """
-        """
-        return self.vs[self._fpvidx:] if self._fpvidx is not None else []
+        return self._tvs
 
     @property
-    def _nvs(self) -> list[Modifier]:
+    def nvs(self) -> tuple[Modifier, ...]:
         """Modifiers between last eager modifier and first preserialize
         modifier. These modifiers should be performed in normal validation
         process.
         """
-        return self.vs[self._levidx:self._fpvidx]
+        return self._nvs
+
+    @property
+    def pvs(self) -> tuple[Modifier, ...]:
+        """Modifiers from the first preserialize modifier. These modifiers are
+        only performed just before serialization into database.
+        """
+        return self._pvs
 
     def _vt(self, v: Modifier, ctx: Ctx) -> Any:
         """Validate as transform."""
@@ -83,7 +99,7 @@ class ChainedModifier(Modifier):
 
     def validate(self, ctx: Ctx) -> None:
         ctor = VMsgCollector()
-        for modifier in self._nvs:
+        for modifier in self._vnvs:
             try:
                 modifier.validate(ctx)
             except ValidationException as exception:
@@ -95,16 +111,30 @@ class ChainedModifier(Modifier):
 
     def transform(self, ctx: Ctx) -> Any:
         val = ctx.val
-        val = reduce(lambda val, v: self._vt(v, ctx.nval(val)), self._tvs, val)
-        val = reduce(lambda val, v: v.transform(ctx.nval(val)), self._nvs, val)
+        for v in self._ttvs:
+            val = self._vt(v, ctx.nval(val))
+        for v in self._tnvs:
+            val = v.transform(ctx.nval(val))
         return val
 
     def tojson(self, ctx: Ctx) -> Any:
-        return reduce(lambda val, v: v.tojson(ctx.nval(val)), self.vs, ctx.val)
+        val = ctx.val
+        for v in self._jvs:
+            val = v.tojson(ctx.nval(val))
+        return val
 
     def serialize(self, ctx: Ctx) -> Any:
         val = ctx.val
-        val = reduce(lambda val, v: v.serialize(ctx.nval(val)), self._tvs, val)
-        val = reduce(lambda val, v: v.serialize(ctx.nval(val)), self._nvs, val)
-        val = reduce(lambda val, v: self._sv(v, ctx.nval(val)), self._pvs, val)
+        for v in self._stvs:
+            val = v.serialize(ctx.nval(val))
+        for v in self._snvs:
+            val = v.serialize(ctx.nval(val))
+        for v in self._pvs:
+            val = self._sv(v, ctx.nval(val))
         return val
+
+
+def _overrides(modifier: Modifier, phase: str) -> bool:
+    """Whether the modifier overrides the no-op implementation of a phase.
+    """
+    return getattr(type(modifier), phase) is not getattr(Modifier, phase)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, Callable
-from inspect import signature
+from ..arity import param_count
 from ..fdef import FStore, Fdef
 from .modifier import Modifier
 if TYPE_CHECKING:
@@ -17,8 +17,7 @@ class GetterModifier(Modifier):
         if not isinstance(calc, Types):
             if not callable(calc):
                 raise ValueError('getter is not callable')
-            params_len = len(signature(calc).parameters)
-            if params_len != 1:
+            if param_count(calc) != 1:
                 raise ValueError('not a valid getter')
 
     def define(self, fdef: Fdef) -> None:
@@ -14,10 +14,10 @@ class IndexModifier(Modifier):
         if self.index_name:
             if self.unique:
                 fdef._cunique = True
-                fdef._cunique_names.append(self.index_name)
+                fdef._cunique_names = [*fdef._cunique_names, self.index_name]
             else:
                 fdef._cindex = True
-                fdef._cindex_names.append(self.index_name)
+                fdef._cindex_names = [*fdef._cindex_names, self.index_name]
         else:
             if self.unique:
                 fdef._unique = True
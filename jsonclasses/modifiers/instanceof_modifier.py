@@ -9,6 +9,7 @@ from ..fdef import (
 from ..excs import ValidationException
 from .modifier import Modifier
 from ..keypath import concat_keypath, initial_keypaths
+from ..identity_map import current_identity_map
 if TYPE_CHECKING:
     from ..jobject import JObject
     from ..ctx import Ctx
@@ -39,6 +40,11 @@ class InstanceOfModifier(Modifier):
             all_fields = cls.cdef.jconf.validate_all_fields
         if not isinstance(ctx.val, cls):
             ctx.raise_vexc(f'value is not instance of {cls.__name__}')
+        # skip objects which are valid since the last validation
+        vgraph = ctx.val._vgraph
+        if vgraph is not None:
+            if vgraph.is_clean(ctx.val, ctx.operator, ctx.mgraph):
+                return
         only_validate_modified = not ctx.val.is_new
         modified_fields = []
         if only_validate_modified:
@@ -112,14 +118,25 @@ class InstanceOfModifier(Modifier):
             dest = ctx.original
             if pvalue is not None:
                 ctx.mgraph.putp(pvalue, dest)
+                imap = current_identity_map()
+                if imap is not None:
+                    imap.put(dest, pvalue)
         elif pvalue is not None:
             exist_item = ctx.mgraph.getp(cls, pvalue)
+            imap = current_identity_map()
+            if exist_item is None and imap is not None:
+                # objects known to the session are reused and updated
+                exist_item = imap.get(cls, pvalue)
+                if exist_item is not None:
+                    ctx.mgraph.putp(pvalue, exist_item)
             if exist_item is not None:
                 dest = exist_item
                 soft_apply_mode = True
             else:
                 dest = cls()
                 ctx.mgraph.putp(pvalue, dest)
+                if imap is not None:
+                    imap.put(dest, pvalue)
         else:
             dest = cls()
             ctx.mgraph.put(dest)
@@ -133,6 +150,12 @@ class InstanceOfModifier(Modifier):
                 strictness = False
         if strictness:
             self._strictness_check(ctx, dest)
+        # fill values with compiled plan
+        if dest.__class__.cdef.jconf.compiled:
+            tplan = dest.__class__.cdef.tplan
+            if tplan is not None:
+                tplan.transform(ctx, dest, soft_apply_mode)
+                return dest
         # fill values
         dict_keys = list(ctx.val.keys())
         nonnull_ref_lists: list[str] = []
@@ -144,11 +167,10 @@ class InstanceOfModifier(Modifier):
                         if fdef.collection_nullability == Nullability.NONNULL:
                             nonnull_ref_lists.append(field.name)
                     elif fdef.fstore == FStore.LOCAL_KEY:
-                        tsfm = dest.__class__.cdef.jconf.ref_key_encoding_strategy
-                        refname = tsfm(field)
+                        refname = field.ref_key
                         if ctx.val.get(refname) is not None:
                             setattr(dest, refname, ctx.val.get(refname))
-                        crefname = dest.__class__.cdef.jconf.key_encoding_strategy(refname)
+                        crefname = field.json_ref_key
                         if ctx.val.get(crefname) is not None:
                             setattr(dest, refname, ctx.val.get(crefname))
                     pass
@@ -186,6 +208,9 @@ class InstanceOfModifier(Modifier):
         if ctx.val is None:
             return None
         val = cast(JObject, ctx.val)
+        oplan = val.__class__.cdef.oplan(ctx.ctxcfg)
+        if oplan is not None:
+            return oplan.tojson(ctx)
         retval = {}
         clschain = ctx.idchain
         cls_name = val.__class__.cdef.name
@@ -204,15 +229,15 @@ class InstanceOfModifier(Modifier):
                 if field.foreign_field:
                     isrf = field.foreign_field.fdef == ctx.fdef
                     if not isrf:
-                        if len(ctx.keypathr) > 1:
-                            key = ctx.keypathr[-2]
+                        if ctx.kpr.length > 1:
+                            key = ctx.kpr.parent.key
                             isrf = field.foreign_field.name == key
             if fd.fstore == FStore.LOCAL_KEY:
                 if val.is_partial:
                     if field.name not in val._partial_picks:
                         continue
-                rk = val.__class__.cdef.jconf.ref_key_encoding_strategy(field)
-                jrk = val.__class__.cdef.jconf.key_encoding_strategy(rk)
+                rk = field.ref_key
+                jrk = field.json_ref_key
                 valatk = getattr(val, rk)
                 if output_null or (valatk is not None):
                     retval[jrk] = valatk
@@ -252,8 +277,7 @@ class InstanceOfModifier(Modifier):
             if field.fdef.is_ref or field.fdef.is_inst or should_update or field.fdef.force_set_on_save:
                 if field.fdef.fstore == FStore.LOCAL_KEY:
                     if getattr(value, field.name) is None:
-                        tsf = value.__class__.cdef.jconf.ref_key_encoding_strategy
-                        if getattr(value, tsf(field)) is not None:
+                        if getattr(value, field.ref_key) is not None:
                             continue
                 if field.fdef.fstore != FStore.CALCULATED:
                     field_value = getattr(value, field.name)
@@ -39,7 +39,7 @@ class ListOfModifier(CollectionTypeModifier):
         return isinstance(v, dict) and ('_add' in v or '_del' in v)
 
     def special_handle(self, key: Any, v: Any, ctx: Ctx) -> None:
-        fname = ctx.keypatho[-1]
+        fname = ctx.kpo.key
         is_lkey = ctx.fdef.fstore == FStore.LOCAL_KEY
         if is_lkey:
             if '_add' in v:
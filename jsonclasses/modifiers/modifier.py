@@ -1,7 +1,7 @@
 """module for modifier modifier."""
 from __future__ import annotations
 from typing import Any, TYPE_CHECKING
-from inspect import signature
+from ..arity import param_count
 from ..fdef import Fdef
 from ..pkgutils import check_and_install_packages
 if TYPE_CHECKING:
@@ -23,7 +23,7 @@ class Modifier:
             newctx = ctx.nval(None)
             return param.modifier.transform(newctx)
         elif callable(param):
-            params_len = len(signature(param).parameters)
+            params_len = param_count(param)
             if params_len == 0:
                 return param()
             elif params_len == 1:
@@ -1,7 +1,7 @@
 """module for or modifier."""
 from __future__ import annotations
 from typing import Callable, TYPE_CHECKING
-from inspect import signature
+from ..arity import adapt, param_count
 from ..excs import ValidationException
 from .modifier import Modifier
 if TYPE_CHECKING:
@@ -16,13 +16,15 @@ class OneIsValidModifier(Modifier):
     def __init__(self, subroutines: list[Callable | Types]) -> None:
         for item in subroutines:
             if callable(item):
-                params_len = len(signature(item).parameters)
+                params_len = param_count(item)
                 if params_len > 2 or params_len < 1:
                     raise ValueError('not a valid or subroutine callable')
         self.subroutines = subroutines
+        self._invokers = [adapt(item) if callable(item) else None
+                          for item in subroutines]
 
     def validate(self, ctx: Ctx) -> None:
-        for item in self.subroutines:
+        for item, invoker in zip(self.subroutines, self._invokers):
             from ..types import Types
             if isinstance(item, Types):
                 tresult = item.modifier.transform(ctx)
@@ -32,11 +34,7 @@ class OneIsValidModifier(Modifier):
                 except ValidationException:
                     continue
             else:
-                params_len = len(signature(item).parameters)
-                if params_len == 1:
-                    result = callable(ctx.val)
-                elif params_len == 2:
-                    result = callable(ctx.val, ctx)
+                result = invoker(ctx.val, ctx)
                 if result is None:
                     return
                 if result is True:
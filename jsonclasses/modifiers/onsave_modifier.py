@@ -1,7 +1,7 @@
 """module for onsave modifier."""
 from __future__ import annotations
 from typing import Callable, Any, TYPE_CHECKING
-from inspect import signature
+from ..arity import adapt, param_count
 from .modifier import Modifier
 if TYPE_CHECKING:
     from ..ctx import Ctx
@@ -13,15 +13,11 @@ class OnSaveModifier(Modifier):
     def __init__(self, callback: Callable) -> None:
         if not callable(callback):
             raise ValueError('onsave argument is not callable')
-        params_len = len(signature(callback).parameters)
-        if params_len > 1:
+        if param_count(callback) > 1:
             raise ValueError('not a valid onsave callable')
         self.callback = callback
+        self._invoker = adapt(callback)
 
     def serialize(self, ctx: Ctx) -> Any:
-        params_len = len(signature(self.callback).parameters)
-        if params_len == 0:
-            self.callback()
-        elif params_len == 1:
-            self.callback(ctx.val)
+        self._invoker(ctx.val)
         return ctx.val
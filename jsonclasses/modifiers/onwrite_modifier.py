@@ -1,7 +1,7 @@
 """module for onsave modifier."""
 from __future__ import annotations
 from typing import Callable, Any, cast, TYPE_CHECKING
-from inspect import signature
+from ..arity import adapt, param_count
 from .modifier import Modifier
 if TYPE_CHECKING:
     from ..ctx import Ctx
@@ -15,22 +15,16 @@ class OnWriteModifier(Modifier):
     def __init__(self, callback: Callable) -> None:
         if not callable(callback):
             raise ValueError('onwrite callback is not callable')
-        params_len = len(signature(callback).parameters)
-        if params_len > 2:
+        if param_count(callback) > 2:
             raise ValueError('not a valid onwrite callback')
         self.callback = callback
+        self._invoker = adapt(callback)
 
     def serialize(self, ctx: Ctx) -> Any:
         from ..jobject import JObject
-        name = ctx.keypathp[-1]
+        name = ctx.kpp.key
         parent = cast(JObject, ctx.parent)
         if not parent.is_new and name not in parent.modified_fields:
             return ctx.val
-        params_len = len(signature(self.callback).parameters)
-        if params_len == 0:
-            self.callback()
-        elif params_len == 1:
-            self.callback(ctx.val)
-        elif params_len == 2:
-            self.callback(ctx.val, ctx)
+        self._invoker(ctx.val, ctx)
         return ctx.val
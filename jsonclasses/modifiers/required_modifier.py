@@ -24,10 +24,9 @@ class RequiredModifier(Modifier):
             return
         if storage == FStore.LOCAL_KEY:
             if ctx.val is None:  # check key presence
-                jconf: JConf = ctx.holder.__class__.cdef.jconf
                 ko = str(ctx.keypathh[0])
                 field = ctx.holder.__class__.cdef.field_named(ko)
-                local_key = jconf.ref_key_encoding_strategy(field)
+                local_key = field.ref_key
                 if isinstance(ctx.holder, dict):
                     if ctx.holder.get(local_key) is None:
                         ctx.raise_vexc('value required')
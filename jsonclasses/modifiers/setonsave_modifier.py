@@ -1,7 +1,7 @@
 """module for setonsave modifier."""
 from __future__ import annotations
 from typing import Callable, Any, TYPE_CHECKING
-from inspect import signature
+from ..arity import adapt, param_count
 from .modifier import Modifier
 if TYPE_CHECKING:
     from ..ctx import Ctx
@@ -16,16 +16,13 @@ class SetOnSaveModifier(Modifier):
         if not isinstance(setter, Types):
             if not callable(setter):
                 raise ValueError('setonsave setter is not callable')
-            params_len = len(signature(setter).parameters)
-            if params_len > 1:
+            if param_count(setter) > 1:
                 raise ValueError('not a valid setonsave setter')
+            self._invoker = adapt(setter)
         self.setter = setter
 
     def serialize(self, ctx: Ctx) -> Any:
         if callable(self.setter):
-            params_len = len(signature(self.setter).parameters)
-            if params_len == 1:
-                return self.setter(ctx.val)
-            return self.setter()
+            return self._invoker(ctx.val)
         else:
             return self.setter.modifier.transform(ctx)
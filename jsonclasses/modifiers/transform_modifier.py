@@ -1,7 +1,7 @@
 """module for transform modifier."""
 from __future__ import annotations
 from typing import Callable, Any, TYPE_CHECKING
-from inspect import signature
+from ..arity import adapt, param_count
 from .modifier import Modifier
 if TYPE_CHECKING:
     from ..ctx import Ctx
@@ -18,10 +18,11 @@ class TransformModifier(Modifier):
         else:
             if not callable(transformer):
                 raise ValueError('transformer is not callable')
-            params_len = len(signature(transformer).parameters)
+            params_len = param_count(transformer)
             if params_len > 2 or params_len < 1:
                 raise ValueError('not a valid transformer')
             self.transformer = transformer
+            self._invoker = adapt(transformer)
 
     def transform(self, ctx: Ctx) -> Any:
         from ..types import Types
@@ -29,8 +30,4 @@ class TransformModifier(Modifier):
             return self.transformer.modifier.transform(ctx)
         if ctx.val is None:
             return None
-        params_len = len(signature(self.transformer).parameters)
-        if params_len == 1:
-            return self.transformer(ctx.val)
-        elif params_len == 2:
-            return self.transformer(ctx.val, ctx)
+        return self._invoker(ctx.val, ctx)
@@ -1,7 +1,7 @@
 """module for uploader modifier."""
 from __future__ import annotations
 from typing import Callable, Any, TYPE_CHECKING
-from inspect import signature
+from ..arity import adapt, param_count
 from .modifier import Modifier
 from ..uploaders import request_uploader, S3Uploader, AliOSSUploader
 if TYPE_CHECKING:
@@ -14,9 +14,10 @@ class UploaderModifier(Modifier):
     def __init__(self, arg: str | Callable) -> None:
         self.arg = arg
         if callable(arg):
-            params_len = len(signature(arg).parameters)
+            params_len = param_count(arg)
             if params_len > 2 or params_len < 1:
                 raise ValueError('not a valid transformer')
+            self._invoker = adapt(arg)
         self.check_packages()
 
     def packages(self) -> dict[str, (str, str)] | None:
@@ -32,11 +33,7 @@ class UploaderModifier(Modifier):
         if ctx.val is None:
             return None
         if callable(self.arg):
-            params_len = len(signature(self.arg).parameters)
-            if params_len == 1:
-                return self.arg(ctx.val)
-            elif params_len == 2:
-                return self.arg(ctx.val, ctx)
+            return self._invoker(ctx.val, ctx)
         else:
             uploader = request_uploader(self.arg)
             return uploader.upload(ctx.val)
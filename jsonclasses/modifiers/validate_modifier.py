@@ -1,7 +1,7 @@
 """module for vmsg modifier."""
 from __future__ import annotations
 from typing import Callable, TYPE_CHECKING
-from inspect import signature
+from ..arity import adapt, param_count
 from ..excs import ValidationException
 from .modifier import Modifier
 if TYPE_CHECKING:
@@ -14,9 +14,10 @@ class ValidateModifier(Modifier):
 
     def __init__(self, validator: Callable | Types, msg: str | None = None) -> None:
         if callable(validator):
-            params_len = len(signature(validator).parameters)
+            params_len = param_count(validator)
             if params_len > 2 or params_len < 1:
                 raise ValueError('not a valid modifier')
+            self._invoker = adapt(validator)
         self.validator = validator
         self.msg = msg if msg is not None else 'invalid value'
         self.use_msg = msg is not None
@@ -32,11 +33,7 @@ class ValidateModifier(Modifier):
                 ctx.raise_vexc(self.msg)
         if ctx.val is None:
             return
-        params_len = len(signature(self.validator).parameters)
-        if params_len == 1:
-            result = self.validator(ctx.val)
-        elif params_len == 2:
-            result = self.validator(ctx.val, ctx)
+        result = self._invoker(ctx.val, ctx)
         if result is None:
             return
         if result is True:
@@ -1,6 +1,6 @@
 """This module defineds the JSON Class object mapping graph."""
 from __future__ import annotations
-from typing import Iterator, NamedTuple, Union, TYPE_CHECKING
+from typing import Iterator, Optional, Union, TYPE_CHECKING
 from .isjsonclass import isjsonobject
 from .excs import (UnlinkableJSONClassException,
                          JSONClassGraphMergeConflictException)
@@ -13,33 +13,68 @@ class OGraph:
     main usages. First, it's used for tracking and referencing objects within
     the same objects from a query result. Second, it's used for marking objects
     as handled when performing validating and serializing.
+
+    Graphs are merged as disjoint sets. A merged graph points to the graph it's
+    merged into, and every operation is performed on the root graph, thus
+    objects don't need to be reassigned a new graph on merging.
     """
 
+    __slots__ = ('_maps', '_parent', '_size', '_seed')
+
     def __init__(self: OGraph,
                  objects: Union[list[JObject],
                                 JObject, None] = None) -> None:
         self._maps: dict[str, dict[str, JObject]] = {}
-        try:
-            if isinstance(objects, list):
+        self._parent: Optional[OGraph] = None
+        self._size = 0
+        self._seed: Optional[JObject] = None
+        if isinstance(objects, list):
+            try:
                 for object in objects:
                     self.put(object)
-            if isjsonobject(objects):
-                self.put(objects)
-        except UnlinkableJSONClassException:
-            return
+            except UnlinkableJSONClassException:
+                return
+        elif isjsonobject(objects):
+            # a single object is put on first use
+            self._seed = objects
 
     def __iter__(self) -> Iterator[JObject]:
-        lst: list[JObject] = []
-        for table in self._maps.values():
-            for obj in table.values():
-                lst.append(obj)
-        return lst.__iter__()
+        for table in self.root._maps.values():
+            yield from table.values()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, OGraph):
+            return False
+        return self.root is other.root
+
+    __hash__ = None  # type: ignore
+
+    @property
+    def root(self: OGraph) -> OGraph:
+        """The graph which holds objects of this graph. This is the graph
+        itself if it's not merged into another graph.
+        """
+        graph = self
+        while graph._parent is not None:
+            parent = graph._parent
+            if parent._parent is not None:
+                graph._parent = parent._parent
+            graph = parent
+        if graph._seed is not None:
+            seed = graph._seed
+            graph._seed = None
+            try:
+                graph.put(seed)
+            except UnlinkableJSONClassException:
+                pass
+        return graph
 
     def _object_map(self: OGraph,
                     name: str) -> dict[str, JObject]:
-        if self._maps.get(name) is None:
-            self._maps[name] = {}
-        return self._maps[name]
+        maps = self.root._maps
+        if maps.get(name) is None:
+            maps[name] = {}
+        return maps[name]
 
     def _check_get_str_id(self: OGraph, object: JObject) -> str:
         primary_value = object._id
@@ -58,6 +93,8 @@ class OGraph:
         primary_value = self._check_get_str_id(object)
         class_name = object.__class__.__name__
         object_map = self._object_map(class_name)
+        if primary_value not in object_map:
+            self.root._size += 1
         object_map[primary_value] = object
 
     def has(self: OGraph, object: JObject) -> bool:
@@ -70,34 +107,53 @@ class OGraph:
         """
         primary_value = self._check_get_str_id(object)
         class_name = object.__class__.__name__
-        object_map = self._object_map(class_name)
+        object_map = self.root._maps.get(class_name)
+        if object_map is None:
+            return None
         return object_map.get(primary_value)
 
     def copy(self: OGraph) -> OGraph:
         """Get a copy of this object graph.
         """
+        root = self.root
         new_graph = OGraph()
-        for key, map in self._maps.items():
-            new_graph._maps[key] = {}
-            for name, obj in map.items():
-                new_graph._maps[key][name] = obj
+        for key, map in root._maps.items():
+            new_graph._maps[key] = dict(map)
+        new_graph._size = root._size
         return new_graph
 
-
     def merged_graph(self: OGraph, graph2: OGraph) -> OGraph:
-        """Get a new graph which is a combination of two graphs.
+        """Merge two graphs. The smaller graph is merged into the larger one,
+        and the graph which holds objects of both graphs is returned. Nothing
+        is merged if two graphs have different objects representing the same
+        object.
         """
-        if self is graph2:
-            return self
-        graph = self.copy()
-        for object in graph2:
-            if not graph.has(object):
-                graph.put(object)
-            elif graph.get(object) is object:
-                graph.put(object)
+        graph = self.root
+        other = graph2.root
+        if graph is other:
+            return graph
+        if graph._size < other._size:
+            graph, other = other, graph
+        for name, table in other._maps.items():
+            existing = graph._maps.get(name)
+            if existing is None:
+                continue
+            for key, object in table.items():
+                item = existing.get(key)
+                if item is not None and item is not object:
+                    raise JSONClassGraphMergeConflictException(
+                        'multiple objects represent same object: ', object)
+        for name, table in other._maps.items():
+            existing = graph._maps.get(name)
+            if existing is None:
+                graph._maps[name] = table
+                graph._size += len(table)
             else:
-                raise JSONClassGraphMergeConflictException(
-                    'multiple objects represent same object: ', object)
-        for object in graph:
-            object._graph = graph
+                for key, object in table.items():
+                    if key not in existing:
+                        graph._size += 1
+                    existing[key] = object
+        other._maps = {}
+        other._size = 0
+        other._parent = graph
         return graph
@@ -0,0 +1,220 @@
+"""This module defines `OPlan`, the precomputed output plan of a JSON class.
+An output plan records JSON names, reference key names, read rules and storage
+flags of each field, thus converting an object into a JSON dict doesn't
+recompute them on every call.
+"""
+from __future__ import annotations
+from typing import Any, Iterator, NamedTuple, Optional, TYPE_CHECKING
+from .fdef import FStore, FType, ReadRule
+if TYPE_CHECKING:
+    from .cdef import Cdef
+    from .ctx import Ctx, CtxCfg
+    from .fdef import Fdef
+    from .jfield import JField
+    from .modifiers import ChainedModifier
+
+
+class OField(NamedTuple):
+    """The output description of a single field in an output plan.
+    """
+
+    name: str
+    """The name of the field in Python."""
+
+    json_name: str
+    """The name of the field in JSON."""
+
+    fdef: Fdef
+    """The field definition."""
+
+    modifier: ChainedModifier
+    """The chained modifier of the field."""
+
+    passthrough: bool
+    """Whether no modifier in the chain converts the value on output."""
+
+    instance: bool
+    """Whether the field is an instance field."""
+
+    is_ref: bool
+    """Whether the field is a reference field."""
+
+    output: bool
+    """Whether the field value is presented in the output."""
+
+    ref_key: Optional[str]
+    """The local key name in Python if the field is a local key field."""
+
+    json_ref_key: Optional[str]
+    """The local key name in JSON if the field is a local key field."""
+
+    foreign_field: Optional[JField]
+    """The field on the other side of the relationship."""
+
+
+class OPlan:
+    """The precomputed output plan of a class definition under a context
+    configuration. This is created lazily and cached by `Cdef`.
+    """
+
+    def __init__(self: OPlan, cdef: Cdef, ctxcfg: CtxCfg) -> None:
+        cdef._resolve_ref_types_if_needed()
+        self._cdef = cdef
+        self._cls_name = cdef.name
+        self._rr = bool(ctxcfg.reverse_relationship)
+        if ctxcfg.output_null is None:
+            self._output_null = cdef.jconf.output_null
+        else:
+            self._output_null = ctxcfg.output_null
+        ignore_writeonly = bool(ctxcfg.ignore_writeonly)
+        self._fields: tuple[OField, ...] = tuple(
+            self._plan_field(field, ignore_writeonly)
+            for field in cdef.fields)
+
+    @property
+    def cdef(self: OPlan) -> Cdef:
+        """The class definition which this plan is computed from.
+        """
+        return self._cdef
+
+    @property
+    def fields(self: OPlan) -> tuple[OField, ...]:
+        """The output descriptions of fields in field order.
+        """
+        return self._fields
+
+    @property
+    def output_null(self: OPlan) -> bool:
+        """Whether output null instead of leaving unexisting fields.
+        """
+        return self._output_null
+
+    def _plan_field(self: OPlan,
+                    field: JField,
+                    ignore_writeonly: bool) -> OField:
+        fdef = field.fdef
+        ref_key: Optional[str] = None
+        json_ref_key: Optional[str] = None
+        if fdef.fstore == FStore.LOCAL_KEY:
+            ref_key = field.ref_key
+            json_ref_key = field.json_ref_key
+        foreign_field = None if self._rr else field.foreign_field
+        if foreign_field is not None:
+            foreign_field.cdef._resolve_ref_types_if_needed()
+        output = fdef.fstore != FStore.TEMP
+        if fdef.read_rule == ReadRule.NO_READ and not ignore_writeonly:
+            output = False
+        passthrough = len(field.types.modifier.jvs) == 0
+        return OField(name=field.name,
+                      json_name=field.json_name,
+                      fdef=fdef,
+                      modifier=field.types.modifier,
+                      passthrough=passthrough,
+                      instance=fdef.ftype == FType.INSTANCE,
+                      is_ref=fdef.is_ref,
+                      output=output,
+                      ref_key=ref_key,
+                      json_ref_key=json_ref_key,
+                      foreign_field=foreign_field)
+
+    def entries(self: OPlan,
+                ctx: Ctx) -> Iterator[tuple[str, Optional[OField], Any]]:
+        """Walk the output entries of the object in `ctx` in output order.
+        This applies the same rules as `tojson` without converting values,
+        null values are not filtered.
+
+        Args:
+            ctx (Ctx): The context which holds the object.
+
+        Yields:
+            tuple[str, Optional[OField], Any]: The JSON key, the field and \
+                the value. The field is None for a local key entry and the \
+                value is the key. Otherwise the value is the unconverted \
+                field value.
+        """
+        val = ctx.val
+        no_key_refs = self._cls_name in ctx.idchain
+        picks = val._partial_picks if val.is_partial else None
+        pkey: Any = None
+        pkey_resolved = False
+        for f in self._fields:
+            if picks is not None and f.name not in picks:
+                continue
+            if f.ref_key is not None:
+                yield f.json_ref_key, None, getattr(val, f.ref_key)
+            if f.is_ref:
+                if no_key_refs:
+                    continue
+                ffield = f.foreign_field
+                if ffield is not None:
+                    if ffield.fdef is ctx.fdef:
+                        continue
+                    if not pkey_resolved:
+                        kpr = ctx.kpr
+                        pkey = kpr.parent.key if kpr.length > 1 else None
+                        pkey_resolved = True
+                    if pkey is not None and ffield.name == pkey:
+                        continue
+            if not f.output:
+                continue
+            yield f.json_name, f, getattr(val, f.name)
+
+    def field_ctx(self: OPlan, ctx: Ctx, f: OField, fval: Any) -> Ctx:
+        """Create the context of outputting the value of field `f`.
+        """
+        if f.instance:
+            return ctx.nextoc(fval, f.name, f.fdef, self._cls_name)
+        return ctx.nextvc(fval, f.name, f.fdef, self._cls_name)
+
+    def tojson(self: OPlan, ctx: Ctx) -> dict[str, Any]:
+        """Convert the object in `ctx` into a JSON dict.
+
+        Args:
+            ctx (Ctx): The context which holds the object.
+
+        Returns:
+            dict[str, Any]: The JSON dict of the object.
+        """
+        # the walk of `entries` is inlined, this is the hot path
+        val = ctx.val
+        retval: dict[str, Any] = {}
+        cls_name = self._cls_name
+        output_null = self._output_null
+        no_key_refs = cls_name in ctx.idchain
+        picks = val._partial_picks if val.is_partial else None
+        pkey: Any = None
+        pkey_resolved = False
+        for f in self._fields:
+            if picks is not None and f.name not in picks:
+                continue
+            if f.ref_key is not None:
+                valatk = getattr(val, f.ref_key)
+                if output_null or (valatk is not None):
+                    retval[f.json_ref_key] = valatk
+            if f.is_ref:
+                if no_key_refs:
+                    continue
+                ffield = f.foreign_field
+                if ffield is not None:
+                    if ffield.fdef is ctx.fdef:
+                        continue
+                    if not pkey_resolved:
+                        kpr = ctx.kpr
+                        pkey = kpr.parent.key if kpr.length > 1 else None
+                        pkey_resolved = True
+                    if pkey is not None and ffield.name == pkey:
+                        continue
+            if not f.output:
+                continue
+            fval = getattr(val, f.name)
+            if f.passthrough:
+                field_value = fval
+            elif f.instance:
+                ictx = ctx.nextoc(fval, f.name, f.fdef, cls_name)
+                field_value = f.modifier.tojson(ictx)
+            else:
+                ictx = ctx.nextvc(fval, f.name, f.fdef, cls_name)
+                field_value = f.modifier.tojson(ictx)
+            if output_null or (field_value is not None):
+                retval[f.json_name] = field_value
+        return retval
@@ -48,8 +48,38 @@ class ORMObject(JObject):
     def iterate(cls: type[T], **kwargs: Any) -> IterateQuery[T]:
         ...
 
+    def _database_write_many(self: T, objects: list[ORMObject],
+                             roots: list[ORMObject]) -> None:
+        ...
+
+    @classmethod
+    def _orm_write_many(cls: type[T], objects: list[ORMObject]) -> None:
+        """Optional. Write objects of a `save_many` batch at once."""
+        ...
+
+    @classmethod
+    def _orm_delete_many(cls: type[T], objects: list[ORMObject]) -> None:
+        """Optional. Delete objects of a `delete_many` batch at once."""
+        ...
+
     def _orm_delete(self: T, no_raise: bool = False) -> None:
         ...
 
     def _orm_restore(self: T) -> None:
         ...
+
+    async def _adatabase_write(self: T) -> None:
+        ...
+
+    async def _adatabase_write_many(self: T, objects: list[ORMObject],
+                                    roots: list[ORMObject]) -> None:
+        ...
+
+    async def _aorm_delete(self: T) -> None:
+        ...
+
+    async def _aorm_restore(self: T) -> None:
+        ...
+
+    async def _aorm_complete(self: T) -> None:
+        ...
@@ -0,0 +1,152 @@
+"""This module defines `slotify`, which turns a JSON class into a slotted
+class. Instances of a slotted class don't carry a `__dict__`. Bookkeeping
+containers like modified fields, previous values and link keys are allocated
+on first use instead of on initialization.
+"""
+from __future__ import annotations
+from typing import Any, Callable, TYPE_CHECKING
+from dataclasses import fields
+from .fdef import FStore
+from .vgraph import mark_dirty
+if TYPE_CHECKING:
+    from .cdef import Cdef
+    from .jobject import JObject
+
+
+Factory = Callable[['JObject'], Any]
+"""A function which creates the initial value of a lazy slot."""
+
+
+class LazySlot:
+    """A data descriptor which wraps the member descriptor of a slot. Reading
+    an empty slot stores and returns a value created by the factory. Deleting
+    an empty slot is allowed, thus a slot can always be reset to its lazy
+    state.
+    """
+
+    __slots__ = ('member', 'factory')
+
+    def __init__(self: LazySlot, member: Any, factory: Factory) -> None:
+        self.member = member
+        self.factory = factory
+
+    def __get__(self: LazySlot, obj: Any, owner: Any = None) -> Any:
+        if obj is None:
+            return self
+        try:
+            return self.member.__get__(obj, owner)
+        except AttributeError:
+            value = self.factory(obj)
+            self.member.__set__(obj, value)
+            return value
+
+    def __set__(self: LazySlot, obj: Any, value: Any) -> None:
+        self.member.__set__(obj, value)
+
+    def __delete__(self: LazySlot, obj: Any) -> None:
+        try:
+            self.member.__delete__(obj)
+        except AttributeError:
+            pass
+
+
+LAZY_SLOTS: dict[str, Factory] = {
+    '_modified_fields': lambda obj: set(),
+    '_previous_values': lambda obj: {},
+    '_unlinked_objects': lambda obj: {},
+    '_link_keys': lambda obj: {},
+    '_unlink_keys': lambda obj: {},
+}
+"""Bookkeeping slots which are filled on first use and their factories."""
+
+STATUS_SLOTS: tuple[str, ...] = ('_is_new', '_is_modified', '_is_partial',
+                                 '_is_deleted', '_operator', '_partial_picks',
+                                 '_graph', '_vgraph')
+"""Bookkeeping slots which are assigned directly."""
+
+
+def _mark_new(self: JObject) -> None:
+    """Mark the jsonclass object as a new object."""
+    setattr(self, '_is_new', True)
+    setattr(self, '_is_modified', False)
+    delattr(self, '_modified_fields')
+    delattr(self, '_previous_values')
+    mark_dirty(self)
+
+
+def _mark_unmodified(self: JObject) -> None:
+    """Mark this jsonclass object as an unmodified object."""
+    setattr(self, '_is_new', False)
+    setattr(self, '_is_modified', False)
+    delattr(self, '_modified_fields')
+    delattr(self, '_previous_values')
+
+
+def _set_initial_status(self: JObject) -> None:
+    """Set the initial status of the JSON class object. Containers are
+    allocated on first use.
+    """
+    setattr(self, '_vgraph', None)
+    self._mark_new()
+    setattr(self, '_is_partial', False)
+    setattr(self, '_is_deleted', False)
+    setattr(self, '_operator', None)
+    setattr(self, '_graph', False)
+
+
+@property
+def _data_dict(self: JObject) -> dict[str, Any]:
+    """A dict which only contains public data field items."""
+    retval = {}
+    for field in self.__class__.cdef.fields:
+        if field.fdef.fstore != FStore.CALCULATED:
+            retval[field.name] = getattr(self, field.name)
+    return retval
+
+
+def slotify(class_: type[JObject], cdef: Cdef) -> type[JObject]:
+    """Create a slotted copy of a JSON class. Slots are created for data
+    fields, local keys and bookkeeping attributes which are not declared by
+    base classes yet.
+
+    Args:
+        class_ (type[JObject]): A JSON class.
+        cdef (Cdef): The class definition computed from `class_`. It's used \
+            for looking up local key names.
+
+    Returns:
+        type[JObject]: A new class which stores values in slots. A new class \
+            definition should be created for it.
+    """
+    inherited: set[str] = set()
+    for base in class_.__mro__[1:-1]:
+        slots = base.__dict__.get('__slots__', ())
+        inherited.update((slots,) if isinstance(slots, str) else slots)
+    has_weakref = any('__weakref__' in base.__dict__
+                      for base in class_.__mro__[1:-1])
+    field_names = [f.name for f in fields(class_)]
+    names = [f.name for f in cdef.fields
+             if f.fdef.fstore != FStore.CALCULATED]
+    names.extend(cdef.local_key_fields.keys())
+    names.extend(STATUS_SLOTS)
+    names.extend(LAZY_SLOTS.keys())
+    if not has_weakref:
+        names.append('__weakref__')
+    cls_dict = dict(class_.__dict__)
+    cls_dict['__slots__'] = tuple(n for n in dict.fromkeys(names)
+                                  if n not in inherited)
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+    cls = type(class_)(class_.__name__, class_.__bases__, cls_dict)
+    cls.__qualname__ = class_.__qualname__
+    for name, factory in LAZY_SLOTS.items():
+        member = cls.__dict__.get(name)
+        if member is not None:
+            setattr(cls, name, LazySlot(member, factory))
+    cls._mark_new = _mark_new
+    cls._mark_unmodified = _mark_unmodified
+    cls._set_initial_status = _set_initial_status
+    cls._data_dict = _data_dict
+    return cls
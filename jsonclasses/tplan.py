@@ -0,0 +1,149 @@
+"""This module defines `TPlan`, the compiled transform plan of a JSON class.
+A transform plan bakes field order, JSON and Python names, write rules,
+default fillers and modifier chains of a class definition into a flat tuple of
+per field closures. Transforming an input dict with a plan doesn't rediscover
+the class definition on every call.
+"""
+from __future__ import annotations
+from typing import Any, Callable, TYPE_CHECKING
+from .fdef import FStore, FType, Nullability, WriteRule
+if TYPE_CHECKING:
+    from .cdef import Cdef
+    from .ctx import Ctx
+    from .jfield import JField
+    from .jobject import JObject
+
+
+TStep = Callable[['Ctx', dict[str, Any], 'JObject', bool, list[str]], None]
+"""A compiled step which transforms a single field of an input dict. The
+arguments are the context, the input dict, the destination object, whether
+in soft apply mode and the nonnull reference list names to fill.
+"""
+
+TFiller = Callable[['Ctx', 'JObject'], None]
+"""A compiled default value filler of a single field."""
+
+
+class TPlan:
+    """The compiled transform plan of a class definition. This is created
+    lazily by `Cdef` for classes with the `compiled` configuration.
+    """
+
+    def __init__(self: TPlan, cdef: Cdef) -> None:
+        cdef._resolve_ref_types_if_needed()
+        self._cdef = cdef
+        self._steps: tuple[TStep, ...] = tuple(
+            self._compile_field(field) for field in cdef.fields)
+
+    @property
+    def cdef(self: TPlan) -> Cdef:
+        """The class definition which this plan is compiled from.
+        """
+        return self._cdef
+
+    def transform(self: TPlan, ctx: Ctx, dest: JObject, soft: bool) -> None:
+        """Fill values of the input dict in `ctx` into `dest`.
+
+        Args:
+            ctx (Ctx): The context which holds the input dict.
+            dest (JObject): The destination object.
+            soft (bool): Whether in soft apply mode. Blank fields are not \
+                filled in soft apply mode.
+        """
+        val = ctx.val
+        nonnull_ref_lists: list[str] = []
+        for step in self._steps:
+            step(ctx, val, dest, soft, nonnull_ref_lists)
+        for cname in nonnull_ref_lists:
+            if getattr(dest, cname) is None:
+                setattr(dest, cname, [])
+
+    def _compile_filler(self: TPlan, field: JField) -> TFiller:
+        name = field.name
+        fdef = field.fdef
+        default = field.default
+        modifier = field.types.modifier
+        if default is not None:
+            def fill_assigned(ctx: Ctx, dest: JObject) -> None:
+                setattr(dest, name, default)
+            return fill_assigned
+
+        def fill_transformed(ctx: Ctx, dest: JObject) -> None:
+            dctx = ctx.default(ctx.original, name, fdef)
+            setattr(dest, name, modifier.transform(dctx))
+        return fill_transformed
+
+    def _compile_absent(self: TPlan, field: JField) -> TStep:
+        name = field.name
+        fdef = field.fdef
+        if fdef.is_ref:
+            if fdef.ftype == FType.LIST:
+                if fdef.collection_nullability == Nullability.NONNULL:
+                    def absent_nonnull_list(ctx: Ctx, val: dict[str, Any],
+                                            dest: JObject, soft: bool,
+                                            nrls: list[str]) -> None:
+                        nrls.append(name)
+                    return absent_nonnull_list
+            elif fdef.fstore == FStore.LOCAL_KEY:
+                refname = field.ref_key
+                crefname = field.json_ref_key
+
+                def absent_local_key(ctx: Ctx, val: dict[str, Any],
+                                     dest: JObject, soft: bool,
+                                     nrls: list[str]) -> None:
+                    if val.get(refname) is not None:
+                        setattr(dest, refname, val.get(refname))
+                    if val.get(crefname) is not None:
+                        setattr(dest, refname, val.get(crefname))
+                return absent_local_key
+            return _absent_noop
+        if fdef.fstore == FStore.CALCULATED:
+            return _absent_noop
+        fill = self._compile_filler(field)
+
+        def absent_fill(ctx: Ctx, val: dict[str, Any], dest: JObject,
+                        soft: bool, nrls: list[str]) -> None:
+            if ctx.ctxcfg.fill_dest_blanks and not soft:
+                fill(ctx, dest)
+        return absent_fill
+
+    def _compile_field(self: TPlan, field: JField) -> TStep:
+        from .types import Types
+        name = field.name
+        jname = field.json_name
+        fdef = field.fdef
+        modifier = field.types.modifier
+        write_rule = fdef.write_rule
+        calculated = fdef.fstore == FStore.CALCULATED
+        absent = self._compile_absent(field)
+        fill = None if calculated else self._compile_filler(field)
+
+        def step(ctx: Ctx, val: dict[str, Any], dest: JObject, soft: bool,
+                 nrls: list[str]) -> None:
+            value = val.get(jname)
+            if value is None:
+                if jname not in val and name not in val:
+                    absent(ctx, val, dest, soft, nrls)
+                    return
+                value = val.get(name)
+            if write_rule is not WriteRule.UNLIMITED:
+                if write_rule is WriteRule.NO_WRITE:
+                    allowed = False
+                elif write_rule is WriteRule.WRITE_ONCE:
+                    cfv = getattr(dest, name)
+                    allowed = cfv is None or isinstance(cfv, Types)
+                else:
+                    allowed = value is not None
+                if not allowed:
+                    if fill is not None and ctx.ctxcfg.fill_dest_blanks:
+                        fill(ctx, dest)
+                    return
+            tsfmd = modifier.transform(ctx.nextvo(value, name, fdef, dest))
+            if not calculated:
+                setattr(dest, name, tsfmd)
+        return step
+
+
+def _absent_noop(ctx: Ctx, val: dict[str, Any], dest: JObject, soft: bool,
+                 nrls: list[str]) -> None:
+    return None
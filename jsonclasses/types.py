@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Callable, Any, Optional
 from datetime import date, datetime, timedelta
 from enum import Enum
-from copy import deepcopy
+from copy import copy
 from .jobject import JObject
 from .fdef import Fdef
 from .keypath import new_mongoid
@@ -89,7 +89,7 @@ class Types:
             self.fdef = Fdef()
             self.modifier = ChainedModifier()
         else:
-            self.fdef = deepcopy(original.fdef)
+            self.fdef = copy(original.fdef)
             modifier = original.modifier
             for arg in args:
                 modifier = modifier.append(arg)
@@ -0,0 +1,114 @@
+"""This module defines `VGraph`, the validation graph. Objects which pass a
+validation are stamped with a validation graph. Objects validated together
+share a graph, and a graph records which of its objects are modified after
+the validation. A stamped object is valid without revalidating if no object
+in its graph is modified since, thus a clean subgraph can be skipped as a
+whole.
+
+Modifications are tracked through the change tracking layer. In place
+mutations of untracked mutable values are not noticed.
+"""
+from __future__ import annotations
+from typing import Any, Optional, TYPE_CHECKING
+if TYPE_CHECKING:
+    from .jobject import JObject
+    from .mgraph import MGraph
+
+
+class VGraph:
+    """The validation graph. Validation graphs are merged as disjoint sets, a
+    merged graph points to the graph it's merged into.
+    """
+
+    __slots__ = ('_parent', '_dirty', '_operator')
+
+    def __init__(self: VGraph) -> None:
+        self._parent: Optional[VGraph] = None
+        self._dirty: dict[int, JObject] = {}
+        self._operator: Any = None
+
+    @property
+    def root(self: VGraph) -> VGraph:
+        """The graph which holds the validation status of this graph.
+        """
+        graph = self
+        while graph._parent is not None:
+            parent = graph._parent
+            if parent._parent is not None:
+                graph._parent = parent._parent
+            graph = parent
+        return graph
+
+    def merge(self: VGraph, other: VGraph) -> VGraph:
+        """Merge two graphs and return the root of the merged graph.
+        """
+        graph = self.root
+        other = other.root
+        if graph is other:
+            return graph
+        if len(graph._dirty) < len(other._dirty):
+            graph, other = other, graph
+        graph._dirty.update(other._dirty)
+        other._dirty = {}
+        other._parent = graph
+        return graph
+
+    def is_clean(self: VGraph, object: JObject, operator: Any,
+                 mgraph: Optional[MGraph] = None) -> bool:
+        """Check whether `object` and objects reachable from it are valid
+        without revalidating.
+
+        Args:
+            object (JObject): An object stamped with this graph.
+            operator (Any): The operator of the current validation.
+            mgraph (Optional[MGraph]): The mark graph of the current \
+                validation. Modified objects which are already marked are \
+                validated by the current validation.
+
+        Returns:
+            bool: Whether the validation of `object` can be skipped.
+        """
+        root = self.root
+        if root._operator is not operator:
+            return False
+        dirty = root._dirty
+        if not dirty:
+            return True
+        if mgraph is None or id(object) in dirty:
+            return False
+        for item in dirty.values():
+            if mgraph.get(item) is not item:
+                return False
+        return True
+
+
+def mark_dirty(object: JObject) -> None:
+    """Record that a validated object is modified.
+    """
+    graph = object._vgraph
+    if graph is not None:
+        graph.root._dirty[id(object)] = object
+
+
+def stamp(mgraph: MGraph, operator: Any) -> None:
+    """Stamp objects marked in a successful validation as valid.
+
+    Args:
+        mgraph (MGraph): The mark graph of the validation.
+        operator (Any): The operator of the validation.
+    """
+    graph: Optional[VGraph] = None
+    fresh: list[JObject] = []
+    for object in mgraph:
+        ograph = object._vgraph
+        if ograph is None:
+            fresh.append(object)
+            continue
+        root = ograph.root
+        root._dirty.pop(id(object), None)
+        graph = root if graph is None else graph.merge(root)
+    if graph is None:
+        graph = VGraph()
+    for object in fresh:
+        object._vgraph = graph
+    graph.root._operator = operator
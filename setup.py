@@ -15,7 +15,8 @@ setup(
     author='Fillmula Inc.',
     author_email='victor.teo@fillmula.com',
     license='MIT',
-    packages=find_packages(exclude=('tests')),
+    packages=find_packages(exclude=('tests', 'tests.*',
+                                    'benchmarks', 'benchmarks.*')),
     package_data={'jsonclasses': ['py.typed']},
     zip_safe=False,
     url='https://github.com/fillmula/jsonclasses',
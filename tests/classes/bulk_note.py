@@ -0,0 +1,56 @@
+from __future__ import annotations
+from typing import Any
+from jsonclasses import jsonclass, types
+from jsonclasses.orm_object import ORMObject
+from tests.memory_orm import MemoryStore, memory_orm
+
+
+bulk_store = MemoryStore()
+
+
+def check_title(note: Any, operator: Any) -> bool:
+    return not note.title.startswith('locked')
+
+
+def check_draft(draft: Any) -> None:
+    if draft.title == 'crash':
+        raise RuntimeError('callback failed')
+
+
+@memory_orm(bulk_store)
+@jsonclass(class_graph='bulk', can_create=check_title, can_update=check_title,
+           can_delete=check_title)
+class BulkNote:
+    id: int = types.int.primary.required
+    title: str = types.str.maxlength(10).required
+
+
+@memory_orm(bulk_store)
+@jsonclass(class_graph='bulk')
+class BulkEntry:
+    id: int = types.int.primary.required
+    title: str = types.str.required
+
+    @classmethod
+    def _orm_write_many(cls, objects: list[Any]) -> None:
+        if any(o.title == 'fail' for o in objects):
+            raise RuntimeError('write failed')
+        bulk_store.batches.append(list(objects))
+        for object in objects:
+            object._database_write()
+
+    @classmethod
+    def _orm_delete_many(cls, objects: list[Any]) -> None:
+        bulk_store.batches.append(list(objects))
+        for object in objects:
+            object._orm_delete()
+
+
+@memory_orm(bulk_store)
+@jsonclass(class_graph='bulk', on_create=check_draft, on_delete=check_draft)
+class BulkDraft:
+    id: int = types.int.primary.required
+    title: str = types.str.required
+
+    _orm_write_many = ORMObject.__dict__['_orm_write_many']
+    _orm_delete_many = ORMObject.__dict__['_orm_delete_many']
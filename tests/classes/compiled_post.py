@@ -0,0 +1,22 @@
+from __future__ import annotations
+from typing import Annotated, Optional
+from jsonclasses import jsonclass, types, linkto, linkedby
+
+
+@jsonclass(class_graph='compiled', compiled=True)
+class CompiledAuthor:
+    id: str = types.str.primary.required
+    name: str
+    posts: Annotated[list[CompiledPost], linkedby('author')]
+
+
+@jsonclass(class_graph='compiled', compiled=True)
+class CompiledPost:
+    id: str = types.str.primary.required
+    title: str = types.str.trim.required
+    views: int = 0
+    code: Optional[str] = types.str.writeonce
+    note: Optional[str] = types.str.writenonnull
+    secret: Optional[str] = types.str.readonly
+    tags: list[str] = types.nonnull.listof(str)
+    author: Annotated[CompiledAuthor, linkto]
@@ -0,0 +1,28 @@
+from __future__ import annotations
+from typing import Any
+from jsonclasses import jsonclass, types
+
+
+dw_writes: list[Any] = []
+
+
+def _database_write(self: Any) -> None:
+    dw_writes.append(self)
+
+
+@jsonclass(class_graph='dw')
+class DWAuthor:
+    id: int = types.int.primary.required
+    name: str
+    posts: list[DWPost] = types.nonnull.listof('DWPost').linkedby('author')
+
+
+@jsonclass(class_graph='dw')
+class DWPost:
+    id: int = types.int.primary.required
+    title: str
+    author: DWAuthor = types.objof('DWAuthor').linkto
+
+
+DWAuthor._database_write = _database_write
+DWPost._database_write = _database_write
@@ -0,0 +1,36 @@
+from __future__ import annotations
+from typing import Optional
+from jsonclasses import jsonclass, types
+
+
+@jsonclass(class_graph='fm')
+class FMAuthor:
+    id: int = types.int.primary.required
+    name: Optional[str] = types.str.writenonnull
+    posts: list[FMPost] = types.nonnull.listof('FMPost').linkedby('author')
+
+
+@jsonclass(class_graph='fm')
+class FMPost:
+    id: int = types.int.primary.required
+    title: str = types.str.required
+    meta: dict[str, str] = types.dictof(str)
+    author: Optional[FMAuthor] = types.objof('FMAuthor').linkto
+
+
+@jsonclass(class_graph='fm')
+class FMNote:
+    content: str = types.str.required
+    word_count: Optional[int]
+
+
+@jsonclass(class_graph='fm', abstract=True)
+class FMBase:
+    name: str
+
+
+@jsonclass(class_graph='fm')
+class FMAccount:
+    name: str
+    password: str = types.str.writeonly.required
+    code: str = types.str.temp
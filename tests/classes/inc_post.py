@@ -0,0 +1,43 @@
+from __future__ import annotations
+from typing import Optional
+from jsonclasses import jsonclass, types
+from tests.memory_orm import MemoryStore, memory_orm
+
+
+inc_store = MemoryStore()
+
+
+@memory_orm(inc_store)
+@jsonclass(class_graph='inc')
+class IncAuthor:
+    id: int = types.int.primary.required
+    name: str
+    profile: Optional[IncProfile] = types.objof('IncProfile') \
+                                         .linkedby('author')
+    posts: list[IncPost] = types.nonnull.listof('IncPost').linkedby('author')
+    favorites: list[IncTag] = types.nonnull.listof('IncTag').linkto
+
+
+@memory_orm(inc_store)
+@jsonclass(class_graph='inc')
+class IncProfile:
+    id: int = types.int.primary.required
+    bio: str
+    author: Optional[IncAuthor] = types.objof('IncAuthor').linkto
+
+
+@memory_orm(inc_store)
+@jsonclass(class_graph='inc')
+class IncPost:
+    id: int = types.int.primary.required
+    title: str
+    author: Optional[IncAuthor] = types.objof('IncAuthor').linkto
+    tags: list[IncTag] = types.nonnull.listof('IncTag').linkedthru('posts')
+
+
+@memory_orm(inc_store)
+@jsonclass(class_graph='inc')
+class IncTag:
+    id: int = types.int.primary.required
+    name: str
+    posts: list[IncPost] = types.nonnull.listof('IncPost').linkedthru('tags')
@@ -0,0 +1,24 @@
+from __future__ import annotations
+from typing import Optional
+from jsonclasses import jsonclass, types
+
+
+@jsonclass(class_graph='iv')
+class IVProfile:
+    bio: str = types.str.maxlength(10).required
+
+
+@jsonclass(class_graph='iv')
+class IVAuthor:
+    id: int = types.int.primary.required
+    name: str = types.str.maxlength(10).required
+    profile: Optional[IVProfile] = types.objof('IVProfile')
+    posts: list[IVPost] = types.nonnull.listof('IVPost').linkedby('author')
+
+
+@jsonclass(class_graph='iv')
+class IVPost:
+    id: int = types.int.primary.required
+    title: str = types.str.maxlength(10).required
+    tags: list[str] = types.nonnull.listof(types.str.maxlength(5))
+    author: Optional[IVAuthor] = types.objof('IVAuthor').linkto
@@ -0,0 +1,26 @@
+from __future__ import annotations
+from typing import Annotated, Optional
+from jsonclasses import jsonclass, types, linkto, linkedby
+
+
+@jsonclass(class_graph='slots', slots=True)
+class SlotAuthor:
+    id: str = types.str.primary.required
+    name: str
+    posts: Annotated[list[SlotPost], linkedby('author')]
+
+
+@jsonclass(class_graph='slots', slots=True)
+class SlotPost:
+    id: str = types.str.primary.required
+    title: str = types.str.trim.required
+    views: int = 0
+    tags: list[str] = types.nonnull.listof(str)
+    author: Annotated[SlotAuthor, linkto]
+
+
+@jsonclass(class_graph='slots', slots=True, reset_all_fields=True)
+class SlotScore:
+    name: str
+    score: Optional[int] = types.int.min(0)
+    label: str = types.str.getter(lambda s: f'{s.name}: {s.score}')
@@ -0,0 +1,201 @@
+"""An in-memory stand-in of a JSON Classes ORM integration for tests. Objects
+are stored as records of stored field values and local keys. Queries create
+new objects from records like a database backed integration does, and every
+executed query is logged, thus tests can count round trips.
+"""
+from __future__ import annotations
+from typing import Any, Callable, Generator, Optional
+from asyncio import gather, sleep
+from jsonclasses.fdef import FStore, FType
+from jsonclasses.jfield import JField
+from jsonclasses.identity_map import current_identity_map
+
+
+class MemoryStore:
+    """The storage of records, join table pairs and the query log."""
+
+    def __init__(self) -> None:
+        self.records: dict[str, dict[Any, dict[str, Any]]] = {}
+        self.joins: dict[tuple, set[tuple[Any, Any]]] = {}
+        self.queries: list[tuple[str, str]] = []
+        self.batches: list[list[Any]] = []
+        self.writing = 0
+        self.max_writing = 0
+
+    def clear(self) -> None:
+        self.records.clear()
+        self.joins.clear()
+        self.queries.clear()
+        self.batches.clear()
+        self.writing = 0
+        self.max_writing = 0
+
+    def table(self, cls: type) -> dict[Any, dict[str, Any]]:
+        return self.records.setdefault(cls.cdef.name, {})
+
+    def join(self, field: JField) -> tuple[tuple, bool]:
+        """Get the join table name of a join table field, and whether the
+        field is the left side of the pairs.
+        """
+        left = (field.cdef.name, field.name)
+        right = (field.foreign_field.cdef.name, field.foreign_field.name)
+        name = tuple(sorted([left, right]))
+        return name, name[0] == left
+
+    def linked_ids(self, field: JField, pk: Any) -> list[Any]:
+        name, left = self.join(field)
+        pairs = self.joins.get(name, set())
+        if left:
+            return sorted(b for a, b in pairs if a == pk)
+        return sorted(a for a, b in pairs if b == pk)
+
+    def link(self, field: JField, pk: Any, other: Any) -> None:
+        name, left = self.join(field)
+        self.joins.setdefault(name, set()).add(
+            (pk, other) if left else (other, pk))
+
+
+def join_fields(cls: type) -> list[JField]:
+    return [f for f in cls.cdef.fields
+            if f.fdef.fstore == FStore.FOREIGN_KEY and f.fdef.use_join_table]
+
+
+def record_of(object: Any) -> dict[str, Any]:
+    record: dict[str, Any] = {}
+    for field in object.__class__.cdef.fields:
+        fstore = field.fdef.fstore
+        if fstore == FStore.LOCAL_KEY:
+            value = getattr(object, field.ref_key)
+            record[field.ref_key] = list(value) \
+                if isinstance(value, list) else value
+        elif fstore not in (FStore.CALCULATED, FStore.FOREIGN_KEY,
+                            FStore.TEMP):
+            record[field.name] = getattr(object, field.name)
+    return record
+
+
+class MemoryQuery:
+    """A query which is executed against a memory store."""
+
+    def __init__(self, cls: type, store: MemoryStore, kind: str,
+                 run: Callable[[], Any]) -> None:
+        self.cls = cls
+        self.store = store
+        self.kind = kind
+        self.run = run
+
+    def exec(self) -> Any:
+        self.store.queries.append((self.cls.__name__, self.kind))
+        return self.run()
+
+    def __await__(self) -> Generator[Any, None, Any]:
+        yield from sleep(0).__await__()
+        return self.exec()
+
+
+def memory_orm(store: MemoryStore) -> Callable[[type], type]:
+    """Make a JSON class stored in `store`."""
+    def decorator(cls: type) -> type:
+        def materialize(record: dict[str, Any]) -> Any:
+            imap = current_identity_map()
+            if imap is not None:
+                pk = record[cls.cdef.primary_field.name]
+                exist = imap.get(cls, pk)
+                if exist is not None:
+                    return exist
+            object = cls(**record)
+            for field in cls.cdef.fields:
+                if field.fdef.fstore == FStore.LOCAL_KEY \
+                        and field.fdef.ftype == FType.LIST:
+                    setattr(object, field.ref_key, list(record[field.ref_key]))
+            for field in join_fields(cls):
+                setattr(object, field.ref_key,
+                        store.linked_ids(field, object._id))
+            object._mark_unmodified()
+            return object
+
+        def matches(record: dict[str, Any], filter: dict[str, Any]) -> bool:
+            pk = record[cls.cdef.primary_field.name]
+            for key, expected in filter.items():
+                jfield = next((f for f in join_fields(cls)
+                               if f.ref_key == key), None)
+                if jfield is not None:
+                    value = store.linked_ids(jfield, pk)
+                else:
+                    value = record.get(key)
+                values = value if isinstance(value, list) else [value]
+                if isinstance(expected, list):
+                    if not any(v in expected for v in values):
+                        return False
+                elif expected not in values:
+                    return False
+            return True
+
+        def find(cls_: type, **filter: Any) -> MemoryQuery:
+            return MemoryQuery(cls, store, 'find', lambda: [
+                materialize(r) for r in store.table(cls).values()
+                if matches(r, filter)])
+
+        def one(cls_: type, **filter: Any) -> MemoryQuery:
+            return MemoryQuery(cls, store, 'one', lambda: next(
+                (materialize(r) for r in store.table(cls).values()
+                 if matches(r, filter)), None))
+
+        def id(cls_: type, pk: Any) -> MemoryQuery:
+            def run() -> Optional[Any]:
+                record = store.table(cls).get(pk)
+                return materialize(record) if record is not None else None
+            return MemoryQuery(cls, store, 'id', run)
+
+        def ids(cls_: type, pks: list[Any]) -> MemoryQuery:
+            return MemoryQuery(cls, store, 'ids', lambda: [
+                materialize(store.table(cls)[pk]) for pk in pks
+                if pk in store.table(cls)])
+
+        def _database_write(self: Any) -> None:
+            store.table(cls)[self._id] = record_of(self)
+            for field in join_fields(cls):
+                if field.fdef.ftype != FType.LIST:
+                    continue
+                for item in getattr(self, field.name) or []:
+                    if item._id is not None:
+                        store.link(field, self._id, item._id)
+            self._mark_unmodified()
+
+        def _database_write_many(self: Any, objects: list[Any],
+                                 roots: list[Any]) -> None:
+            store.batches.append(list(objects))
+            for object in objects:
+                object._database_write()
+
+        async def _adatabase_write(self: Any) -> None:
+            store.writing += 1
+            store.max_writing = max(store.max_writing, store.writing)
+            await sleep(0)
+            store.writing -= 1
+            _database_write(self)
+
+        async def _adatabase_write_many(self: Any, objects: list[Any],
+                                        roots: list[Any]) -> None:
+            store.batches.append(list(objects))
+            await gather(*(object._adatabase_write() for object in objects))
+
+        def _orm_delete(self: Any) -> None:
+            store.table(cls).pop(self._id, None)
+
+        async def _aorm_delete(self: Any) -> None:
+            await sleep(0)
+            _orm_delete(self)
+
+        cls.find = classmethod(find)
+        cls.one = classmethod(one)
+        cls.id = classmethod(id)
+        cls.ids = classmethod(ids)
+        cls._database_write = _database_write
+        cls._database_write_many = _database_write_many
+        cls._adatabase_write = _adatabase_write
+        cls._adatabase_write_many = _adatabase_write_many
+        cls._orm_delete = _orm_delete
+        cls._aorm_delete = _aorm_delete
+        return cls
+    return decorator
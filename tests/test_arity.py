@@ -0,0 +1,38 @@
+from __future__ import annotations
+from unittest import TestCase
+from jsonclasses.arity import adapt, param_count
+
+
+class Counter:
+
+    def count(self, a, b):
+        return (a, b)
+
+
+class TestArity(TestCase):
+
+    def test_param_count_counts_parameters(self):
+        self.assertEqual(param_count(lambda: None), 0)
+        self.assertEqual(param_count(lambda a, b, c: None), 3)
+
+    def test_param_count_counts_bound_method_parameters(self):
+        self.assertEqual(param_count(Counter().count), 2)
+        self.assertEqual(param_count(Counter.count), 3)
+        self.assertEqual(param_count(Counter().count), 2)
+
+    def test_param_count_accepts_non_weakrefable_callables(self):
+        self.assertEqual(param_count(len), 1)
+
+    def test_adapt_passes_leading_arguments(self):
+        self.assertEqual(adapt(lambda: 0)(1, 2, 3), 0)
+        self.assertEqual(adapt(lambda a: a)(1, 2, 3), 1)
+        self.assertEqual(adapt(lambda a, b: (a, b))(1, 2, 3), (1, 2))
+        self.assertEqual(adapt(lambda a, b, c: (a, b, c))(1, 2, 3),
+                         (1, 2, 3))
+        self.assertEqual(adapt(Counter().count)(1, 2, 3), (1, 2))
+
+    def test_adapt_passes_arguments_by_layout(self):
+        invoker = adapt(lambda a: a, {1: (1,)})
+        self.assertEqual(invoker(1, 2, 3), 2)
+        invoker = adapt(lambda a, b: (a, b), {1: (1,)})
+        self.assertEqual(invoker(1, 2, 3), (1, 2))
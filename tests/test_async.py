@@ -0,0 +1,116 @@
+from __future__ import annotations
+from unittest import IsolatedAsyncioTestCase
+from tests.classes.inc_post import (IncAuthor, IncProfile, IncPost, IncTag,
+                                    inc_store)
+from tests.classes.dw_author import DWAuthor, dw_writes
+from jsonclasses.excs import ValidationException
+
+
+class TestAsync(IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self) -> None:
+        inc_store.clear()
+        tags = [IncTag(id=i, name=f'T{i}') for i in range(3)]
+        for tag in tags:
+            await tag.asave()
+        for i in range(2):
+            author = IncAuthor(id=i, name=f'A{i}')
+            author.favorite_ids = [t.id for t in tags[i:]]
+            await author.asave()
+            await IncProfile(id=i, bio=f'B{i}', author_id=i).asave()
+        for i in range(6):
+            post = IncPost(id=i, title=f'P{i}', author_id=i % 2)
+            post.tags = tags[:i % 3]
+            await post.asave()
+        inc_store.queries.clear()
+
+    async def test_asave_writes_object(self):
+        author = IncAuthor(id=5, name='A5')
+        self.assertIs(await author.asave(), author)
+        self.assertEqual(inc_store.table(IncAuthor)[5]['name'], 'A5')
+        self.assertFalse(author.is_new)
+        self.assertFalse(author.is_modified)
+
+    async def test_asave_validates_before_writing(self):
+        author = IncAuthor(name='A5')
+        with self.assertRaises(ValidationException):
+            await author.asave()
+        self.assertNotIn(None, inc_store.table(IncAuthor))
+
+    async def test_asave_skips_validation(self):
+        author = IncAuthor(id=5)
+        await author.asave(skip_validation=True)
+        self.assertIsNone(inc_store.table(IncAuthor)[5]['name'])
+
+    async def test_asave_writes_unlinked_objects_concurrently(self):
+        author = (await IncAuthor.id(0)).include('posts')
+        posts = author.posts
+        author.posts = []
+        inc_store.max_writing = 0
+        await author.asave()
+        self.assertGreater(inc_store.max_writing, 1)
+        self.assertEqual(author.unlinked_objects, {'posts': []})
+        for post in posts:
+            self.assertIsNone(inc_store.table(IncPost)[post.id]['author_id'])
+
+    async def test_asave_writes_planned_objects_in_one_batch(self):
+        author = IncAuthor(id=5, name='A5', posts=[
+            {'id': 10, 'title': 'P10'}, {'id': 11, 'title': 'P11'}])
+        inc_store.batches.clear()
+        await author.asave()
+        self.assertEqual(len(inc_store.batches), 1)
+        self.assertEqual(len(inc_store.batches[0]), 3)
+        self.assertEqual(inc_store.table(IncPost)[11]['author_id'], 5)
+
+    async def test_asave_validates_unlinked_objects_before_writing(self):
+        author = (await IncAuthor.id(0)).include('posts')
+        post = author.posts[0]
+        author.posts = []
+        post.title = None
+        inc_store.batches.clear()
+        with self.assertRaises(ValidationException):
+            await author.asave()
+        self.assertEqual(inc_store.batches, [])
+
+    async def test_asave_writes_roots_without_batch_override(self):
+        dw_writes.clear()
+        author = DWAuthor(id=1, name='A1', posts=[{'id': 1, 'title': 'P1'}])
+        await author.asave()
+        self.assertEqual(dw_writes, [author])
+
+    async def test_adelete_deletes_object(self):
+        post = await IncPost.id(1)
+        self.assertIs(await post.adelete(), post)
+        self.assertNotIn(1, inc_store.table(IncPost))
+
+    async def test_ainclude_fetches_local_key(self):
+        post = await IncPost.id(3)
+        inc_store.queries.clear()
+        await post.ainclude('author')
+        self.assertEqual(inc_store.queries, [('IncAuthor', 'id')])
+        self.assertEqual(post.author.name, 'A1')
+        self.assertFalse(post.is_modified)
+
+    async def test_ainclude_fetches_join_table_field(self):
+        tag = await IncTag.id(1)
+        await tag.ainclude('posts')
+        self.assertEqual([p.id for p in tag.posts], [2, 5])
+
+    async def test_ainclude_join_table_field_of_object_without_id(self):
+        post = IncPost(title='P')
+        await post.ainclude('tags')
+        self.assertEqual(post.tags, [])
+        self.assertEqual(inc_store.queries, [])
+
+    async def test_ainclude_many_fetches_each_level_in_one_query(self):
+        posts = await IncPost.find()
+        inc_store.queries.clear()
+        await IncPost.ainclude_many(posts, 'author.profile')
+        self.assertEqual(inc_store.queries,
+                         [('IncAuthor', 'ids'), ('IncProfile', 'find')])
+        self.assertEqual([p.author.profile.bio for p in posts],
+                         ['B0', 'B1', 'B0', 'B1', 'B0', 'B1'])
+
+    async def test_acomplete_returns_object(self):
+        post = await IncPost.id(2)
+        self.assertIs(await post.acomplete(), post)
@@ -0,0 +1,114 @@
+from __future__ import annotations
+from unittest import TestCase
+from tests.classes.bulk_note import (BulkNote, BulkEntry, BulkDraft,
+                                      bulk_store)
+from tests.classes.inc_post import IncAuthor, IncPost, inc_store
+from jsonclasses.excs import ValidationException, UnauthorizedActionException
+
+
+class TestBulk(TestCase):
+
+    def setUp(self) -> None:
+        bulk_store.clear()
+        inc_store.clear()
+
+    def test_save_many_saves_objects(self):
+        notes = [BulkNote(id=i, title=f'N{i}').opby(1) for i in range(3)]
+        result = BulkNote.save_many(notes)
+        self.assertEqual(result.objects, notes)
+        self.assertEqual(result.errors, [])
+        self.assertEqual(sorted(bulk_store.table(BulkNote)), [0, 1, 2])
+        for note in notes:
+            self.assertFalse(note.is_new)
+
+    def test_save_many_reports_failed_items(self):
+        notes = [BulkNote(id=0, title='N0').opby(1),
+                 BulkNote(id=1, title='locked').opby(1),
+                 BulkNote(id=2, title='N2' * 10).opby(1),
+                 BulkNote(id=3, title='N3').opby(1)]
+        result = BulkNote.save_many(notes)
+        self.assertEqual(result.objects, [notes[0], notes[3]])
+        self.assertEqual([e.index for e in result.errors], [1, 2])
+        self.assertIs(result.errors[0].object, notes[1])
+        self.assertIsInstance(result.errors[0].exception,
+                              UnauthorizedActionException)
+        self.assertIsInstance(result.errors[1].exception,
+                              ValidationException)
+        self.assertEqual(sorted(bulk_store.table(BulkNote)), [0, 3])
+
+    def test_save_many_reports_items_of_failed_callbacks(self):
+        drafts = [BulkDraft(id=0, title='D0'), BulkDraft(id=1, title='crash'),
+                  BulkDraft(id=2, title='D2')]
+        result = BulkDraft.save_many(drafts)
+        self.assertEqual(result.objects, [drafts[0], drafts[2]])
+        self.assertEqual([e.index for e in result.errors], [1])
+        self.assertIsInstance(result.errors[0].exception, RuntimeError)
+        self.assertEqual(sorted(bulk_store.table(BulkDraft)), [0, 2])
+
+    def test_save_many_skips_protocol_stub_hooks(self):
+        drafts = [BulkDraft(id=i, title=f'D{i}') for i in range(3)]
+        result = BulkDraft.save_many(drafts)
+        self.assertEqual(result.objects, drafts)
+        self.assertEqual(sorted(bulk_store.table(BulkDraft)), [0, 1, 2])
+
+    def test_save_many_skips_validation(self):
+        notes = [BulkNote(id=0, title='N0' * 10).opby(1)]
+        result = BulkNote.save_many(notes, skip_validation=True)
+        self.assertEqual(result.errors, [])
+        self.assertIn(0, bulk_store.table(BulkNote))
+
+    def test_save_many_writes_shared_objects_once(self):
+        author = IncAuthor(id=1, name='A1')
+        posts = [IncPost(id=i, title=f'P{i}', author=author)
+                 for i in range(3)]
+        result = IncPost.save_many(posts)
+        self.assertEqual(result.objects, posts)
+        written = [o for batch in inc_store.batches for o in batch]
+        self.assertEqual(len(written), 4)
+        self.assertIs(written[0], author)
+
+    def test_save_many_writes_with_bulk_hook(self):
+        entries = [BulkEntry(id=i, title=f'E{i}') for i in range(3)]
+        result = BulkEntry.save_many(entries)
+        self.assertEqual(result.objects, entries)
+        self.assertEqual(bulk_store.batches, [entries])
+
+    def test_save_many_fails_each_item_of_failed_bulk_hook(self):
+        entries = [BulkEntry(id=0, title='E0'), BulkEntry(id=1),
+                   BulkEntry(id=2, title='fail')]
+        result = BulkEntry.save_many(entries)
+        self.assertEqual(result.objects, [])
+        self.assertEqual([e.index for e in result.errors], [0, 1, 2])
+        self.assertIsInstance(result.errors[1].exception,
+                              ValidationException)
+        self.assertIsInstance(result.errors[2].exception, RuntimeError)
+        self.assertEqual(bulk_store.table(BulkEntry), {})
+
+    def test_delete_many_deletes_objects(self):
+        notes = [BulkNote(id=i, title=f'N{i}').opby(1) for i in range(3)]
+        BulkNote.save_many(notes)
+        notes[1].title = 'locked'
+        result = BulkNote.delete_many(notes)
+        self.assertEqual(result.objects, [notes[0], notes[2]])
+        self.assertEqual([e.index for e in result.errors], [1])
+        self.assertIsInstance(result.errors[0].exception,
+                              UnauthorizedActionException)
+        self.assertEqual(list(bulk_store.table(BulkNote)), [1])
+
+    def test_delete_many_deletes_with_bulk_hook(self):
+        entries = [BulkEntry(id=i, title=f'E{i}') for i in range(3)]
+        BulkEntry.save_many(entries)
+        bulk_store.batches.clear()
+        result = BulkEntry.delete_many(entries)
+        self.assertEqual(result.objects, entries)
+        self.assertEqual(bulk_store.batches, [entries])
+        self.assertEqual(bulk_store.table(BulkEntry), {})
+
+    def test_delete_many_skips_protocol_stub_hooks(self):
+        drafts = [BulkDraft(id=i, title=f'D{i}') for i in range(3)]
+        BulkDraft.save_many(drafts)
+        drafts[1].title = 'crash'
+        result = BulkDraft.delete_many(drafts)
+        self.assertEqual(result.objects, [drafts[0], drafts[2]])
+        self.assertIsInstance(result.errors[0].exception, RuntimeError)
+        self.assertEqual(list(bulk_store.table(BulkDraft)), [1])
@@ -0,0 +1,36 @@
+from __future__ import annotations
+from unittest import TestCase
+from jsonclasses import types
+from jsonclasses.modifiers.eager_modifier import EagerModifier
+from jsonclasses.modifiers.preserialize_modifier import PreserializeModifier
+
+
+class TestChained(TestCase):
+
+    def test_chained_modifier_partitions_phases(self):
+        modifier = types.str.trim.salt.required.modifier
+        self.assertIsInstance(modifier.tvs, tuple)
+        self.assertIsInstance(modifier.nvs, tuple)
+        self.assertIsInstance(modifier.pvs, tuple)
+        self.assertIsInstance(modifier.nvs[0], EagerModifier)
+        for v in modifier.nvs[1:]:
+            self.assertNotIsInstance(v, EagerModifier)
+        self.assertEqual(modifier.tvs + modifier.nvs + modifier.pvs,
+                         tuple(modifier.vs))
+
+    def test_chained_modifier_without_eager_modifier_is_normal(self):
+        modifier = types.any.required.modifier
+        self.assertEqual(modifier.tvs, ())
+        self.assertEqual(modifier.nvs, tuple(modifier.vs))
+        self.assertEqual(modifier.pvs, ())
+
+    def test_chained_modifier_partitions_preserialize_modifiers(self):
+        modifier = types.str.setonsave(lambda: 'a').required.modifier
+        self.assertIsInstance(modifier.pvs[0], PreserializeModifier)
+        self.assertEqual(modifier.nvs + modifier.pvs, tuple(modifier.vs))
+
+    def test_chained_modifier_skips_no_op_modifiers_on_tojson(self):
+        modifier = types.str.primary.index.readonly.required.modifier
+        self.assertEqual(modifier.jvs, ())
+        modifier = types.date.readonly.required.modifier
+        self.assertEqual(len(modifier.jvs), 1)
@@ -0,0 +1,53 @@
+from __future__ import annotations
+from unittest import TestCase
+from jsonclasses.excs import ValidationException
+from tests.classes.compiled_post import CompiledPost, CompiledAuthor
+
+
+class TestCompiled(TestCase):
+
+    def test_compiled_class_has_transform_plan(self):
+        self.assertIsNotNone(CompiledPost.cdef.tplan)
+        self.assertIs(CompiledPost.cdef.tplan, CompiledPost.cdef.tplan)
+
+    def test_compiled_class_fills_default_values(self):
+        post = CompiledPost(id='1', title='  T  ')
+        self.assertEqual(post.title, 'T')
+        self.assertEqual(post.views, 0)
+        self.assertEqual(post.tags, [])
+        self.assertEqual(post.code, None)
+
+    def test_compiled_class_accepts_camelized_and_underscored_keys(self):
+        post = CompiledPost(id='1', title='T', authorId='2')
+        self.assertEqual(post.author_id, '2')
+        post = CompiledPost(id='1', title='T', author_id='3')
+        self.assertEqual(post.author_id, '3')
+
+    def test_compiled_class_respects_write_rules(self):
+        post = CompiledPost(id='1', title='T', code='A', secret='S')
+        self.assertEqual(post.code, 'A')
+        self.assertEqual(post.secret, None)
+        post.set(code='B', note='N')
+        self.assertEqual(post.code, 'A')
+        self.assertEqual(post.note, 'N')
+        post.set(note=None)
+        self.assertEqual(post.note, 'N')
+
+    def test_compiled_class_links_nested_objects(self):
+        author = CompiledAuthor(id='a', name='A', posts=[
+            {'id': '1', 'title': 'P1'}, {'id': '2', 'title': 'P2'}])
+        self.assertEqual(len(author.posts), 2)
+        self.assertIs(author.posts[0].author, author)
+        self.assertEqual(author.posts[1].author_id, 'a')
+
+    def test_compiled_class_raises_on_strict_input(self):
+        with self.assertRaises(ValidationException) as context:
+            CompiledPost(id='1', title='T', unknown='U')
+        self.assertEqual(context.exception.keypath_messages['unknown'],
+                         'key is not allowed')
+
+    def test_compiled_class_tojson_matches_input(self):
+        post = CompiledPost(id='1', title='T', tags=['a'], authorId='2')
+        self.assertEqual(post.tojson(), {
+            'id': '1', 'title': 'T', 'views': 0, 'tags': ['a'],
+            'authorId': '2'})
@@ -0,0 +1,33 @@
+from __future__ import annotations
+from unittest import TestCase
+from jsonclasses.ctx import Ctx, CtxCfg
+from tests.classes.simple_article import SimpleArticle
+
+
+class TestCtx(TestCase):
+
+    def test_nval_shares_frame_and_replaces_value(self):
+        article = SimpleArticle(title='A')
+        fdef = SimpleArticle.cdef.field_named('title').fdef
+        ctx = Ctx.rootctx(article, CtxCfg()).nextv('A', 'title', fdef)
+        nctx = ctx.nval('B')
+        self.assertIs(nctx.frame, ctx.frame)
+        self.assertEqual(nctx.val, 'B')
+        self.assertEqual(ctx.val, 'A')
+        self.assertIs(nctx.fdef, fdef)
+        self.assertEqual(nctx.keypathr, ['title'])
+        self.assertEqual(nctx.skeypathr, 'title')
+
+    def test_context_is_immutable(self):
+        article = SimpleArticle(title='A')
+        ctx = Ctx.rootctx(article, CtxCfg())
+        with self.assertRaises(AttributeError):
+            ctx.root = None
+
+    def test_root_contexts_share_canonical_root_fdef(self):
+        article = SimpleArticle(title='A')
+        ctx1 = Ctx.rootctx(article, CtxCfg())
+        ctx2 = Ctx.rootctxp(article, 'title', 'A', None)
+        self.assertIs(ctx1.fdef, SimpleArticle.cdef.root_fdef)
+        self.assertIs(ctx2.fdef, SimpleArticle.cdef.root_fdef)
+        self.assertIs(ctx1.fdef.cdef, SimpleArticle.cdef)
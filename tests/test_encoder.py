@@ -19,3 +19,16 @@ class TestEncoder(TestCase):
         self.assertEqual(
             json_str,
             '[{"name": "John", "age": 7}, {"name": "Peter", "age": 8}]')
+
+    def test_json_encoder_encodes_tuple(self):
+        user1 = SimpleUser(name='John', age=7)
+        user2 = SimpleUser(name='Peter', age=8)
+        json_str = dumps((user1, user2), cls=JSONEncoder)
+        self.assertEqual(
+            json_str,
+            '[{"name": "John", "age": 7}, {"name": "Peter", "age": 8}]')
+
+    def test_json_encoder_encodes_mixed_list(self):
+        user = SimpleUser(name='John', age=7)
+        json_str = dumps([user, 1], cls=JSONEncoder)
+        self.assertEqual(json_str, '[{"name": "John", "age": 7}, 1]')
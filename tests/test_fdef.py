@@ -0,0 +1,28 @@
+from __future__ import annotations
+from unittest import TestCase
+from jsonclasses import types
+
+
+class TestFdef(TestCase):
+
+    def test_chaining_does_not_modify_original_fdef(self):
+        base = types.str
+        required = base.required
+        self.assertFalse(base.fdef.required)
+        self.assertTrue(required.fdef.required)
+        self.assertIsNot(base.fdef, required.fdef)
+
+    def test_chaining_shares_nested_types(self):
+        item_types = types.str.maxlength(5)
+        list_types = types.listof(item_types)
+        self.assertIs(list_types.required.fdef.raw_item_types,
+                      list_types.fdef.raw_item_types)
+
+    def test_index_names_are_not_shared_between_chains(self):
+        base = types.str.cindex('a')
+        first = base.cindex('b')
+        second = base.cunique('c')
+        self.assertEqual(base.fdef.cindex_names, ['a'])
+        self.assertEqual(first.fdef.cindex_names, ['a', 'b'])
+        self.assertEqual(second.fdef.cindex_names, ['a'])
+        self.assertEqual(second.fdef.cunique_names, ['c'])
@@ -0,0 +1,88 @@
+from __future__ import annotations
+from unittest import TestCase
+from jsonclasses.excs import AbstractJSONClassException
+from tests.classes.fm_author import FMAuthor, FMPost, FMNote, FMBase
+
+
+class TestFromMany(TestCase):
+
+    def test_from_many_initializes_objects_like_init(self):
+        items = [{'id': i, 'title': f'P{i}', 'meta': {'k': 'v'}}
+                 for i in range(3)]
+        posts = FMPost.from_many(items)
+        self.assertEqual(len(posts), 3)
+        for post, item in zip(posts, items):
+            single = FMPost(**item)
+            self.assertEqual(post.tojson(), single.tojson())
+            self.assertTrue(post.is_new)
+            self.assertFalse(post.is_modified)
+            self.assertEqual(post.modified_fields, ())
+
+    def test_from_many_accepts_json_keys_and_fills_blanks(self):
+        notes = FMNote.from_many([{'content': 'a', 'wordCount': 1}, {}])
+        self.assertEqual(notes[0].content, 'a')
+        self.assertEqual(notes[0].word_count, 1)
+        self.assertIsNone(notes[1].content)
+        self.assertIsNone(notes[1].word_count)
+        self.assertIsNot(notes[0], notes[1])
+
+    def test_from_many_accepts_compound_keys(self):
+        posts = FMPost.from_many([{'id': 1, 'meta': {}, 'meta.a': 'b'},
+                                  {'id': 2, 'meta': {}, 'meta.c': 'd'}])
+        self.assertEqual(posts[0].meta, {'a': 'b'})
+        self.assertEqual(posts[1].meta, {'c': 'd'})
+
+    def test_from_many_deduplicates_top_level_objects(self):
+        authors = FMAuthor.from_many([{'id': 1, 'name': 'A'},
+                                      {'id': 2, 'name': 'B'},
+                                      {'id': 1}])
+        self.assertEqual([a.id for a in authors], [1, 2])
+        self.assertEqual(authors[0].name, 'A')
+
+    def test_from_many_applies_later_values_to_duplicates(self):
+        authors = FMAuthor.from_many([{'id': 1, 'name': 'A'},
+                                      {'id': 1, 'name': 'C'}])
+        self.assertEqual(len(authors), 1)
+        self.assertEqual(authors[0].name, 'C')
+        self.assertTrue(authors[0].is_new)
+
+    def test_from_many_shares_nested_objects_with_same_primary_key(self):
+        posts = FMPost.from_many([
+            {'id': 1, 'title': 'A', 'author': {'id': 5, 'name': 'N'}},
+            {'id': 2, 'title': 'B', 'author': {'id': 5}}])
+        self.assertIs(posts[0].author, posts[1].author)
+        self.assertEqual(posts[0].author.name, 'N')
+        self.assertEqual(posts[0].author.posts, [posts[0], posts[1]])
+        self.assertEqual(posts[0]._graph, posts[1]._graph)
+
+    def test_from_many_shares_top_level_and_nested_objects(self):
+        authors = FMAuthor.from_many([
+            {'id': 1, 'name': 'A', 'posts': [{'id': 1, 'title': 'T'}]},
+            {'id': 2, 'name': 'B', 'posts': [{'id': 1}]}])
+        post = authors[1].posts[0]
+        self.assertEqual(post.title, 'T')
+        self.assertIs(post.author, authors[1])
+        self.assertEqual(authors[0].posts, [])
+
+    def test_from_many_lists_nested_objects_which_appear_at_top_level(self):
+        posts = FMPost.from_many([
+            {'id': 1, 'title': 'A',
+             'author': {'id': 9, 'posts': [{'id': 2, 'title': 'B'}]}},
+            {'id': 2, 'title': 'C'}])
+        self.assertEqual([p.id for p in posts], [1, 2])
+        self.assertIn(posts[1], posts[0].author.posts)
+        self.assertEqual(posts[1].title, 'C')
+
+    def test_from_many_objects_are_valid(self):
+        posts = FMPost.from_many([{'id': i, 'title': 'T'}
+                                  for i in range(5)])
+        for post in posts:
+            self.assertTrue(post.is_valid)
+
+    def test_from_many_accepts_iterables(self):
+        posts = FMPost.from_many({'id': i, 'title': 'T'} for i in range(3))
+        self.assertEqual([p.id for p in posts], [0, 1, 2])
+
+    def test_from_many_raises_for_abstract_classes(self):
+        with self.assertRaises(AbstractJSONClassException):
+            FMBase.from_many([{'name': 'a'}])
@@ -2,6 +2,7 @@ from __future__ import annotations
 from unittest import TestCase
 from jsonclasses.excs import ValidationException
 from tests.classes.calc_user import CalcUser
+from tests.classes.simple_book import SimpleBook
 
 
 class TestGetter(TestCase):
@@ -30,3 +31,12 @@ class TestGetter(TestCase):
         self.assertEqual(len(context.exception.keypath_messages), 1)
         self.assertEqual(context.exception.keypath_messages['score'],
                          "value is not negative")
+
+    def test_getter_hook_is_only_installed_on_classes_with_calc_fields(self):
+        self.assertIsNot(CalcUser.__getattribute__, object.__getattribute__)
+        self.assertIs(SimpleBook.__getattribute__, object.__getattribute__)
+
+    def test_getter_hook_raises_attribute_error_for_empty_name(self):
+        user = CalcUser(name='Peter Layber')
+        with self.assertRaises(AttributeError):
+            getattr(user, '')
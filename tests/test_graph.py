@@ -45,3 +45,31 @@ class TestGraph(TestCase):
         post_new._mark_not_new()
         with self.assertRaises(JSONClassGraphMergeConflictException):
             user.posts = [post_new]
+
+    def test_graph_is_a_plain_attribute(self):
+        user = User(id=1, name='Phuê Ê')
+        self.assertNotIn('_graph', User.__dict__)
+        self.assertEqual(list(user.__dict__['_graph']), [user])
+
+    def test_graph_merges_many_objects(self):
+        user = User(id=1, name='Phuê Ê')
+        posts = [Post(id=i, name=f'Post {i}') for i in range(1, 51)]
+        for post in posts:
+            user.posts.append(post)
+        for post in posts:
+            self.assertEqual(post._graph, user._graph)
+            self.assertEqual(user._graph.get(post), post)
+        self.assertEqual(len(list(user._graph)), 51)
+
+    def test_graph_is_not_merged_on_conflict(self):
+        user = User(id=1, name='Phuê Ê')
+        post = Post(id=1, name='Post')
+        user.posts.append(post)
+        other = User(id=2, name='Tsu Iu')
+        other_post = Post(id=1, name='Another Post')
+        other.posts.append(other_post)
+        with self.assertRaises(JSONClassGraphMergeConflictException):
+            user._graph.merged_graph(other._graph)
+        self.assertNotEqual(user._graph, other._graph)
+        self.assertIs(user._graph.get(post), post)
+        self.assertIs(other._graph.get(other_post), other_post)
@@ -0,0 +1,117 @@
+from __future__ import annotations
+from unittest import TestCase, IsolatedAsyncioTestCase
+from asyncio import Event, gather, run
+from gc import collect
+from jsonclasses import IdentityMap, current_identity_map
+from tests.classes.inc_post import IncAuthor, IncPost, inc_store
+from tests.classes.fm_author import FMAuthor, FMPost
+
+
+class TestIdentityMap(TestCase):
+
+    def setUp(self) -> None:
+        inc_store.clear()
+        IncAuthor(id=1, name='A1').save()
+        for i in range(3):
+            IncPost(id=i, title=f'P{i}', author_id=1).save()
+
+    def test_identity_map_is_scoped_by_context_manager(self):
+        self.assertIsNone(current_identity_map())
+        with IdentityMap() as imap:
+            self.assertIs(current_identity_map(), imap)
+            with IdentityMap() as inner:
+                self.assertIs(current_identity_map(), inner)
+            self.assertIs(current_identity_map(), imap)
+        self.assertIsNone(current_identity_map())
+
+    def test_queries_return_same_object_in_session(self):
+        with IdentityMap():
+            a = IncAuthor.id(1).exec()
+            b = IncAuthor.one(name='A1').exec()
+            self.assertIs(a, b)
+        self.assertIsNot(IncAuthor.id(1).exec(), IncAuthor.id(1).exec())
+
+    def test_objects_of_different_queries_link_in_session(self):
+        with IdentityMap():
+            posts = IncPost.find().exec()
+            for post in posts:
+                post.include('author')
+            author = IncAuthor.id(1).exec()
+            self.assertTrue(all(p.author is author for p in posts))
+            self.assertEqual(len(author.posts), 3)
+
+    def test_nested_inputs_resolve_to_session_objects(self):
+        with IdentityMap():
+            author = FMAuthor(id=1, name='John')
+            post = FMPost(id=1, title='P1', author={'id': 1, 'name': 'Jack'})
+            self.assertIs(post.author, author)
+            self.assertEqual(author.name, 'Jack')
+
+    def test_from_many_reuses_session_objects(self):
+        with IdentityMap():
+            author = FMAuthor(id=1, name='John')
+            authors = FMAuthor.from_many([{'id': 2, 'name': 'Jane'},
+                                          {'id': 1, 'name': 'Jack'}])
+            self.assertIs(authors[1], author)
+            self.assertEqual(author.name, 'Jack')
+
+    def test_identity_map_holds_weak_references(self):
+        with IdentityMap() as imap:
+            FMAuthor(id=1, name='John')
+            collect()
+            self.assertIsNone(imap.get(FMAuthor, 1))
+            self.assertEqual(len(imap), 0)
+
+    def test_identity_map_drops_least_recently_used_objects(self):
+        with IdentityMap(size=2) as imap:
+            authors = [FMAuthor(id=i, name=f'A{i}') for i in range(2)]
+            imap.get(FMAuthor, 0)
+            authors.append(FMAuthor(id=2, name='A2'))
+            self.assertEqual(len(imap), 2)
+            self.assertIs(imap.get(FMAuthor, 0), authors[0])
+            self.assertIsNone(imap.get(FMAuthor, 1))
+
+    def test_put_keeps_first_object(self):
+        imap = IdentityMap()
+        a = FMAuthor(id=1, name='A')
+        b = FMAuthor(id=1, name='B')
+        self.assertIs(imap.put(a), a)
+        self.assertIs(imap.put(b), a)
+        imap.discard(a)
+        self.assertIsNone(imap.get(FMAuthor, 1))
+
+    def test_identity_map_is_shared_by_tasks_of_session(self):
+        async def fetch() -> IncAuthor:
+            return await IncAuthor.id(1)
+
+        async def main() -> list[IncAuthor]:
+            with IdentityMap():
+                return await gather(fetch(), fetch())
+        a, b = run(main())
+        self.assertIs(a, b)
+
+
+class TestIdentityMapTasks(IsolatedAsyncioTestCase):
+
+    async def test_identity_map_is_entered_by_interleaved_tasks(self):
+        imap = IdentityMap()
+        first_entered = Event()
+        second_entered = Event()
+        first_exited = Event()
+
+        async def first() -> None:
+            with imap:
+                first_entered.set()
+                await second_entered.wait()
+            self.assertIsNone(current_identity_map())
+            first_exited.set()
+
+        async def second() -> None:
+            await first_entered.wait()
+            with imap:
+                second_entered.set()
+                await first_exited.wait()
+                self.assertIs(current_identity_map(), imap)
+            self.assertIsNone(current_identity_map())
+        await gather(first(), second())
+        self.assertIsNone(current_identity_map())
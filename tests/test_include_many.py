@@ -0,0 +1,102 @@
+from __future__ import annotations
+from unittest import TestCase
+from tests.classes.inc_post import (IncAuthor, IncProfile, IncPost, IncTag,
+                                    inc_store)
+
+
+class TestIncludeMany(TestCase):
+
+    def setUp(self) -> None:
+        inc_store.clear()
+        tags = [IncTag(id=i, name=f'T{i}') for i in range(3)]
+        for tag in tags:
+            tag.save()
+        for i in range(2):
+            author = IncAuthor(id=i, name=f'A{i}')
+            author.favorite_ids = [t.id for t in tags[i:]]
+            author.save()
+            IncProfile(id=i, bio=f'B{i}', author_id=i).save()
+        for i in range(6):
+            post = IncPost(id=i, title=f'P{i}', author_id=i % 2)
+            post.tags = tags[:i % 3]
+            post.save()
+        inc_store.queries.clear()
+
+    def test_include_many_fetches_local_keys_in_one_query(self):
+        posts = IncPost.find().exec()
+        inc_store.queries.clear()
+        IncPost.include_many(posts, 'author')
+        self.assertEqual(inc_store.queries, [('IncAuthor', 'ids')])
+        for post in posts:
+            self.assertEqual(post.author.id, post.id % 2)
+        self.assertIs(posts[0].author, posts[2].author)
+        self.assertEqual([p.id for p in posts[0].author.posts], [0, 2, 4])
+
+    def test_include_many_fetches_local_key_lists_in_one_query(self):
+        authors = IncAuthor.find().exec()
+        inc_store.queries.clear()
+        IncAuthor.include_many(authors, 'favorites')
+        self.assertEqual(inc_store.queries, [('IncTag', 'ids')])
+        self.assertEqual([t.id for t in authors[0].favorites], [0, 1, 2])
+        self.assertEqual([t.id for t in authors[1].favorites], [1, 2])
+        self.assertIs(authors[0].favorites[1], authors[1].favorites[0])
+
+    def test_include_many_fetches_foreign_keys_in_one_query(self):
+        authors = IncAuthor.find().exec()
+        inc_store.queries.clear()
+        IncAuthor.include_many(authors, 'posts')
+        self.assertEqual(inc_store.queries, [('IncPost', 'find')])
+        self.assertEqual([p.id for p in authors[0].posts], [0, 2, 4])
+        self.assertEqual([p.id for p in authors[1].posts], [1, 3, 5])
+        self.assertIs(authors[1].posts[0].author, authors[1])
+
+    def test_include_many_fetches_foreign_key_instances(self):
+        authors = IncAuthor.find().exec()
+        IncAuthor.include_many(authors, 'profile')
+        self.assertEqual([a.profile.bio for a in authors], ['B0', 'B1'])
+        self.assertIs(authors[0].profile.author, authors[0])
+
+    def test_include_many_fetches_join_table_fields_in_one_query(self):
+        posts = IncPost.find().exec()
+        inc_store.queries.clear()
+        IncPost.include_many(posts, 'tags')
+        self.assertEqual(inc_store.queries, [('IncTag', 'find')])
+        self.assertEqual([[t.id for t in p.tags] for p in posts],
+                         [[], [0], [0, 1], [], [0], [0, 1]])
+        self.assertIs(posts[1].tags[0], posts[2].tags[0])
+
+    def test_include_fetches_join_table_fields(self):
+        tag = IncTag.id(1).exec()
+        tag.include('posts')
+        self.assertEqual([p.id for p in tag.posts], [2, 5])
+
+    def test_include_many_fetches_nested_keypaths(self):
+        posts = IncPost.find().exec()
+        inc_store.queries.clear()
+        IncPost.include_many(posts, 'author.profile')
+        self.assertEqual(inc_store.queries,
+                         [('IncAuthor', 'ids'), ('IncProfile', 'find')])
+        self.assertEqual([p.author.profile.bio for p in posts],
+                         ['B0', 'B1'] * 3)
+
+    def test_include_many_keeps_modification_status(self):
+        posts = IncPost.find().exec()
+        posts[0].title = 'New'
+        IncPost.include_many(posts, 'author')
+        self.assertTrue(posts[0].is_modified)
+        self.assertEqual(posts[0].modified_fields, ('title',))
+        self.assertFalse(posts[1].is_modified)
+        self.assertFalse(posts[0].author.is_modified)
+
+    def test_include_many_skips_objects_without_keys(self):
+        post = IncPost(id=10, title='N')
+        inc_store.queries.clear()
+        IncPost.include_many([post], 'author')
+        self.assertEqual(inc_store.queries, [])
+        self.assertIsNone(post.author)
+
+    def test_include_join_table_field_of_object_without_id(self):
+        post = IncPost(title='P')
+        post.include('tags')
+        self.assertEqual(post.tags, [])
+        self.assertEqual(inc_store.queries, [])
@@ -0,0 +1,111 @@
+from __future__ import annotations
+from unittest import TestCase
+from jsonclasses.excs import ValidationException
+from tests.classes.iv_author import IVAuthor, IVPost
+
+
+class TestIncrementalValidation(TestCase):
+
+    def author(self) -> IVAuthor:
+        author = IVAuthor(id=1, name='A', profile={'bio': 'bio'},
+                          posts=[{'id': i, 'title': f'P{i}'}
+                                 for i in range(1, 6)])
+        author._mark_unmodified()
+        for post in author.posts:
+            post._mark_unmodified()
+        author.profile._mark_unmodified()
+        return author
+
+    def test_validated_objects_are_stamped(self):
+        author = self.author()
+        self.assertIsNone(author._vgraph)
+        author.validate()
+        self.assertIsNotNone(author._vgraph)
+        for post in author.posts:
+            self.assertEqual(post._vgraph.root, author._vgraph.root)
+
+    def test_invalid_objects_are_not_stamped(self):
+        author = self.author()
+        author.name = 'a very long name'
+        self.assertFalse(author.is_valid)
+        self.assertIsNone(author._vgraph)
+
+    def test_modified_object_is_revalidated(self):
+        author = self.author()
+        author.validate()
+        author.name = 'a very long name'
+        with self.assertRaises(ValidationException) as context:
+            author.validate()
+        self.assertEqual(list(context.exception.keypath_messages), ['name'])
+
+    def test_modified_linked_object_is_revalidated(self):
+        author = self.author()
+        author.validate()
+        author.posts[2].title = 'a very long title'
+        with self.assertRaises(ValidationException) as context:
+            author.validate()
+        self.assertEqual(list(context.exception.keypath_messages),
+                         ['posts.2.title'])
+
+    def test_modified_holder_is_revalidated_from_linked_object(self):
+        author = self.author()
+        author.validate()
+        author.name = 'a very long name'
+        with self.assertRaises(ValidationException) as context:
+            author.posts[0].validate()
+        self.assertEqual(list(context.exception.keypath_messages),
+                         ['author.name'])
+
+    def test_list_mutation_is_revalidated(self):
+        author = self.author()
+        author.validate()
+        author.posts[1].tags.append('too long')
+        self.assertFalse(author.is_valid)
+        author.posts[1].tags.pop()
+        self.assertTrue(author.is_valid)
+
+    def test_new_linked_object_is_validated(self):
+        author = self.author()
+        author.validate()
+        author.posts.append(IVPost(id=10, title='a very long title'))
+        self.assertFalse(author.is_valid)
+
+    def test_unlinked_object_is_revalidated(self):
+        author = self.author()
+        author.validate()
+        post = author.posts[0]
+        author.posts.remove(post)
+        self.assertIsNone(post.author)
+        self.assertTrue(post.is_valid)
+
+    def test_embedded_object_of_new_holder_is_revalidated(self):
+        author = IVAuthor(id=1, name='A', profile={'bio': 'bio'})
+        author.validate()
+        author.profile.bio = 'a very long bio'
+        self.assertFalse(author.is_valid)
+
+    def test_marking_as_new_requires_revalidation(self):
+        author = self.author()
+        author.validate()
+        setattr(author, '_is_modified', False)
+        author.__original_setattr__('name', 'a very long name')
+        self.assertTrue(author.is_valid)
+        author._mark_new()
+        self.assertFalse(author.is_valid)
+
+    def test_operator_change_requires_revalidation(self):
+        author = self.author()
+        author.validate()
+        author.opby(object())
+        self.assertFalse(author._vgraph.is_clean(author, author._operator))
+        author.validate()
+        self.assertTrue(author._vgraph.is_clean(author, author._operator))
+
+    def test_clean_subgraph_is_skipped(self):
+        author = self.author()
+        author.validate()
+        post = author.posts[3]
+        post.__original_setattr__('title', 'a very long title')
+        self.assertTrue(author.is_valid)
+        post.title = 'another long title'
+        self.assertFalse(author.is_valid)
@@ -0,0 +1,111 @@
+from __future__ import annotations
+from unittest import TestCase
+from io import BytesIO, StringIO
+from json import dumps, JSONDecodeError
+from jsonclasses.excs import ValidationException
+from jsonclasses.ingest import iter_records
+from tests.classes.fm_author import FMPost
+
+
+class TestIngest(TestCase):
+
+    def records(self, n: int) -> list[dict]:
+        return [{'id': i, 'title': f'P{i}'} for i in range(n)]
+
+    def test_ingest_reads_json_arrays(self):
+        stream = StringIO(dumps(self.records(5)))
+        batches = list(FMPost.ingest(stream))
+        self.assertEqual(len(batches), 1)
+        self.assertEqual([p.id for p in batches[0].objects], [0, 1, 2, 3, 4])
+        self.assertEqual(batches[0].errors, [])
+        self.assertIsInstance(batches[0].objects[0], FMPost)
+
+    def test_ingest_reads_newline_delimited_json(self):
+        text = '\n'.join(dumps(r) for r in self.records(5)) + '\n'
+        batches = list(FMPost.ingest(StringIO(text)))
+        self.assertEqual([p.id for p in batches[0].objects], [0, 1, 2, 3, 4])
+
+    def test_ingest_reads_binary_streams(self):
+        records = [{'id': 1, 'title': 'café 咖啡'}]
+        stream = BytesIO(dumps(records, ensure_ascii=False).encode('utf-8'))
+        batches = list(FMPost.ingest(stream, chunk_size=3))
+        self.assertEqual(batches[0].objects[0].title, 'café 咖啡')
+
+    def test_ingest_reads_records_across_chunks(self):
+        records = self.records(50)
+        for chunk_size in (1, 2, 7, 64):
+            stream = StringIO(dumps(records))
+            values = [r for r, _ in iter_records(stream, chunk_size)]
+            self.assertEqual(values, records)
+            text = '\n'.join(dumps(r) for r in records)
+            stream = StringIO(text)
+            values = [r for r, _ in iter_records(stream, chunk_size)]
+            self.assertEqual(values, records)
+
+    def test_ingest_reads_scalar_array_items_across_chunks(self):
+        stream = StringIO(' [ 12345 , 6789,"ab"  ,true]  ')
+        values = [r for r, _ in iter_records(stream, 2)]
+        self.assertEqual(values, [12345, 6789, 'ab', True])
+
+    def test_ingest_yields_configured_batches(self):
+        stream = StringIO(dumps(self.records(25)))
+        batches = list(FMPost.ingest(stream, batch_size=10))
+        self.assertEqual([len(b.objects) for b in batches], [10, 10, 5])
+
+    def test_ingest_reports_invalid_records_without_aborting(self):
+        records = self.records(3)
+        records.insert(1, {'id': 9})
+        records.insert(3, 5)
+        batches = list(FMPost.ingest(StringIO(dumps(records))))
+        self.assertEqual([p.id for p in batches[0].objects], [0, 1, 2])
+        errors = batches[0].errors
+        self.assertEqual([e.index for e in errors], [1, 3])
+        self.assertIsInstance(errors[0].exception, ValidationException)
+        self.assertEqual(errors[0].record, {'id': 9})
+        self.assertIsInstance(errors[1].exception, TypeError)
+
+    def test_ingest_reports_malformed_lines_without_aborting(self):
+        text = '{"id": 1, "title": "A"}\n{"id": 2,\n{"id": 3, "title": "C"}'
+        batches = list(FMPost.ingest(StringIO(text)))
+        self.assertEqual([p.id for p in batches[0].objects], [1, 3])
+        self.assertEqual(batches[0].errors[0].record, '{"id": 2,')
+        self.assertIsInstance(batches[0].errors[0].exception,
+                              JSONDecodeError)
+
+    def test_ingest_raises_on_malformed_arrays(self):
+        for text in ('[{"id": 1}', '[{"id": 1} {"id": 2}]', '[1,]'):
+            with self.assertRaises(JSONDecodeError):
+                list(iter_records(StringIO(text)))
+
+    def test_ingest_raises_on_concatenated_arrays(self):
+        records = iter_records(StringIO('[1]\n[2]'))
+        self.assertEqual(next(records), (1, None))
+        with self.assertRaises(JSONDecodeError) as context:
+            next(records)
+        self.assertEqual(context.exception.msg, 'Extra data')
+
+    def test_ingest_raises_on_trailing_data_of_arrays(self):
+        for chunk_size in (1, 4, 64):
+            with self.assertRaises(JSONDecodeError) as context:
+                list(iter_records(StringIO('[] \n  x'), chunk_size))
+            self.assertEqual(context.exception.msg, 'Extra data')
+        records = list(iter_records(StringIO('[1] \n '), chunk_size=1))
+        self.assertEqual(records, [(1, None)])
+
+    def test_ingest_raises_on_malformed_array_items_without_reading_on(self):
+        records = ',\n'.join(dumps(r) for r in self.records(2000))
+        stream = StringIO('[{"name": "a"}, {bad}, ' + records + ']')
+        with self.assertRaises(JSONDecodeError) as context:
+            list(iter_records(stream, chunk_size=64))
+        self.assertTrue(context.exception.msg.startswith('Expecting property'))
+        self.assertLess(stream.tell(), 1024)
+
+    def test_ingest_reads_numbers_cut_across_chunks(self):
+        text = '[1.25, -3e10, {"a": 0.5}]'
+        for chunk_size in range(1, len(text)):
+            values = [r for r, _ in iter_records(StringIO(text), chunk_size)]
+            self.assertEqual(values, [1.25, -3e10, {'a': 0.5}])
+
+    def test_ingest_reads_empty_dumps(self):
+        self.assertEqual(list(FMPost.ingest(StringIO(''))), [])
+        self.assertEqual(list(FMPost.ingest(StringIO(' [ ] '))), [])
@@ -0,0 +1,90 @@
+from __future__ import annotations
+from unittest import TestCase
+from io import BytesIO, StringIO
+from json import dumps
+from jsonclasses import JSONWriter
+from jsonclasses.excs import UnauthorizedActionException
+from tests.classes.fm_author import FMAuthor, FMPost, FMAccount
+from tests.classes.gs_product import GSProduct, GSProductUser
+
+
+class TestJSONWriter(TestCase):
+
+    def author(self) -> FMAuthor:
+        return FMAuthor(id=1, name='A', posts=[
+            {'id': 1, 'title': 'T', 'meta': {'k': 'v'}},
+            {'id': 2, 'title': 'U'}])
+
+    def write(self, value, **kwargs) -> str:
+        stream = StringIO()
+        JSONWriter(stream, **kwargs).write(value)
+        return stream.getvalue()
+
+    def test_writer_writes_like_tojson(self):
+        author = self.author()
+        self.assertEqual(self.write(author), dumps(author.tojson()))
+        post = author.posts[0]
+        self.assertEqual(self.write(post), dumps(post.tojson()))
+
+    def test_writer_accepts_tojson_options(self):
+        author = self.author()
+        options = [{'reverse_relationship': True},
+                   {'output_null': True},
+                   {'ignore_writeonly': True}]
+        for kwargs in options:
+            self.assertEqual(self.write(author, **kwargs),
+                             dumps(author.tojson(**kwargs)))
+
+    def test_writer_writes_lists_and_iterators(self):
+        author = self.author()
+        expected = dumps([p.tojson() for p in author.posts])
+        self.assertEqual(self.write(author.posts), expected)
+        self.assertEqual(self.write(tuple(author.posts)), expected)
+        self.assertEqual(self.write(p for p in author.posts), expected)
+
+    def test_writer_writes_plain_values(self):
+        author = self.author()
+        value = {'count': 1, 'items': [author]}
+        self.assertEqual(self.write(value),
+                         dumps({'count': 1, 'items': [author.tojson()]}))
+
+    def test_writer_skips_writeonly_and_temp_fields(self):
+        account = FMAccount(name='a', password='p', code='c')
+        self.assertEqual(self.write(account), '{"name": "a"}')
+        self.assertEqual(self.write(account, ignore_writeonly=True),
+                         '{"name": "a", "password": "p"}')
+
+    def test_writer_respects_partial_picks(self):
+        post = FMPost(id=1, title='T', meta={'k': 'v'})
+        post._is_partial = True
+        post._partial_picks = ['title']
+        self.assertEqual(self.write(post), '{"title": "T"}')
+
+    def test_writer_writes_to_binary_streams(self):
+        author = self.author()
+        stream = BytesIO()
+        JSONWriter(stream).write([author])
+        self.assertEqual(stream.getvalue().decode('utf-8'),
+                         dumps([author.tojson()]))
+
+    def test_writer_writes_in_chunks(self):
+        class Stream(StringIO):
+            def __init__(self):
+                super().__init__()
+                self.chunks = 0
+
+            def write(self, s):
+                self.chunks += 1
+                return super().write(s)
+        posts = [FMPost(id=i, title='T') for i in range(100)]
+        stream = Stream()
+        JSONWriter(stream, chunk_size=256).write(posts)
+        self.assertEqual(stream.getvalue(),
+                         dumps([p.tojson() for p in posts]))
+        self.assertGreater(stream.chunks, 1)
+
+    def test_writer_checks_read_permission(self):
+        free_user = GSProductUser(id='F', name='A', paid_user=False)
+        product = GSProduct(name='P', user=free_user).opby(free_user)
+        with self.assertRaises(UnauthorizedActionException):
+            self.write([product])
@@ -0,0 +1,57 @@
+from __future__ import annotations
+from unittest import TestCase
+from jsonclasses.keypath import (
+    camelize_key, identical_key, memoized_key_strategy, KeyPath, EMPTY_KEYPATH,
+    KEY_STRATEGY_MEMO_SIZE, _memoized_key_strategy
+)
+
+
+class TestKeypath(TestCase):
+
+    def test_builtin_key_strategies_are_memoized(self):
+        self.assertEqual(camelize_key('created_at'), 'createdAt')
+        hits = camelize_key.cache_info().hits
+        self.assertEqual(camelize_key('created_at'), 'createdAt')
+        self.assertEqual(camelize_key.cache_info().hits, hits + 1)
+
+    def test_memoized_key_strategy_keeps_memoized_strategies(self):
+        self.assertIs(memoized_key_strategy(camelize_key), camelize_key)
+        self.assertIs(memoized_key_strategy(identical_key), identical_key)
+
+    def test_memoized_key_strategy_wraps_custom_strategies_once(self):
+        calls = []
+
+        def upper_key(key: str) -> str:
+            calls.append(key)
+            return key.upper()
+        memoized = memoized_key_strategy(upper_key)
+        self.assertIs(memoized_key_strategy(upper_key), memoized)
+        self.assertEqual(memoized('name'), 'NAME')
+        self.assertEqual(memoized('name'), 'NAME')
+        self.assertEqual(calls, ['name'])
+
+    def test_memoized_key_strategy_bounds_memoized_strategies(self):
+        for _ in range(KEY_STRATEGY_MEMO_SIZE + 10):
+            memoized_key_strategy(lambda key: key)
+        self.assertEqual(_memoized_key_strategy.cache_info().currsize,
+                         KEY_STRATEGY_MEMO_SIZE)
+
+    def test_keypath_materializes_keys_on_demand(self):
+        kp = EMPTY_KEYPATH.append('posts').append(0).append('title')
+        self.assertEqual(len(kp), 3)
+        self.assertEqual(kp.key, 'title')
+        self.assertEqual(kp.keys, ['posts', 0, 'title'])
+        self.assertIs(kp.keys, kp.keys)
+        self.assertEqual(kp.string, 'posts.0.title')
+        self.assertEqual(EMPTY_KEYPATH.keys, [])
+        self.assertEqual(EMPTY_KEYPATH.string, '')
+
+    def test_keypath_shares_parents(self):
+        parent = KeyPath.of('author', 'articles')
+        self.assertEqual(parent.keys, ['author', 'articles'])
+        left = parent.append(0)
+        right = parent.append(1)
+        self.assertIs(left.parent, right.parent)
+        self.assertEqual(left.keys, ['author', 'articles', 0])
+        self.assertEqual(right.keys, ['author', 'articles', 1])
+        self.assertEqual(parent.keys, ['author', 'articles'])
@@ -121,3 +121,11 @@ class TestLocalKey(TestCase):
         article.set(**{'name': 'A', 'authorId': 1005})
         self.assertEqual(article.author, None)
         self.assertEqual(article.author_id, 1005)
+
+    def test_local_key_names_are_precomputed_on_field(self):
+        field = LKArticle.cdef.field_named('author')
+        self.assertEqual(field.ref_key, 'author_id')
+        self.assertEqual(field.json_ref_key, 'authorId')
+        field = LKArticle.cdef.field_named('name')
+        self.assertEqual(field.json_name, 'name')
+        self.assertEqual(field.ref_key, None)
@@ -0,0 +1,42 @@
+from __future__ import annotations
+from unittest import TestCase
+from jsonclasses.mgraph import MGraph
+from tests.classes.blog import User, Post
+
+
+class TestMGraph(TestCase):
+
+    def test_mgraph_marks_objects_by_primary_key(self):
+        graph = MGraph()
+        user = User(id=1, name='A')
+        graph.put(user)
+        self.assertTrue(graph.has(user))
+        self.assertIs(graph.get(User(id=1, name='B')), user)
+        self.assertIs(graph.getp(User, 1), user)
+        self.assertIsNone(graph.getp(User, 2))
+        self.assertIsNone(graph.getp(Post, 1))
+
+    def test_mgraph_marks_objects_without_primary_key_by_identity(self):
+        graph = MGraph()
+        user = User(name='A')
+        other = User(name='A')
+        graph.put(user)
+        self.assertTrue(graph.has(user))
+        self.assertFalse(graph.has(other))
+        self.assertIs(graph.getm(User, id(user)), user)
+
+    def test_mgraph_accepts_unhashable_primary_keys(self):
+        graph = MGraph()
+        user = User(name='A')
+        graph.putp([1], user)
+        self.assertIs(graph.getp(User, [1]), user)
+        self.assertIsNone(graph.getp(User, '[1]'))
+
+    def test_mgraph_iterates_each_object_once(self):
+        graph = MGraph()
+        user = User(id=1, name='A')
+        post = Post(name='P')
+        graph.put(user)
+        graph.putp(2, user)
+        graph.put(post)
+        self.assertEqual([id(o) for o in graph], [id(user), id(post)])
@@ -0,0 +1,38 @@
+from __future__ import annotations
+from unittest import TestCase
+from jsonclasses.ctx import CtxCfg
+from tests.classes.simple_account import SimpleAccount
+from tests.classes.linked_user import LinkedUser
+from tests.classes.linked_profile import LinkedProfile
+
+
+class TestOPlan(TestCase):
+
+    def test_oplan_is_cached_per_ctxcfg(self):
+        cdef = SimpleAccount.cdef
+        cfg = CtxCfg(ignore_writeonly=False)
+        self.assertIs(cdef.oplan(cfg), cdef.oplan(CtxCfg(ignore_writeonly=False)))
+        self.assertIsNot(cdef.oplan(cfg),
+                         cdef.oplan(CtxCfg(ignore_writeonly=True)))
+
+    def test_oplan_precomputes_json_names_and_read_rules(self):
+        oplan = SimpleAccount.cdef.oplan(CtxCfg(ignore_writeonly=False))
+        self.assertEqual([f.json_name for f in oplan.fields],
+                         ['username', 'password'])
+        self.assertEqual([f.output for f in oplan.fields], [True, False])
+        oplan = SimpleAccount.cdef.oplan(CtxCfg(ignore_writeonly=True))
+        self.assertEqual([f.output for f in oplan.fields], [True, True])
+
+    def test_oplan_marks_passthrough_fields(self):
+        oplan = LinkedProfile.cdef.oplan(CtxCfg())
+        self.assertEqual([f.passthrough for f in oplan.fields], [True, False])
+
+    def test_oplan_precomputes_reference_keys(self):
+        oplan = LinkedProfile.cdef.oplan(CtxCfg())
+        self.assertEqual(oplan.fields[1].ref_key, 'user_id')
+        self.assertEqual(oplan.fields[1].json_ref_key, 'userId')
+
+    def test_oplan_resolves_output_null_from_class_config(self):
+        self.assertFalse(LinkedUser.cdef.oplan(CtxCfg()).output_null)
+        self.assertTrue(
+            LinkedUser.cdef.oplan(CtxCfg(output_null=True)).output_null)
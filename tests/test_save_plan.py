@@ -0,0 +1,91 @@
+from __future__ import annotations
+from unittest import TestCase
+from tests.classes.dw_author import DWAuthor, dw_writes
+from tests.classes.inc_post import (IncAuthor, IncProfile, IncPost, IncTag,
+                                    inc_store)
+from jsonclasses.excs import ValidationException
+
+
+class TestSavePlan(TestCase):
+
+    def setUp(self) -> None:
+        inc_store.clear()
+
+    def test_save_writes_new_graph_in_one_batch(self):
+        author = IncAuthor(id=1, name='A1', posts=[
+            {'id': 1, 'title': 'P1'}, {'id': 2, 'title': 'P2'}])
+        author.posts[1].save()
+        self.assertEqual(len(inc_store.batches), 1)
+        batch = inc_store.batches[0]
+        self.assertEqual(len(batch), 3)
+        self.assertIs(batch[0], author)
+        self.assertEqual(inc_store.table(IncPost)[1]['author_id'], 1)
+        self.assertEqual(inc_store.table(IncPost)[2]['author_id'], 1)
+        self.assertFalse(author.is_new)
+
+    def test_save_orders_objects_after_objects_they_hold_keys_of(self):
+        post = IncPost(id=1, title='P1', author={
+            'id': 1, 'name': 'A1', 'profile': {'id': 1, 'bio': 'B1'}})
+        profile = post.author.profile
+        profile.save()
+        batch = inc_store.batches[0]
+        self.assertEqual(len(batch), 3)
+        self.assertLess(batch.index(post.author), batch.index(post))
+        self.assertLess(batch.index(post.author), batch.index(profile))
+        self.assertEqual(inc_store.table(IncProfile)[1]['author_id'], 1)
+
+    def test_save_skips_unmodified_objects(self):
+        author = IncAuthor(id=1, name='A1', posts=[{'id': 1, 'title': 'P1'}])
+        author.save()
+        inc_store.batches.clear()
+        author.name = 'A2'
+        author.save()
+        self.assertEqual(inc_store.batches, [[author]])
+
+    def test_save_writes_every_unlinked_object(self):
+        author = IncAuthor(id=1, name='A1', posts=[
+            {'id': i, 'title': f'P{i}'} for i in range(10)])
+        author.save()
+        posts = author.posts
+        author.posts = []
+        inc_store.batches.clear()
+        author.save()
+        self.assertEqual(len(inc_store.batches), 1)
+        self.assertEqual(len(inc_store.batches[0]), 11)
+        for post in posts:
+            self.assertIsNone(inc_store.table(IncPost)[post.id]['author_id'])
+            self.assertFalse(post.is_modified)
+        self.assertEqual(author.unlinked_objects, {'posts': []})
+
+    def test_save_validates_unlinked_objects_before_writing(self):
+        author = IncAuthor(id=1, name='A1', posts=[{'id': 1, 'title': 'P1'}])
+        author.save()
+        post = author.posts[0]
+        author.posts = []
+        post.title = None
+        author.name = 'A2'
+        inc_store.batches.clear()
+        with self.assertRaises(ValidationException):
+            author.save()
+        self.assertEqual(inc_store.batches, [])
+        self.assertEqual(inc_store.table(IncAuthor)[1]['name'], 'A1')
+
+    def test_save_writes_join_table_links(self):
+        post = IncPost(id=1, title='P1', tags=[
+            {'id': 1, 'name': 'T1'}, {'id': 2, 'name': 'T2'}])
+        post.save()
+        self.assertEqual(len(inc_store.batches), 1)
+        tag = IncTag.id(2).exec().include('posts')
+        self.assertEqual([p.id for p in tag.posts], [1])
+
+    def test_save_writes_roots_without_batch_override(self):
+        dw_writes.clear()
+        author = DWAuthor(id=1, name='A1', posts=[
+            {'id': i, 'title': f'P{i}'} for i in range(3)])
+        author.save()
+        self.assertEqual(dw_writes, [author])
+        posts = author.posts
+        author.posts = []
+        dw_writes.clear()
+        author.save()
+        self.assertEqual(dw_writes, [author, *posts])
@@ -0,0 +1,70 @@
+from __future__ import annotations
+from unittest import TestCase
+from weakref import ref
+from tests.classes.slot_post import SlotAuthor, SlotPost, SlotScore
+
+
+class TestSlots(TestCase):
+
+    def test_slotted_object_has_no_dict(self):
+        post = SlotPost(id='p', title='Title')
+        self.assertFalse(hasattr(post, '__dict__'))
+        self.assertIn('author_id', SlotPost.__slots__)
+
+    def test_slotted_object_can_be_weakly_referenced(self):
+        post = SlotPost(id='p', title='Title')
+        self.assertIs(ref(post)(), post)
+
+    def test_slotted_object_is_initialized_and_output(self):
+        post = SlotPost(id='p', title='  Title  ')
+        self.assertEqual(post.tojson(), {'id': 'p', 'title': 'Title',
+                                         'views': 0, 'tags': []})
+        self.assertEqual(post._data_dict, {'id': 'p', 'title': 'Title',
+                                           'views': 0, 'tags': [],
+                                           'author': None})
+
+    def test_slotted_object_allocates_containers_on_first_use(self):
+        post = SlotPost(id='p', title='Title')
+        self.assertRaises(AttributeError,
+                          SlotPost._modified_fields.member.__get__, post)
+        self.assertEqual(post.modified_fields, ())
+        self.assertEqual(list(post._graph), [post])
+
+    def test_slotted_objects_are_linked(self):
+        author = SlotAuthor(id='a', name='A')
+        post = SlotPost(id='p', title='Title', author=author)
+        self.assertEqual(post.author_id, 'a')
+        self.assertEqual(author.posts, [post])
+        self.assertEqual(post._graph, author._graph)
+        post.author = None
+        self.assertEqual(author.posts, [])
+        self.assertEqual(post.unlinked_objects, {'author': [author]})
+
+    def test_slotted_object_tracks_modified_fields(self):
+        post = SlotPost(id='p', title='Title')
+        post._mark_unmodified()
+        post.title = 'New'
+        post.tags.append('a')
+        self.assertTrue(post.is_modified)
+        self.assertEqual(set(post.modified_fields), {'title', 'tags'})
+        post._mark_unmodified()
+        self.assertFalse(post.is_modified)
+        self.assertEqual(post.modified_fields, ())
+
+    def test_slotted_object_can_be_reset(self):
+        score = SlotScore(name='n', score=1)
+        score._mark_unmodified()
+        score.score = 5
+        self.assertEqual(score.previous_values, {'score': 1})
+        score.reset()
+        self.assertEqual(score.score, 1)
+        self.assertFalse(score.is_modified)
+
+    def test_slotted_object_calculates_fields(self):
+        score = SlotScore(name='n', score=1)
+        self.assertEqual(score.label, 'n: 1')
+
+    def test_slotted_object_rejects_unknown_attributes(self):
+        score = SlotScore(name='n', score=1)
+        with self.assertRaises(AttributeError):
+            score.unknown = 1
@@ -0,0 +1,65 @@
+from __future__ import annotations
+from unittest import TestCase
+from types import GeneratorType
+from jsonclasses.excs import UnauthorizedActionException
+from tests.classes.fm_author import FMAuthor, FMPost, FMNote
+from tests.classes.gs_product import GSProduct, GSProductUser
+
+
+class TestToJSONMany(TestCase):
+
+    def posts(self) -> list[FMPost]:
+        author = FMAuthor(id=1, name='A')
+        return [FMPost(id=i, title=f'P{i}', meta={'k': 'v'}, author=author)
+                for i in range(3)]
+
+    def test_tojson_many_outputs_like_tojson(self):
+        posts = self.posts()
+        self.assertEqual(FMPost.tojson_many(posts),
+                         [p.tojson() for p in posts])
+
+    def test_tojson_many_accepts_tojson_options(self):
+        posts = self.posts()
+        options = [{'reverse_relationship': True},
+                   {'output_null': True},
+                   {'ignore_writeonly': True}]
+        for kwargs in options:
+            self.assertEqual(FMPost.tojson_many(posts, **kwargs),
+                             [p.tojson(**kwargs) for p in posts])
+
+    def test_tojson_many_outputs_nested_objects_for_each_item(self):
+        author = FMAuthor(id=1, name='A', posts=[{'id': 1, 'title': 'T'}])
+        outputs = FMAuthor.tojson_many([author, author])
+        self.assertEqual(outputs[0], author.tojson())
+        self.assertEqual(outputs[1], author.tojson())
+
+    def test_tojson_many_accepts_objects_of_other_classes(self):
+        note = FMNote(content='c')
+        post = FMPost(id=1, title='T')
+        self.assertEqual(FMPost.tojson_many([note, post]),
+                         [note.tojson(), post.tojson()])
+
+    def test_tojson_many_checks_read_permission(self):
+        paid_user = GSProductUser(id='P', name='A', paid_user=True)
+        free_user = GSProductUser(id='F', name='A', paid_user=False)
+        p1 = GSProduct(name='P', user=paid_user).opby(paid_user)
+        p2 = GSProduct(name='Q', user=free_user).opby(free_user)
+        self.assertEqual(len(GSProduct.tojson_many([p1])), 1)
+        with self.assertRaises(UnauthorizedActionException):
+            GSProduct.tojson_many([p1, p2])
+
+    def test_tojson_many_streams_outputs(self):
+        posts = self.posts()
+        outputs = FMPost.tojson_many(posts, stream=True)
+        self.assertIsInstance(outputs, GeneratorType)
+        self.assertEqual(list(outputs), [p.tojson() for p in posts])
+
+    def test_tojson_many_checks_read_permission_lazily_on_streaming(self):
+        paid_user = GSProductUser(id='P', name='A', paid_user=True)
+        free_user = GSProductUser(id='F', name='A', paid_user=False)
+        p1 = GSProduct(name='P', user=paid_user).opby(paid_user)
+        p2 = GSProduct(name='Q', user=free_user).opby(free_user)
+        outputs = GSProduct.tojson_many([p1, p2], stream=True)
+        self.assertEqual(next(outputs), p1.tojson())
+        with self.assertRaises(UnauthorizedActionException):
+            next(outputs)